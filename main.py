@@ -1,260 +1,834 @@
-"""
-TejasThrust (TT) - Single Player Dog Fight Game
-A professional web-based fighter plane game for kids aged 5-12
-"""
-
-import pygame
-import sys
-import random
-import math
-from typing import List, Tuple
-from src.plane import PlayerPlane, EnemyPlane, BossPlane
-from src.laser import Laser
-from src.cloud import Cloud
-from src.ui import UI
-from src.config import *
-
-class TejasThrust:
-    """Main game class for TejasThrust dog fight game"""
-    
-    def __init__(self):
-        pygame.init()
-        pygame.mixer.init()
-        
-        # Screen setup
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("AMCA - Fighter Plane Game")
-        
-        # Game clock
-        self.clock = pygame.time.Clock()
-
-        # Background music
-        pygame.mixer.music.load('assets/sounds/TT.wav')  # Replace with your music file
-        pygame.mixer.music.play(-1)  # Play the music in a loop
-        
-        # Game state
-        self.running = True
-        self.paused = False
-        self.game_over = False
-        
-        # Score and health
-        self.score = 0
-        self.player_health = PLAYER_MAX_HEALTH
-        self.enemies_killed = 0  # Track how many enemies have been destroyed
-        self.boss_active = False  # Flag to track if boss is currently active
-        
-        # Game objects
-        self.player = PlayerPlane(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100)
-        self.enemies: List[EnemyPlane] = []
-        self.boss: BossPlane = None  # Boss plane reference
-        self.player_lasers: List[Laser] = []
-        self.enemy_lasers: List[Laser] = []
-        self.clouds: List[Cloud] = []
-        
-        # UI
-        self.ui = UI(self.screen)
-        
-        # Initialize clouds
-        self._init_clouds()
-        
-        # Last enemy spawn time
-        self.last_enemy_spawn = 0
-        
-        # Load fonts
-        pygame.font.init()
-        self.font = pygame.font.Font(None, 36)
-        
-    def _init_clouds(self):
-        """Initialize background clouds"""
-        for _ in range(8):
-            x = random.randint(0, SCREEN_WIDTH)
-            y = random.randint(0, SCREEN_HEIGHT // 2)
-            size = random.randint(50, 150)
-            speed = random.uniform(0.2, 0.8)
-            self.clouds.append(Cloud(x, y, size, speed))
-    
-    def spawn_enemy(self):
-        """Spawn a new enemy plane"""
-        current_time = pygame.time.get_ticks()
-        
-        # Check if it's time to spawn a boss
-        if self.enemies_killed > 0 and self.enemies_killed % BOSS_SPAWN_COUNT == 0 and not self.boss_active:
-            # Spawn a boss plane at the top center
-            self.boss = BossPlane(SCREEN_WIDTH // 2, 100)
-            self.boss_active = True
-            return
-            
-        # Only spawn regular enemies if no boss is active and it's time
-        if current_time - self.last_enemy_spawn > ENEMY_SPAWN_INTERVAL and not self.boss_active:
-            x = random.randint(50, SCREEN_WIDTH - 50)
-            y = random.randint(-100, -50)
-            enemy = EnemyPlane(x, y)
-            self.enemies.append(enemy)
-            self.last_enemy_spawn = current_time
-    
-    def handle_events(self):
-        """Handle all game events"""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-            
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE:
-                    # Player shoots
-                    laser = self.player.shoot()
-                    if laser:
-                        self.player_lasers.append(laser)
-            
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                # Check button clicks
-                mouse_pos = pygame.mouse.get_pos()
-                
-                # Exit button (bottom left)
-                exit_rect = pygame.Rect(20, SCREEN_HEIGHT - 60, 80, 40)
-                if exit_rect.collidepoint(mouse_pos):
-                    self.running = False
-                
-                # Pause/Resume button (bottom right)
-                pause_rect = pygame.Rect(SCREEN_WIDTH - 100, SCREEN_HEIGHT - 60, 80, 40)
-                if pause_rect.collidepoint(mouse_pos):
-                    self.paused = not self.paused
-    
-    def update(self):
-        """Update game logic"""
-        if self.paused or self.game_over:
-            return
-        
-        # Handle player input
-        keys = pygame.key.get_pressed()
-        self.player.update(keys)
-        
-        # Spawn enemies
-        self.spawn_enemy()
-        
-        # Update enemies
-        for enemy in self.enemies[:]:
-            enemy.update()
-            
-            # Remove enemies that are off screen
-            if enemy.y > SCREEN_HEIGHT + 50:
-                self.enemies.remove(enemy)
-            
-            # Enemy shooting
-            if random.random() < ENEMY_SHOOT_CHANCE:
-                laser = enemy.shoot()
-                if laser:
-                    self.enemy_lasers.append(laser)
-        
-        # Update boss if active
-        if self.boss_active and self.boss:
-            self.boss.update()
-            
-            # Boss shooting (more frequent)
-            if random.random() < BOSS_SHOOT_CHANCE:
-                laser = self.boss.shoot()
-                if laser:
-                    self.enemy_lasers.append(laser)
-        
-        # Update lasers
-        for laser in self.player_lasers[:]:
-            laser.update()
-            if laser.y < -10:
-                self.player_lasers.remove(laser)
-        
-        for laser in self.enemy_lasers[:]:
-            laser.update()
-            if laser.y > SCREEN_HEIGHT + 10:
-                self.enemy_lasers.remove(laser)
-        
-        # Update clouds
-        for cloud in self.clouds:
-            cloud.update()
-        
-        # Check collisions
-        self._check_collisions()
-        
-        # Check game over
-        if self.player_health <= 0:
-            self.game_over = True
-    
-    def _check_collisions(self):
-        """Check all collision detection"""
-        # Player lasers hit enemies
-        for laser in self.player_lasers[:]:
-            # Check collision with regular enemies
-            for enemy in self.enemies[:]:
-                if laser.get_rect().colliderect(enemy.get_rect()):
-                    if laser in self.player_lasers:  # Avoid processing removed lasers
-                        self.player_lasers.remove(laser)
-                    enemy.take_damage()
-                    
-                    if enemy.health <= 0:
-                        self.enemies.remove(enemy)
-                        self.score += 1
-                        self.enemies_killed += 1
-                    break
-            
-            # Check collision with boss (if active)
-            if self.boss_active and self.boss and laser in self.player_lasers:
-                if laser.get_rect().colliderect(self.boss.get_rect()):
-                    self.player_lasers.remove(laser)
-                    self.boss.take_damage()
-                    
-                    if self.boss.health <= 0:
-                        self.boss = None
-                        self.boss_active = False
-                        self.score += 5  # Bonus points for defeating boss
-                        self.enemies_killed += 1  # Count boss as an enemy for spawning logic
-        
-        # Enemy lasers hit player
-        for laser in self.enemy_lasers[:]:
-            if laser.get_rect().colliderect(self.player.get_rect()):
-                self.enemy_lasers.remove(laser)
-                self.player_health -= laser.damage  # Use the laser's damage value
-    
-    def draw(self):
-        """Draw all game objects"""
-        # Sky background
-        self.screen.fill(SKY_COLOR)
-        
-        # Draw clouds
-        for cloud in self.clouds:
-            cloud.draw(self.screen)
-        
-        # Draw player
-        self.player.draw(self.screen)
-        
-        # Draw enemies
-        for enemy in self.enemies:
-            enemy.draw(self.screen)
-        
-        # Draw boss if active
-        if self.boss_active and self.boss:
-            self.boss.draw(self.screen)
-        
-        # Draw lasers
-        for laser in self.player_lasers:
-            laser.draw(self.screen)
-        
-        for laser in self.enemy_lasers:
-            laser.draw(self.screen)
-        
-        # Draw UI
-        self.ui.draw(self.score, self.player_health, self.paused, self.game_over)
-        
-        pygame.display.flip()
-    
-    def run(self):
-        """Main game loop"""
-        while self.running:
-            self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(FPS)
-        
-        pygame.quit()
-        sys.exit()
-
-if __name__ == "__main__":
-    game = TejasThrust()
-    game.run()
+"""
+TejasThrust (TT) - Single Player Dog Fight Game
+A professional web-based fighter plane game for kids aged 5-12
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import pygame
+import sqlite3
+import subprocess
+import sys
+import time
+import random
+import math
+import numpy as np
+from typing import List, Tuple
+from src.plane import Plane, PlayerPlane, EnemyPlane, BossPlane
+from src.laser import Laser
+from src.projectile import steer_lasers
+from src.collision import swept_candidates
+from src.cloud import Cloud
+from src.particles import ParticleAtlas, ParticleSystem
+from src.telemetry import Telemetry, NullTelemetry
+from src.scores import ScoreStore
+from src.ui import UI
+from src.director import Director
+from src.startup import HEADLESS_MODES, init_pygame
+from src.settings import DEFAULT_SETTINGS, SettingsWatcher, load_settings
+from src.viewport import Viewport
+from src.pipeline import RenderPipeline, Snapshot
+from src.renderqueue import RenderQueue
+from src.determinism import RandomStreams, snap_world
+from src.powerups import Pickup, PickupPool, choose_powerup
+from src.effects import Effects
+from src.accessibility import PALETTE, STANDARD, next_preset, preset
+from src.assets import AssetBundle
+from src.config import *
+
+class TejasThrust:
+    """Main game class for TejasThrust dog fight game"""
+    
+    def __init__(self, headless=False, settings=DEFAULT_SETTINGS, window_size=None, fullscreen=False,
+                 mode=None, threaded_render=THREADED_RENDER, deterministic=False, accessibility=STANDARD):
+        # The mode decides which pygame subsystems start (see src/startup.py).
+        # Headless games (simulation, training) have no window or audio and
+        # run on a simulated clock that advances one frame per update
+        self.mode = mode or ("headless" if headless else "play")
+        self.headless = self.mode in HEADLESS_MODES
+        self.window = None
+        self.viewport = None
+        self._canvas = None
+        # Draw on a render thread while the next frame is simulated (see
+        # src/pipeline.py); the thread runs while run() does. The browser
+        # build has only the one thread
+        self.threaded_render = threaded_render and not self.headless and self.mode != "web"
+        self.pipeline = None
+        self.capture = None  # records frames while run() plays, when given
+        # Deterministic games play out the same on every machine (see
+        # src/determinism.py); seed them with reset(seed)
+        self.deterministic = deterministic
+        self.streams = None  # per-subsystem random streams, set by seed()
+        # Palette, HUD size and game speed (see src/accessibility.py)
+        self.accessibility = accessibility
+        _use_palette(accessibility.palette)
+        self.sky_color = PALETTE[SKY_COLOR]
+        subsystems = init_pygame(self.mode)
+        
+        if self.headless:
+            self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        else:
+            # Screen setup: the game always draws at SCREEN_WIDTH x SCREEN_HEIGHT
+            # and the viewport scales that to any other window size
+            if fullscreen:
+                self.window = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+            else:
+                self.window = pygame.display.set_mode(window_size or (SCREEN_WIDTH, SCREEN_HEIGHT),
+                                                      pygame.RESIZABLE)
+            pygame.display.set_caption("AMCA - Fighter Plane Game")
+            # Plain scaling in the browser, where every millisecond shows
+            smooth = VIEWPORT_SMOOTH and self.mode != "web"
+            self.viewport = Viewport(self.window.get_size(), smooth=smooth)
+            self.screen = self._render_target()
+        
+        # Game clock
+        self.clock = pygame.time.Clock()
+
+        # Packed assets, when a bundle has been built (see --build-assets)
+        self.assets = AssetBundle() if os.path.exists(ASSET_BUNDLE_PATH) else None
+        
+        # Background music, when this mode has audio. The browser build
+        # loads music and system fonts after its first frame (see src/web.py)
+        self.has_audio = "mixer" in subsystems and bool(pygame.mixer.get_init())
+        self.system_fonts = self.mode != "web"
+        if self.mode != "web":
+            self.start_music()
+        
+        # Game state
+        self.running = True
+        
+        # Game objects
+        self.clouds: List[Cloud] = []
+        self.particles = ParticleSystem(WEB_PARTICLE_CAPACITY if self.mode == "web" else PARTICLE_CAPACITY)
+        self.pickups = PickupPool()  # power-ups dropped by destroyed planes
+        self.effects = Effects()  # hit flashes, damage numbers and screen shake
+        
+        # UI
+        self.ui = UI(self.screen, accessibility.hud_scale, self.system_fonts)
+        self.render_queue = RenderQueue()  # only one thread renders at a time
+        
+        # Gameplay analytics
+        self.telemetry = Telemetry() if TELEMETRY_ENABLED else NullTelemetry()
+        
+        # Simulated and test games don't fill up the high score table
+        self.record_scores = self.mode == "play"
+        self.scores_path = SCORES_DB_PATH  # tests point this at a temporary file
+        
+        # Tunable values; a watcher (set by main) reloads them while playing
+        self.settings_watcher = None
+        self.director = Director(settings)
+        self.apply_settings(settings)
+        
+        self.reset(seed=0 if deterministic else None)
+        
+        # Load fonts
+        self.font = pygame.font.Font(None, 36)
+    
+    def start_music(self):
+        """Play the background music in a loop, when this mode has audio"""
+        if not self.has_audio:
+            return
+        if self.assets:
+            pygame.mixer.music.load(self.assets.file(MUSIC_ASSET))
+        else:
+            pygame.mixer.music.load(os.path.join(ASSET_DIR, MUSIC_ASSET))  # Replace with your music file
+        pygame.mixer.music.play(-1)  # Play the music in a loop
+    
+    def load_fonts(self):
+        """Switch the UI to system fonts"""
+        self.system_fonts = True
+        self.ui.load_system_fonts()
+    
+    def reset(self, seed=None):
+        """Start a new game, keeping the window, UI and loaded assets
+        
+        With a seed the game's randomness starts over from it (see seed()).
+        """
+        if seed is not None:
+            self.seed(seed)
+        self.paused = False
+        self.game_over = False
+        
+        # Score and health
+        self.score = 0
+        self.player_health = PLAYER_MAX_HEALTH
+        self.enemies_killed = 0  # Track how many enemies have been destroyed
+        self.bosses_defeated = 0
+        self.boss_waves = 0  # boss waves sent so far
+        self.shots_fired = 0
+        self.leaderboard = []  # Top scores, loaded when the game ends
+        
+        # Game objects
+        self.player = PlayerPlane(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100, self.settings)
+        self.pickups.clear()
+        self.enemies: List[EnemyPlane] = []
+        self.bosses: List[BossPlane] = []
+        self.player_lasers: List[Laser] = []
+        self.enemy_lasers: List[Laser] = []
+        self.particles.clear()
+        self.effects.clear()
+        self.frame_count = 0
+        
+        # Initialize clouds
+        self.clouds.clear()
+        self._init_clouds()
+        
+        # Last enemy spawn time
+        self.last_enemy_spawn = 0
+        self.sim_time = 0.0  # milliseconds, used instead of real time when headless
+        
+        # Difficulty starts over with each game
+        self.director.reset()
+        self.director.apply(self)
+    
+    def seed(self, seed):
+        """Make the game repeatable: the same seed and inputs give the same game
+        
+        Deterministic games reseed every subsystem's stream; others seed the
+        random module.
+        """
+        if self.deterministic:
+            self.streams = RandomStreams(seed)
+            self.particles.seed(self.streams.derive("particles"))
+            self.effects.seed(self.streams.derive("effects"))
+        else:
+            random.seed(seed)
+            self.particles.seed(seed)
+            self.effects.seed(seed)
+    
+    def rng(self, subsystem):
+        """Random numbers for a subsystem: its own stream when deterministic"""
+        return self.streams[subsystem] if self.deterministic else random
+    
+    def apply_settings(self, settings):
+        """Use new settings, updating the game and every plane already flying
+        
+        Values used every frame are copied into plain attributes here so the
+        game loop never looks them up through the settings object.
+        """
+        self.base_settings = settings  # as loaded, before the game speed
+        settings = self.accessibility.adjust(settings)
+        self.settings = settings
+        self.fps = settings.fps
+        self.frame_ms = 1000 / settings.fps
+        self.spawn_interval = settings.enemy_spawn_interval
+        self.enemy_shoot_chance = settings.enemy_shoot_chance
+        self.boss_spawn_count = settings.boss_spawn_count
+        
+        # The director scales spawn interval and fire chances from these values
+        self.director.apply_settings(settings)
+        self.director.apply(self)
+        
+        if hasattr(self, 'player'):
+            for plane in [self.player] + self.hostiles:
+                plane.apply_settings(settings)
+    
+    def set_accessibility(self, accessibility):
+        """Switch palette, HUD size and game speed
+        
+        Sprites, clouds, particles and the HUD are baked again here, once,
+        so drawing never checks which palette is in use.
+        """
+        if self.pipeline:
+            # The render thread may be using the old HUD; show its frame first
+            frame = self.pipeline.wait()
+            if frame:
+                self._show_frame(*frame)
+        self.accessibility = accessibility
+        _use_palette(accessibility.palette)
+        self.sky_color = PALETTE[SKY_COLOR]
+        for cloud in self.clouds:
+            cloud.rebake()
+        self.particles.atlas = ParticleAtlas()
+        self.effects.clear_sprites()
+        self.ui = UI(self.screen, accessibility.hud_scale, self.system_fonts)
+        self.apply_settings(self.base_settings)
+    
+    @property
+    def hostiles(self):
+        """Every plane the player can shoot down: enemies, then bosses"""
+        return self.enemies + self.bosses
+    
+    def _remove_hostile(self, hostile):
+        """Take a hostile plane out of the game"""
+        (self.bosses if hostile.kind == "boss" else self.enemies).remove(hostile)
+    
+    @property
+    def effect_sprites(self):
+        """(sprite, position) of each floating damage number"""
+        return self.effects.sprites()
+    
+    def _render_target(self):
+        """The window itself when no scaling is needed, else an offscreen canvas"""
+        if self.viewport.direct:
+            return self.window
+        return self._offscreen_canvas()
+    
+    def _offscreen_canvas(self):
+        """A virtual-sized surface to draw frames on before they are presented"""
+        if self._canvas is None:
+            self._canvas = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        return self._canvas
+    
+    def _resize(self):
+        """Follow a window size change"""
+        # The render thread may still be drawing for the old window; its frame
+        # is shown in the new one
+        frame = self.pipeline.wait() if self.pipeline else None
+        self.window = pygame.display.get_surface()
+        self.viewport.resize(self.window.get_size())
+        self.screen = self._render_target()
+        self.ui.screen = self.screen
+        if frame:
+            self._show_frame(*frame)
+    
+    def ticks(self):
+        """Current game time in milliseconds"""
+        if self.headless:
+            return int(self.sim_time)
+        return pygame.time.get_ticks()
+    
+    def _init_clouds(self):
+        """Initialize background clouds"""
+        rng = self.rng("clouds")
+        for _ in range(8):
+            x = rng.randint(0, SCREEN_WIDTH)
+            y = rng.randint(0, SCREEN_HEIGHT // 2)
+            size = rng.randint(50, 150)
+            speed = rng.uniform(0.2, 0.8)
+            self.clouds.append(Cloud(x, y, size, speed, rng))
+    
+    def spawn_enemy(self):
+        """Spawn a new enemy plane"""
+        current_time = self.ticks()
+        
+        # Every boss_spawn_count kills, once the last wave is beaten, bosses fly in
+        if not self.bosses and self.enemies_killed >= (self.boss_waves + 1) * self.boss_spawn_count:
+            self.spawn_boss_wave()
+            return
+        
+        # Regular enemies keep coming, more slowly while bosses are fighting
+        interval = self.spawn_interval * (BOSS_ESCORT_SPAWN_FACTOR if self.bosses else 1)
+        if current_time - self.last_enemy_spawn > interval and len(self.enemies) < self.max_enemies:
+            rng = self.rng("spawn")
+            x = rng.randint(50, SCREEN_WIDTH - 50)
+            y = rng.randint(-100, -50)
+            enemy = EnemyPlane(x, y, self.settings, rng=self.rng("enemies"))
+            self.enemies.append(enemy)
+            self.last_enemy_spawn = current_time
+            self.telemetry.emit("spawn", kind="enemy", x=x, y=y)
+    
+    def spawn_boss_wave(self):
+        """Send in a wave of bosses, one more every BOSS_WAVE_GROWTH waves"""
+        count = min(BOSS_MAX_CONCURRENT, 1 + self.boss_waves // BOSS_WAVE_GROWTH)
+        self.boss_waves += 1
+        for i in range(count):
+            x = SCREEN_WIDTH * (i + 1) // (count + 1)
+            boss = BossPlane(x, -BOSS_HEIGHT, self.settings, station_y=BOSS_STATION_Y,
+                             rng=self.rng("bosses"))
+            self.bosses.append(boss)
+            self.telemetry.emit("spawn", kind="boss", x=boss.x, y=boss.y)
+    
+    def handle_events(self):
+        """Handle all game events"""
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.running = False
+            
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_SPACE:
+                    self.player_shoot()
+                elif event.key == pygame.K_F2:
+                    self.set_accessibility(next_preset(self.accessibility))
+            
+            elif event.type == pygame.VIDEORESIZE:
+                self._resize()
+            
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                # Check button clicks, in game coordinates
+                mouse_pos = self.viewport.to_virtual(event.pos) if self.viewport else event.pos
+                
+                # Exit button (bottom left)
+                if self.ui.exit_rect.collidepoint(mouse_pos):
+                    self.running = False
+                
+                # Pause/Resume button (bottom right)
+                if self.ui.pause_rect.collidepoint(mouse_pos):
+                    self.paused = not self.paused
+    
+    def player_shoot(self):
+        """Fire the player's lasers if they are off cooldown"""
+        lasers = self.player.fire(now=self.ticks())
+        if lasers:
+            self.player_lasers.extend(lasers)
+            self.shots_fired += 1
+            self.telemetry.emit("shot", x=lasers[0].x, y=lasers[0].y, lasers=len(lasers))
+    
+    def update(self, keys=None):
+        """Update game logic, using the keyboard unless keys are given"""
+        if self.paused or self.game_over:
+            return
+        
+        if self.headless:
+            self.sim_time += self.frame_ms
+        
+        # Adapt difficulty to the player and the machine
+        self.director.update(self)
+        
+        # Handle player input
+        if keys is None:
+            keys = pygame.key.get_pressed()
+        self.player.update(keys)
+        self.player.update_power_ups(self.ticks())
+        
+        # Spawn enemies
+        self.spawn_enemy()
+        
+        # Move enemies and bosses and let them shoot
+        now = self.ticks()
+        for hostile in self.hostiles:
+            self.enemy_lasers.extend(hostile.think(self, now))
+            
+            # Remove planes that are off screen
+            if hostile.is_gone():
+                self._remove_hostile(hostile)
+        
+        # Update lasers
+        for laser in self.player_lasers[:]:
+            laser.update()
+            if laser.is_off_screen():
+                self.player_lasers.remove(laser)
+        
+        # Homing and weaving enemy lasers are steered in one batch
+        steer_lasers(self.enemy_lasers, self.player.x, self.player.y)
+        for laser in self.enemy_lasers[:]:
+            laser.update()
+            if laser.is_off_screen():
+                self.enemy_lasers.remove(laser)
+        
+        # Update clouds and falling power-ups
+        for cloud in self.clouds:
+            cloud.update()
+        self.pickups.update()
+        
+        if self.deterministic:
+            snap_world(self)
+        
+        # Update particles, with a contrail puff behind the player
+        self.frame_count += 1
+        if self.frame_count % CONTRAIL_INTERVAL == 0:
+            self.particles.contrail(self.player.x, self.player.y + self.player.height // 2)
+        self.particles.update()
+        self.effects.update()
+        
+        # Check collisions
+        self._check_collisions()
+        
+        # Check game over
+        if self.player_health <= 0:
+            self.game_over = True
+            self.telemetry.emit("game_over", score=self.score, kills=self.enemies_killed,
+                                frames=self.frame_count)
+            self._record_session()
+    
+    def _record_session(self):
+        """Save the finished game and load the leaderboard for the game over screen"""
+        if not self.record_scores:
+            return
+        try:
+            store = ScoreStore(self.scores_path)
+            try:
+                store.record_session(PLAYER_NAME, self.score, self.enemies_killed,
+                                     self.bosses_defeated, self.shots_fired,
+                                     self.frame_count / self.fps)
+                self.leaderboard = store.top_scores()
+            finally:
+                store.close()
+        except (sqlite3.Error, OSError):
+            # High scores are nice to have; never let them end the game
+            self.leaderboard = []
+    
+    def _check_collisions(self):
+        """Check all collision detection"""
+        # Player lasers hit enemies and bosses; each laser hits one plane.
+        # Every laser's path since the last frame is tested against every
+        # plane in one batch, then candidates get the pixel-perfect test.
+        hostiles = self.hostiles
+        if self.player_lasers and hostiles:
+            candidates = swept_candidates(self.player_lasers, hostiles)
+            lasers = [self.player_lasers[i] for i in np.flatnonzero(candidates.any(axis=1))]
+            rows = candidates[candidates.any(axis=1)]
+        else:
+            lasers, rows = [], []
+        for laser, row in zip(lasers, rows):
+            for hostile in [hostiles[j] for j in np.flatnonzero(row)]:
+                if hostile.health > 0 and hostile.mask_hit(laser):
+                    self.player_lasers.remove(laser)
+                    hostile.take_damage()
+                    self.particles.sparks(laser.x, laser.y)
+                    self.effects.hit(hostile, 1)
+                    self.telemetry.emit("hit", target=hostile.kind, health=hostile.health)
+                    
+                    if hostile.health <= 0:
+                        self._shoot_down(hostile)
+                    break
+        
+        # The player collects power-ups by flying into them
+        for kind in self.pickups.collect(self.player.get_rect()):
+            self._power_up(kind)
+        
+        # Enemy lasers hit player, tested the same way; a shield absorbs them
+        if not self.enemy_lasers:
+            return
+        candidates = swept_candidates(self.enemy_lasers, [self.player])[:, 0]
+        for laser in [self.enemy_lasers[i] for i in np.flatnonzero(candidates)]:
+            if self.player.mask_hit(laser):
+                self.enemy_lasers.remove(laser)
+                self.particles.sparks(laser.x, laser.y)
+                if self.player.shielded:
+                    continue
+                self.player_health -= laser.damage  # Use the laser's damage value
+                self.effects.hit(self.player, laser.damage, RED)
+                self.effects.shake(laser.damage * SHAKE_PER_DAMAGE)
+                self.telemetry.emit("hit", target="player", damage=laser.damage,
+                                    health=self.player_health)
+    
+    def _shoot_down(self, hostile):
+        """Score a destroyed enemy or boss and remove it"""
+        self._remove_hostile(hostile)
+        self.particles.explode(hostile.x, hostile.y, hostile.explosion_size)
+        self.score += hostile.score_value
+        self.enemies_killed += 1  # Bosses count too, for boss wave timing
+        self.telemetry.emit("kill", kind=hostile.kind, score=self.score)
+        if hostile.kind == "boss":
+            self.bosses_defeated += 1
+            self.effects.shake(SHAKE_BOSS_DEFEATED)
+            self.telemetry.emit("boss_defeated", score=self.score)
+        
+        # Bosses always drop a power-up, other planes sometimes
+        rng = self.rng("powerups")
+        if hostile.kind == "boss" or rng.random() < POWERUP_DROP_CHANCE:
+            self.pickups.spawn(hostile.x, hostile.y, choose_powerup(rng))
+    
+    def _power_up(self, kind):
+        """Apply a collected power-up"""
+        powerup = POWERUPS[kind]
+        if "heal" in powerup:
+            self.player_health = min(PLAYER_MAX_HEALTH, self.player_health + powerup["heal"])
+        else:
+            self.player.power_up(kind, self.ticks())
+        self.telemetry.emit("powerup", kind=kind, health=self.player_health)
+    
+    def draw(self):
+        """Draw all game objects and show them on screen, shaken when shaking"""
+        if self.headless:
+            self.render()
+            return
+        offset = self.effects.shake_offset
+        screen = self.screen
+        if offset != (0, 0) and screen is self.window:
+            # A shaken frame is moved as it is copied, so it can't be drawn in place
+            screen = self._offscreen_canvas()
+        self.render(screen=screen)
+        self.viewport.present(screen, self.window, offset)
+        pygame.display.flip()
+    
+    def render(self, state=None, screen=None):
+        """Draw all game objects onto the game surface
+        
+        `state` is the game itself or a pipeline Snapshot of it, and
+        `screen` the surface to draw on (the game surface by default).
+        """
+        state = state or self
+        screen = screen or self.screen
+        self.ui.screen = screen
+        
+        # Sky background
+        screen.fill(self.sky_color)
+        
+        # Clouds, planes, health bars, lasers and damage numbers are queued
+        # and drawn in one batch, in layer order
+        render_queue = self.render_queue
+        for cloud in state.clouds:
+            cloud.enqueue(render_queue)
+        for pickup in state.pickups:
+            pickup.enqueue(render_queue)
+        state.player.enqueue(render_queue)
+        for hostile in state.hostiles:
+            hostile.enqueue(render_queue)
+        for laser in state.player_lasers:
+            laser.enqueue(render_queue)
+        for laser in state.enemy_lasers:
+            laser.enqueue(render_queue)
+        for sprite, position in state.effect_sprites:
+            render_queue.add(sprite, position, LAYER_EFFECTS)
+        render_queue.flush(screen)
+        
+        # Draw explosions, smoke and contrails
+        state.particles.draw(screen)
+        
+        # Draw UI
+        self.ui.draw(state.score, state.player_health, state.paused, state.game_over,
+                     state.leaderboard)
+    
+    def _draw_threaded(self):
+        """Show the frame the render thread finished and hand it the next one"""
+        frame = self.pipeline.wait()
+        if frame:
+            self._show_frame(*frame)
+        self.pipeline.submit(Snapshot(self))
+    
+    def _show_frame(self, canvas, scaled):
+        """Present and record a frame the render thread finished"""
+        if scaled.get_size() != self.viewport.rect.size:
+            scaled = canvas  # scaled for a window size since changed; present scales it again
+        self.viewport.present(scaled, self.window, self.effects.shake_offset)
+        pygame.display.flip()
+        if self.capture:
+            self.capture.capture(canvas)
+    
+    def run(self, autopilot=None, duration=None, monitor=None, capture=None):
+        """Main game loop
+        
+        With an autopilot the plane flies itself and a new game starts after
+        each game over. The loop stops after `duration` seconds when given.
+        A capture records every frame that its encoder keeps up with.
+        """
+        self._start_run(capture)
+        while self.running:
+            self._run_frame(autopilot, duration, monitor, capture)
+        self._stop_run(monitor, capture)
+        sys.exit()
+    
+    async def run_async(self, streamer=None, autopilot=None, duration=None, monitor=None, capture=None):
+        """The main game loop as a coroutine, for the browser build
+        
+        Control goes back to the event loop (and so the browser) after every
+        frame. A streamer loads assets between frames (see src/web.py).
+        """
+        self._start_run(capture)
+        while self.running:
+            self._run_frame(autopilot, duration, monitor, capture)
+            if streamer:
+                streamer.frame()
+            await asyncio.sleep(0)
+        self._stop_run(monitor, capture)
+    
+    def _start_run(self, capture=None):
+        """Get ready for the game loop"""
+        self._run_start = time.perf_counter()
+        self.capture = capture
+        if self.threaded_render:
+            self.pipeline = RenderPipeline(self)
+    
+    def _run_frame(self, autopilot, duration, monitor, capture):
+        """One pass of the game loop: input, update, draw and wait for the next frame"""
+        if self.settings_watcher:
+            settings = self.settings_watcher.poll()
+            if settings:
+                self.apply_settings(settings)
+        self.handle_events()
+        if autopilot and not self.paused:
+            if self.game_over:
+                self.reset()
+                if monitor:
+                    monitor.games += 1
+            keys, shoot = autopilot.decide(self)
+            if shoot:
+                self.player_shoot()
+            self.update(keys)
+        else:
+            self.update()
+        if self.pipeline:
+            self._draw_threaded()
+        else:
+            self.draw()
+            if capture:
+                capture.capture(self.screen)
+        self.clock.tick(self.fps)
+        
+        sampling = not (self.paused or self.game_over)
+        if sampling:
+            self.director.frame(self.clock.get_rawtime())
+        if sampling and self.frame_count % TELEMETRY_FRAME_SAMPLE_INTERVAL == 0:
+            self.telemetry.emit("frame_time", ms=self.clock.get_rawtime(),
+                                entities=len(self.hostiles) + len(self.enemy_lasers)
+                                + len(self.player_lasers))
+        if monitor:
+            monitor.frame(self, self.clock.get_rawtime())
+        if duration is not None and time.perf_counter() - self._run_start >= duration:
+            self.running = False
+    
+    def _stop_run(self, monitor, capture):
+        """Finish the game loop: report, close everything and shut pygame down"""
+        if self.pipeline:
+            self.pipeline.close()
+        if monitor:
+            monitor.sample(self)
+            print(monitor.report())
+        if capture:
+            capture.close()
+            print(f"[capture] {capture.frames} frames written to {capture.path}, {capture.dropped} dropped")
+        self.telemetry.close()
+        pygame.quit()
+
+def _use_palette(name):
+    """Switch the shared palette, dropping the sprites baked in the old one"""
+    if PALETTE.name != name:
+        PALETTE.use(name)
+        Plane.clear_sprites()
+        Laser.clear_sprites()
+        Pickup.clear_sprites()
+
+def _window_size(text):
+    """Parse a WIDTHxHEIGHT command line value"""
+    try:
+        width, height = (int(part) for part in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WIDTHxHEIGHT, got '{text}'")
+    return width, height
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="TejasThrust - fighter plane game")
+    parser.add_argument("--profile", default=None,
+                        help="settings profile to use (kiosk, dev, stress, ...)")
+    parser.add_argument("--settings", default=SETTINGS_PATH,
+                        help="settings file, reloaded automatically when it changes")
+    parser.add_argument("--fullscreen", action="store_true",
+                        help="fill the screen, scaling the game to fit")
+    parser.add_argument("--window", type=_window_size, default=None, metavar="WIDTHxHEIGHT",
+                        help="window size, e.g. 1920x1080 (the game is scaled to fit)")
+    parser.add_argument("--accessibility", choices=list(ACCESSIBILITY_PRESETS), default="standard",
+                        help="palette, HUD size and game speed preset (F2 switches while playing)")
+    parser.add_argument("--web", action="store_true",
+                        help="play the browser build's web mode in a window (see src/web.py)")
+    parser.add_argument("--threaded-render", action="store_true", default=THREADED_RENDER,
+                        help="draw on a render thread while the next frame is simulated")
+    parser.add_argument("--autopilot", action="store_true",
+                        help="let the autopilot fly (soak and regression testing)")
+    parser.add_argument("--duration", type=float, default=None,
+                        help="quit after this many seconds")
+    parser.add_argument("--soak-interval", type=float, default=SOAK_SAMPLE_INTERVAL,
+                        help="seconds between soak report samples (with --autopilot)")
+    parser.add_argument("--watchdog", action="store_true",
+                        help="watch for memory and object-count growth (SIGUSR1 dumps the heap)")
+    parser.add_argument("--trace-malloc", action="store_true",
+                        help="with --watchdog, log the top allocation sites when growth is found")
+    parser.add_argument("--worlds", type=int, default=None, metavar="N",
+                        help="benchmark N headless worlds on all cores for --duration seconds and exit")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="time a cold start in every mode, check the import budget and exit")
+    parser.add_argument("--build-assets", action="store_true",
+                        help=f"pack {ASSET_DIR}/ into {ASSET_BUNDLE_PATH} and exit")
+    parser.add_argument("--capture", default=None, metavar="PATH",
+                        help="record the game to a .y4m video or a folder of PNG frames")
+    parser.add_argument("--export-video", default=None, metavar="PATH",
+                        help="render a replay (or an autopilot game) to video without a window and exit")
+    parser.add_argument("--replay", default=None,
+                        help="replay file for --export-video")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="random seed for --export-video clips and --worlds")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Start the game from the command line"""
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+    # Command line tools are imported when used, keeping the game's start-up short
+    if args.startup_report:
+        sys.exit(_startup_report())
+    if args.build_assets:
+        from src.assets import build_bundle
+        manifest = build_bundle()
+        print(f"[assets] {len(manifest['entries'])} entries, {len(manifest['sprites'])} sprites "
+              f"packed into {ASSET_BUNDLE_PATH}")
+        return
+    settings = load_settings(args.settings, args.profile)
+    if args.export_video:
+        _export_video(args, settings)
+        return
+    if args.worlds:
+        _benchmark_worlds(args)
+        return
+    if args.web:
+        asyncio.run(play_web(args, settings))
+        return
+    game = TejasThrust(settings=settings, window_size=args.window, fullscreen=args.fullscreen,
+                       threaded_render=args.threaded_render, accessibility=preset(args.accessibility))
+    game.settings_watcher = SettingsWatcher(args.settings, args.profile)
+    if args.watchdog:
+        from src.watchdog import MemoryWatchdog
+        MemoryWatchdog(game, trace=args.trace_malloc).start()
+    capture = None
+    if args.capture:
+        from src.capture import FrameCapture
+        capture = FrameCapture(args.capture, fps=game.fps)
+    if args.autopilot:
+        from src.autopilot import Autopilot
+        from src.soak import SoakMonitor
+        game.run(Autopilot(), args.duration, SoakMonitor(args.soak_interval), capture)
+    else:
+        game.run(duration=args.duration, capture=capture)
+
+async def play_web(args=None, settings=None):
+    """Play the web mode; the browser build's entry point (see src/web.py)"""
+    from src.web import AssetStreamer
+    args = args or parse_args([])
+    settings = settings or load_settings(args.settings, args.profile)
+    game = TejasThrust(settings=settings.replace(fps=min(settings.fps, WEB_FPS)), mode="web",
+                       accessibility=preset(args.accessibility))
+    await game.run_async(AssetStreamer.for_game(game), duration=args.duration)
+
+def _benchmark_worlds(args):
+    """Free-run many headless worlds flown by the autopilot and report throughput"""
+    from src.worlds import WorldManager, AutopilotPolicy
+    worlds = WorldManager(args.worlds, policy=AutopilotPolicy, mode="benchmark", deterministic=True)
+    try:
+        worlds.reset(args.seed)
+        stats = worlds.run_for(args.duration or WORLDS_BENCHMARK_SECONDS)
+    finally:
+        worlds.close()
+    print("[worlds] {worlds} worlds on {workers} workers: {frames} frames in {elapsed:.1f}s, "
+          "{frames_per_sec:.0f} frames/s".format(**stats))
+
+def _export_video(args, settings):
+    """Render a replay to video offline; without a replay the autopilot plays"""
+    from src.capture import Replay, export_replay, record_autopilot
+    if args.replay:
+        replay = Replay.load(args.replay)
+    else:
+        replay = record_autopilot(args.duration or EXPORT_SECONDS, args.seed, settings)
+        # Keep the replay so the same clip can be rendered again
+        replay.save(os.path.splitext(args.export_video)[0] + ".replay.json")
+    start = time.perf_counter()
+    frames = export_replay(replay, args.export_video, settings)
+    elapsed = time.perf_counter() - start
+    print(f"[capture] {frames} frames written to {args.export_video} in {elapsed:.1f}s")
+
+def _startup_report():
+    """Print cold-start times for each mode; returns 1 if an import is over budget"""
+    from src.startup import MODES, measure_cold_start
+    status = 0
+    for mode in MODES:
+        try:
+            times = measure_cold_start(mode)
+        except subprocess.CalledProcessError as error:
+            # e.g. play or test mode on a machine without a display
+            print(f"[startup] {mode:9s} failed: {error.stderr.strip().splitlines()[-1]}")
+            continue
+        over = times["import_ms"] > STARTUP_IMPORT_BUDGET_MS
+        status = status or int(over)
+        print(f"[startup] {mode:9s} import {times['import_ms']:6.0f}ms  init {times['init_ms']:6.0f}ms  "
+              f"total {times['total_ms']:6.0f}ms{'  OVER BUDGET' if over else ''}")
+    print(f"[startup] import budget {STARTUP_IMPORT_BUDGET_MS}ms")
+    return status
+
+if __name__ == "__main__":
+    if sys.platform == "emscripten":
+        # Running in the browser under pygbag
+        asyncio.run(play_web())
+    else:
+        main()
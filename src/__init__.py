@@ -1,7 +1,7 @@
-"""
-TejasThrust game package
-"""
-
-__version__ = "1.0.0"
-__author__ = "TejasThrust Team"
-__description__ = "A professional single-player dog fight game for kids aged 5-12"
+"""
+TejasThrust game package
+"""
+
+__version__ = "1.0.0"
+__author__ = "TejasThrust Team"
+__description__ = "A professional single-player dog fight game for kids aged 5-12"
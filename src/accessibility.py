@@ -0,0 +1,79 @@
+"""
+Palettes and accessibility presets for TejasThrust game
+
+Colors are chosen in one place: the active `PALETTE` maps each base color
+from src/config.py to the color actually shown (PALETTES lists the
+tables). Game objects keep their base colors, and everything drawn in color
+(plane, laser, pickup and particle sprites, clouds, health bars, the HUD)
+looks its color up in the palette when the sprite is baked, not when it is
+drawn. Switching palette clears those caches once, and from then on each
+frame draws exactly as before.
+
+An `Accessibility` preset (ACCESSIBILITY_PRESETS) combines a palette with
+a HUD size and a game speed; TejasThrust.set_accessibility applies one.
+"""
+
+import dataclasses
+from dataclasses import dataclass
+from src.config import *
+
+
+class Palette:
+    """The color shown for each base color"""
+
+    def __init__(self, name="default"):
+        self.use(name)
+
+    def use(self, name):
+        """Switch to another palette table"""
+        if name not in PALETTES:
+            raise ValueError(f"unknown palette '{name}'")
+        self.name = name
+        self.colors = PALETTES[name]
+
+    def __getitem__(self, color):
+        return self.colors.get(color, color)
+
+
+PALETTE = Palette()  # the palette every sprite is baked with
+
+# Settings slowed down by the game speed: speeds are multiplied by it,
+# intervals between spawns and shots divided
+_SPEEDS = ("player_speed", "laser_speed", "enemy_speed", "enemy_laser_speed",
+           "boss_speed", "boss_laser_speed")
+_INTERVALS = ("enemy_spawn_interval", "enemy_shoot_cooldown", "boss_shoot_cooldown")
+
+
+@dataclass(frozen=True)
+class Accessibility:
+    """A palette, HUD size and game speed"""
+
+    name: str = "standard"
+    palette: str = "default"
+    hud_scale: float = 1.0
+    game_speed: float = 1.0
+
+    def adjust(self, settings):
+        """The settings to play with at this game speed"""
+        if self.game_speed == 1:
+            return settings
+        changes = {name: getattr(settings, name) * self.game_speed for name in _SPEEDS}
+        changes.update({name: round(getattr(settings, name) / self.game_speed) for name in _INTERVALS})
+        return settings.replace(**changes)
+
+
+STANDARD = Accessibility()
+
+
+def preset(name):
+    """The accessibility preset with this name; ValueError if there is none"""
+    if name not in ACCESSIBILITY_PRESETS:
+        raise ValueError(f"unknown accessibility preset '{name}'")
+    return dataclasses.replace(STANDARD, name=name, **ACCESSIBILITY_PRESETS[name])
+
+
+def next_preset(accessibility):
+    """The preset after this one, wrapping around"""
+    names = list(ACCESSIBILITY_PRESETS)
+    index = names.index(accessibility.name) if accessibility.name in names else -1
+    return preset(names[(index + 1) % len(names)])
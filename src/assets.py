@@ -0,0 +1,221 @@
+"""
+Asset bundles for TejasThrust game
+
+`build_bundle` packs an asset folder into one file: images are packed into
+texture atlases and every other file (sounds, data) is stored as is. The
+bundle starts with a JSON manifest giving each entry's offset, size and
+CRC-32 checksum.
+
+`AssetBundle` memory-maps the bundle, so opening it only reads the manifest.
+Entries are checked and decoded the first time they are used, and sprites
+are subsurfaces of their shared atlas.
+
+Layout: b"TTBUNDLE", version and manifest length (two little-endian uint32),
+the manifest, then the entry data.
+"""
+
+import io
+import json
+import mmap
+import os
+import struct
+import zlib
+import pygame
+from src.config import *
+
+MAGIC = b"TTBUNDLE"
+VERSION = 1
+_HEADER = struct.Struct("<8sII")
+IMAGE_EXTENSIONS = (".png", ".bmp", ".jpg", ".jpeg", ".gif", ".tga")
+
+
+class AssetError(ValueError):
+    """A bundle or bundle entry is missing or damaged"""
+
+
+def _pack_shelves(sizes, max_size=ATLAS_MAX_SIZE, padding=ATLAS_PADDING):
+    """Place rectangles on shelves, tallest first, opening new atlases as needed
+
+    Returns ({name: (atlas, x, y)}, [(width, height) of each atlas]).
+    """
+    placements = {}
+    atlases = []
+    x = y = shelf_height = 0
+    for name, (width, height) in sorted(sizes.items(), key=lambda item: (-item[1][1], item[0])):
+        if width > max_size or height > max_size:
+            raise AssetError(f"image '{name}' is larger than the {max_size}px atlas")
+        if not atlases or x + width > max_size:
+            x, y, shelf_height = 0, y + shelf_height, 0  # next shelf
+        if not atlases or y + height > max_size:
+            atlases.append([0, 0])
+            x = y = shelf_height = 0  # next atlas
+        placements[name] = (len(atlases) - 1, x, y)
+        atlases[-1][0] = max(atlases[-1][0], x + width)
+        atlases[-1][1] = max(atlases[-1][1], y + height)
+        x += width + padding
+        shelf_height = max(shelf_height, height + padding)
+    return placements, [tuple(size) for size in atlases]
+
+
+def build_bundle(source_dir=ASSET_DIR, output=ASSET_BUNDLE_PATH):
+    """Pack every file under source_dir into a bundle; returns the manifest
+
+    Entry names are paths relative to source_dir with forward slashes, e.g.
+    "sounds/TT.wav".
+    """
+    images = {}
+    blobs = {}
+    for root, _, files in os.walk(source_dir):
+        for filename in sorted(files):
+            path = os.path.join(root, filename)
+            name = os.path.relpath(path, source_dir).replace(os.sep, "/")
+            if filename.lower().endswith(IMAGE_EXTENSIONS):
+                images[name] = pygame.image.load(path)
+            else:
+                with open(path, "rb") as file:
+                    blobs[name] = ("raw", file.read())
+
+    sprites = {}
+    placements, atlas_sizes = _pack_shelves({name: image.get_size() for name, image in images.items()})
+    for index, size in enumerate(atlas_sizes):
+        atlas = pygame.Surface(size, pygame.SRCALPHA)
+        for name, (atlas_index, x, y) in placements.items():
+            if atlas_index == index:
+                atlas.blit(images[name], (x, y))
+                sprites[name] = {"atlas": f"atlas/{index}.png", "rect": [x, y, *images[name].get_size()]}
+        data = io.BytesIO()
+        pygame.image.save(atlas, data, "atlas.png")
+        blobs[f"atlas/{index}.png"] = ("atlas", data.getvalue())
+
+    entries = {}
+    offset = 0
+    for name, (kind, data) in blobs.items():
+        entries[name] = {"kind": kind, "offset": offset, "size": len(data), "crc32": zlib.crc32(data)}
+        offset += len(data)
+    manifest = {"entries": entries, "sprites": sprites}
+    manifest_bytes = json.dumps(manifest, separators=(",", ":")).encode("utf-8")
+
+    with open(output, "wb") as file:
+        file.write(_HEADER.pack(MAGIC, VERSION, len(manifest_bytes)))
+        file.write(manifest_bytes)
+        for _, data in blobs.values():
+            file.write(data)
+    return manifest
+
+
+class _EntryReader(io.RawIOBase):
+    """A seekable, read-only file over one entry of a memory-mapped bundle"""
+
+    def __init__(self, mapping, start, size):
+        self._map = mapping
+        self._start = start
+        self._size = size
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        count = max(0, min(len(buffer), self._size - self._position))
+        start = self._start + self._position
+        buffer[:count] = self._map[start:start + count]
+        self._position += count
+        return count
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._position, io.SEEK_END: self._size}[whence]
+        self._position = max(0, base + offset)
+        return self._position
+
+    def tell(self):
+        return self._position
+
+
+class AssetBundle:
+    """Read-only, memory-mapped view of a bundle with lazily decoded entries"""
+
+    def __init__(self, path=ASSET_BUNDLE_PATH):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, manifest_size = _HEADER.unpack_from(self._map)
+            if magic != MAGIC or version != VERSION:
+                raise AssetError(f"'{path}' is not a version {VERSION} asset bundle")
+            start = _HEADER.size
+            manifest = json.loads(bytes(self._map[start:start + manifest_size]))
+        except (ValueError, struct.error) as error:
+            self._file.close()
+            raise AssetError(f"cannot read asset bundle '{path}': {error}") from error
+        self.entries = manifest["entries"]
+        self.sprites = manifest["sprites"]
+        self._data_start = start + manifest_size
+        self._decoded = {}  # name -> decoded Surface or Sound, filled on first use
+
+    def names(self):
+        """Every sprite and stored file in the bundle"""
+        return sorted(self.sprites) + sorted(name for name, entry in self.entries.items()
+                                             if entry["kind"] == "raw")
+
+    def _checked(self, name):
+        """(start, size) of a stored entry in the mapping, once its checksum matches"""
+        entry = self.entries.get(name)
+        if entry is None:
+            raise AssetError(f"no asset '{name}' in '{self.path}'")
+        start = self._data_start + entry["offset"]
+        # The checksum reads the mapping in place; the view is released
+        # straight away so close() never finds the mapping still in use
+        view = memoryview(self._map)[start:start + entry["size"]]
+        try:
+            crc = zlib.crc32(view)
+        finally:
+            view.release()
+        if crc != entry["crc32"]:
+            raise AssetError(f"asset '{name}' in '{self.path}' is damaged (checksum mismatch)")
+        return start, entry["size"]
+
+    def data(self, name):
+        """The checked bytes of a stored entry"""
+        start, size = self._checked(name)
+        return self._map[start:start + size]
+
+    def file(self, name):
+        """A file-like object reading an entry straight from the mapping
+
+        Nothing is copied up front, so music can stream from it with
+        pygame.mixer.music.load. It reads until the bundle is closed.
+        """
+        start, size = self._checked(name)
+        return io.BufferedReader(_EntryReader(self._map, start, size))
+
+    def image(self, name):
+        """A sprite, as a subsurface of its decoded atlas"""
+        if name not in self._decoded:
+            sprite = self.sprites.get(name)
+            if sprite is None:
+                raise AssetError(f"no image '{name}' in '{self.path}'")
+            self._decoded[name] = self._atlas(sprite["atlas"]).subsurface(sprite["rect"])
+        return self._decoded[name]
+
+    def _atlas(self, name):
+        if name not in self._decoded:
+            atlas = pygame.image.load(self.file(name), name)
+            if pygame.display.get_surface() is not None:
+                atlas = atlas.convert_alpha()
+            self._decoded[name] = atlas
+        return self._decoded[name]
+
+    def sound(self, name):
+        """A pygame Sound, decoded on first use"""
+        if name not in self._decoded:
+            self._decoded[name] = pygame.mixer.Sound(file=self.file(name))
+        return self._decoded[name]
+
+    def close(self):
+        """Release the mapping and decoded assets"""
+        self._decoded.clear()
+        self._map.close()
+        self._file.close()
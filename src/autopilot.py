@@ -0,0 +1,91 @@
+"""
+Scripted autopilot for TejasThrust game
+
+The autopilot flies the player plane for soak and regression testing. Each
+frame it projects every enemy laser a short time ahead into a coarse danger
+map of the screen, picks the move whose path crosses the least danger and
+lines up under the nearest enemy or boss to shoot it.
+"""
+
+import numpy as np
+import pygame
+from src.config import *
+from src.env import MOVES
+
+
+class Autopilot:
+    """Dodges enemy lasers and shoots at the nearest hostile plane"""
+
+    def __init__(self, lookahead=AUTOPILOT_LOOKAHEAD, cell=AUTOPILOT_CELL):
+        self.lookahead = lookahead
+        self.cell = cell
+        self.cols = SCREEN_WIDTH // cell + 1
+        self.rows = SCREEN_HEIGHT // cell + 1
+        self.danger = np.zeros((self.rows, self.cols), np.float32)
+        self.moves = np.array(MOVES, np.float32)
+        self._weights = 1.0 / np.arange(1, lookahead + 1, dtype=np.float32)  # sooner is worse
+
+    def decide(self, game):
+        """Choose the key state and whether to shoot for this frame"""
+        player = game.player
+        target = self._nearest_hostile(game)
+        target_x = target.x if target else SCREEN_WIDTH / 2
+
+        self._build_danger_map(game.enemy_lasers)
+        scores = self._move_danger(player) * 1000.0
+
+        # Prefer moves that line up with the target and stay low on screen
+        steps = self.moves * player.speed * self.lookahead / 2
+        future_x = player.x + steps[:, 0]
+        future_y = player.y + steps[:, 1]
+        scores += np.abs(future_x - target_x) * 0.01
+        scores += np.abs(future_y - AUTOPILOT_HOME_Y) * 0.005
+
+        dx, dy = MOVES[int(np.argmin(scores))]
+        keys = {pygame.K_LEFT: dx < 0, pygame.K_RIGHT: dx > 0,
+                pygame.K_UP: dy < 0, pygame.K_DOWN: dy > 0}
+        shoot = target is not None and abs(target.x - player.x) < target.width // 2
+        return keys, shoot
+
+    def _nearest_hostile(self, game):
+        player = game.player
+        hostiles = [hostile for hostile in game.hostiles if hostile.y < player.y]
+        if not hostiles:
+            return None
+        return min(hostiles, key=lambda h: abs(h.x - player.x) + abs(h.y - player.y) * 0.25)
+
+    def _build_danger_map(self, lasers):
+        """Mark every cell an enemy laser will pass through in the look-ahead window"""
+        danger = self.danger
+        danger[:] = 0
+        if not lasers:
+            return
+        count = len(lasers)
+        pos = np.fromiter((v for laser in lasers for v in (laser.x, laser.y)), np.float32,
+                          count * 2).reshape(count, 2)
+        vel = np.fromiter((v for laser in lasers for v in (laser.vx, laser.vy)), np.float32,
+                          count * 2).reshape(count, 2)
+        times = np.arange(1, self.lookahead + 1, dtype=np.float32)
+        future = pos[None, :, :] + vel[None, :, :] * times[:, None, None]  # (time, laser, xy)
+        cols = (future[..., 0] // self.cell).astype(np.int32)
+        rows = (future[..., 1] // self.cell).astype(np.int32)
+        weights = np.broadcast_to(self._weights[:, None], cols.shape)
+        inside = (cols >= 0) & (cols < self.cols) & (rows >= 0) & (rows < self.rows)
+        np.add.at(danger, (rows[inside], cols[inside]), weights[inside])
+
+    def _move_danger(self, player):
+        """Sum the danger under the player's rect along each candidate move"""
+        danger = self.danger
+        half_w = player.width // 2 + AUTOPILOT_MARGIN
+        half_h = player.height // 2 + AUTOPILOT_MARGIN
+        result = np.zeros(len(MOVES), np.float32)
+        for i, (dx, dy) in enumerate(MOVES):
+            for t in (1, self.lookahead // 2, self.lookahead):
+                x = min(max(player.x + dx * player.speed * t, half_w), SCREEN_WIDTH - half_w)
+                y = min(max(player.y + dy * player.speed * t, half_h), SCREEN_HEIGHT - half_h)
+                c0 = int(x - half_w) // self.cell
+                c1 = int(x + half_w) // self.cell + 1
+                r0 = int(y - half_h) // self.cell
+                r1 = int(y + half_h) // self.cell + 1
+                result[i] += danger[r0:r1, c0:c1].sum()
+        return result
@@ -0,0 +1,197 @@
+"""
+Frame capture and video export for TejasThrust game
+
+`FrameCapture` copies rendered frames into a small ring of preallocated
+buffers and a background thread encodes them, either as a numbered PNG
+sequence or as a Y4M video (an uncompressed container that ffmpeg and most
+players read). While playing, a full ring drops the frame rather than slow
+the game down; offline exports wait for the encoder instead.
+
+A `Replay` is a seed plus one action per frame, and optionally the settings
+it was played with. Played on a headless game it gives the same frames every
+time, so `export_replay` can render it to video as fast as the machine
+allows, without opening a window.
+"""
+
+import dataclasses
+import json
+import logging
+import os
+import queue
+import threading
+import numpy as np
+import pygame
+from src.config import *
+from src.env import action_keys, key_action
+from src.settings import DEFAULT_SETTINGS
+
+logger = logging.getLogger(__name__)
+
+# RGB to limited-range BT.601 YCbCr, the colors Y4M players expect
+_YUV_MATRIX = np.array([[65.481, 128.553, 24.966],
+                        [-37.797, -74.203, 112.0],
+                        [112.0, -93.786, -18.214]], np.float32).T / 255.0
+_YUV_OFFSET = np.array([16, 128, 128], np.float32)
+
+
+class FrameCapture:
+    """Copies frames into reusable buffers for a background encoder
+
+    `path` ending in .y4m writes a video file; any other path is a folder of
+    frame_000000.png images.
+    """
+
+    def __init__(self, path, size=(SCREEN_WIDTH, SCREEN_HEIGHT), fps=FPS, buffers=CAPTURE_BUFFERS):
+        self.path = path
+        self.size = size
+        self.fps = fps
+        self.format = "y4m" if path.lower().endswith(".y4m") else "png"
+        self.frames = 0  # frames handed to the encoder
+        self.dropped = 0  # frames skipped because every buffer was busy
+        width, height = size
+        self._buffers = [np.empty((height, width, 3), np.uint8) for _ in range(buffers)]
+        self._free = queue.Queue()
+        for index in range(buffers):
+            self._free.put(index)
+        self._ready = queue.Queue()
+        self._file = None
+        if self.format == "y4m":
+            self._file = open(path, "wb")
+            self._file.write(f"YUV4MPEG2 W{width} H{height} F{fps}:1 Ip A1:1 C444\n".encode("ascii"))
+        else:
+            os.makedirs(path, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name="frame-encoder", daemon=True)
+        self._thread.start()
+
+    def capture(self, surface, block=False):
+        """Queue a copy of the surface; returns False if the frame was dropped"""
+        try:
+            index = self._free.get(block)
+        except queue.Empty:
+            self.dropped += 1
+            return False
+        buffer = self._buffers[index]
+        try:
+            pixels = pygame.surfarray.pixels3d(surface)  # a view, no copy
+        except ValueError:
+            pixels = pygame.surfarray.array3d(surface)  # 8 or 16 bit surfaces
+        np.copyto(buffer, pixels.swapaxes(0, 1))
+        del pixels  # unlock the surface
+        self._ready.put((index, self.frames))
+        self.frames += 1
+        return True
+
+    def close(self):
+        """Finish encoding the queued frames and close the output"""
+        self._ready.put(None)
+        self._thread.join()
+        if self._file:
+            self._file.close()
+
+    def _run(self):
+        while True:
+            item = self._ready.get()
+            if item is None:
+                break
+            index, number = item
+            try:
+                self._encode(self._buffers[index], number)
+            except (OSError, pygame.error):
+                logger.exception("could not write frame %d to %s", number, self.path)
+            finally:
+                self._free.put(index)
+
+    def _encode(self, frame, number):
+        if self.format == "y4m":
+            # Limited range stays within 16..240, so no clipping is needed
+            yuv = frame.astype(np.float32) @ _YUV_MATRIX + _YUV_OFFSET
+            planes = yuv.astype(np.uint8).transpose(2, 0, 1)
+            self._file.write(b"FRAME\n")
+            self._file.write(planes.tobytes())
+        else:
+            image = pygame.image.frombuffer(frame, self.size, "RGB")
+            pygame.image.save(image, os.path.join(self.path, f"frame_{number:06d}.png"))
+
+
+class Replay:
+    """A seed and the action taken on every frame"""
+
+    def __init__(self, seed=0, actions=None, settings=None):
+        self.seed = seed
+        self.actions = list(actions or [])
+        self.settings = settings  # None plays with the settings it is given
+
+    def record(self, keys, shoot):
+        """Add the frame's key state and shoot flag"""
+        self.actions.append(key_action(keys, shoot))
+
+    def save(self, path):
+        """Write the replay to a JSON file"""
+        with open(path, "w", encoding="utf-8") as file:
+            data = {"seed": self.seed, "actions": self.actions}
+            if self.settings is not None:
+                data["settings"] = dataclasses.asdict(self.settings)
+            json.dump(data, file)
+
+    @classmethod
+    def load(cls, path):
+        """Read a replay written by save"""
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+        settings = data.get("settings")
+        if settings is not None:
+            settings = DEFAULT_SETTINGS.replace(**settings)
+        return cls(data["seed"], data["actions"], settings)
+
+
+def _headless_game(seed, settings):
+    from main import TejasThrust  # main imports pygame display code; load it lazily
+
+    # Deterministic, so a replay renders the same on any machine
+    game = TejasThrust(mode="headless", settings=settings, deterministic=True)
+    game.particles.adaptive = False  # frames must not depend on machine speed
+    game.reset(seed)
+    return game
+
+
+def export_replay(replay, path, settings=DEFAULT_SETTINGS):
+    """Render a replay to video without a window, as fast as possible
+
+    A replay that stores its settings is played with those, so it renders
+    the game that was recorded whatever the current profile is.
+    """
+    game = _headless_game(replay.seed, replay.settings or settings)
+    capture = FrameCapture(path, fps=game.fps)
+    try:
+        for action in replay.actions:
+            keys, shoot = action_keys(action)
+            if shoot:
+                game.player_shoot()
+            game.update(keys)
+            game.render()
+            capture.capture(game.screen, block=True)
+            if game.game_over:
+                break
+    finally:
+        capture.close()
+        game.telemetry.close()
+    return capture.frames
+
+
+def record_autopilot(seconds, seed=0, settings=DEFAULT_SETTINGS):
+    """Let the autopilot play a headless game and return the replay"""
+    from src.autopilot import Autopilot
+
+    game = _headless_game(seed, settings)
+    autopilot = Autopilot()
+    replay = Replay(seed, settings=settings)
+    for _ in range(int(seconds * game.fps)):
+        keys, shoot = autopilot.decide(game)
+        replay.record(keys, shoot)
+        if shoot:
+            game.player_shoot()
+        game.update(keys)
+        if game.game_over:
+            break
+    game.telemetry.close()
+    return replay
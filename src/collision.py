@@ -0,0 +1,80 @@
+"""
+Collision helpers for TejasThrust game
+"""
+
+import numpy as np
+import pygame
+
+
+def capsule_hits_rect(x0, y0, x1, y1, radius, rect):
+    """Check if a capsule (segment with a radius) overlaps a rectangle
+
+    The rectangle is grown by the capsule radius and clipped against the
+    segment, which is exact everywhere except the rounded corners, where it
+    errs on the side of a hit.
+    """
+    grown = rect.inflate(radius * 2, radius * 2)
+    return bool(grown.clipline((x0, y0), (x1, y1)))
+
+
+def sweep_hits(starts, ends, radii, rects):
+    """Batched capsule-versus-rectangle test for many segments and rectangles
+
+    starts and ends are (N, 2) arrays of segment end points, radii an (N,)
+    array and rects an (M, 4) array of x, y, width, height. Each rectangle
+    is grown by the radius and clipped against each segment (the slab
+    method), with the same rounded-corner leeway as capsule_hits_rect.
+    Returns an (N, M) boolean array.
+    """
+    p0 = starts[:, None, :]
+    d = (ends - starts)[:, None, :]
+    r = radii[:, None, None]
+    lo = rects[None, :, :2] - r
+    hi = rects[None, :, :2] + rects[None, :, 2:] + r
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t0 = (lo - p0) / d
+        t1 = (hi - p0) / d
+    t_near = np.minimum(t0, t1)
+    t_far = np.maximum(t0, t1)
+    # Along an axis the segment doesn't move on, it is inside the slab throughout or never
+    still = np.broadcast_to(d == 0, t_near.shape)
+    inside = (p0 >= lo) & (p0 <= hi)
+    t_near = np.where(still, np.where(inside, -np.inf, np.inf), t_near)
+    t_far = np.where(still, np.where(inside, np.inf, -np.inf), t_far)
+    enter = t_near.max(axis=2)
+    leave = t_far.min(axis=2)
+    return (enter <= leave) & (leave >= 0) & (enter <= 1)
+
+
+def swept_candidates(lasers, planes):
+    """Which lasers may have hit which planes since the last update
+
+    One batched broad phase over every laser's sweep and every plane's
+    rectangle; returns an (N lasers, M planes) boolean array.
+    """
+    count = len(lasers)
+    sweeps = np.fromiter((v for laser in lasers for point in laser.get_sweep() for v in point),
+                         float, count * 4).reshape(count, 2, 2)
+    radii = np.fromiter((laser.width / 2 for laser in lasers), float, count)
+    rects = np.array([tuple(plane.get_rect()) for plane in planes], float).reshape(-1, 4)
+    return sweep_hits(sweeps[:, 0], sweeps[:, 1], radii, rects)
+
+
+_rect_masks = {}  # (width, height) -> fully set mask
+
+
+def rect_mask(size):
+    """Get a cached, fully set mask of the given size"""
+    mask = _rect_masks.get(size)
+    if mask is None:
+        mask = pygame.Mask(size, fill=True)
+        _rect_masks[size] = mask
+    return mask
+
+
+def rect_hits_mask(rect, mask, mask_topleft):
+    """Check if a rectangle overlaps any set pixel of a mask"""
+    if rect.width <= 0 or rect.height <= 0:
+        return False
+    offset = (rect.x - mask_topleft[0], rect.y - mask_topleft[1])
+    return mask.overlap(rect_mask(rect.size), offset) is not None
@@ -1,57 +1,270 @@
-"""
-Configuration constants for TejasThrust game
-"""
-
-# Screen dimensions
-SCREEN_WIDTH = 1200
-SCREEN_HEIGHT = 800
-
-# Colors
-SKY_COLOR = (135, 206, 235)  # Sky blue
-PLAYER_COLOR = (0, 100, 255)  # Blue
-ENEMY_COLOR = (50, 50, 50)  # Dark gray/black
-BOSS_COLOR = (255, 50, 50)  # Red for boss plane
-LASER_COLOR = (255, 255, 0)  # Yellow
-WHITE = (255, 255, 255)
-BLACK = (0, 0, 0)
-RED = (255, 0, 0)
-GREEN = (0, 255, 0)
-CLOUD_COLOR = (255, 255, 255)
-
-# Game settings
-FPS = 60
-PLAYER_MAX_HEALTH = 100
-ENEMY_HEALTH = 2
-BOSS_HEALTH = 5
-BOSS_LASER_DAMAGE = 5
-PLAYER_SPEED = 5
-ENEMY_SPEED = 2
-BOSS_SPEED = 1.5
-LASER_SPEED = 8
-ENEMY_LASER_SPEED = 10
-BOSS_LASER_SPEED = 12
-
-# Spawning
-ENEMY_SPAWN_INTERVAL = 1000  # milliseconds
-ENEMY_SHOOT_CHANCE = 0.015  # probability per frame
-BOSS_SHOOT_CHANCE = 0.03  # probability per frame
-
-# Burst mode settings for enemy planes
-ENEMY_BURST_CHANCE = 0.002  # probability per frame to activate burst mode (0.2%)
-ENEMY_BURST_SHOTS = 3  # number of shots in burst sequence
-
-# Plane dimensions
-PLANE_WIDTH = 60
-PLANE_HEIGHT = 40
-BOSS_WIDTH = 100
-BOSS_HEIGHT = 60
-LASER_WIDTH = 4
-LASER_HEIGHT = 10
-
-# UI settings
-FONT_SIZE = 24
-BUTTON_WIDTH = 80
-BUTTON_HEIGHT = 40
-
-# Game progression
-BOSS_SPAWN_COUNT = 50  # Enemy kills before boss appears
+"""
+Configuration constants for TejasThrust game
+"""
+
+# Screen dimensions
+SCREEN_WIDTH = 1200
+SCREEN_HEIGHT = 800
+
+# Colors
+SKY_COLOR = (135, 206, 235)  # Sky blue
+PLAYER_COLOR = (0, 100, 255)  # Blue
+ENEMY_COLOR = (50, 50, 50)  # Dark gray/black
+BOSS_COLOR = (255, 50, 50)  # Red for boss plane
+LASER_COLOR = (255, 255, 0)  # Yellow
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+RED = (255, 0, 0)
+GREEN = (0, 255, 0)
+ORANGE = (255, 165, 0)
+CLOUD_COLOR = (250, 250, 250)  # not WHITE, so palettes can recolor clouds alone
+BOSS_TRAIL_COLOR = (255, 100, 100)
+
+# Palettes: the color shown for each base color above (see src/accessibility.py).
+# Colors a palette doesn't list are shown unchanged. Palettes are keyed by
+# value, so every base color must be distinct.
+PALETTES = {
+    "default": {},
+    # Okabe-Ito colors, told apart with every common kind of color blindness
+    "colorblind": {
+        RED: (213, 94, 0),  # vermillion
+        BOSS_COLOR: (213, 94, 0),
+        BOSS_TRAIL_COLOR: (230, 159, 0),
+        GREEN: (0, 114, 178),  # blue
+        ORANGE: (240, 228, 66),  # yellow
+    },
+    # Bright planes and lasers on a dark sky
+    "high_contrast": {
+        SKY_COLOR: (10, 10, 40),
+        CLOUD_COLOR: (70, 70, 100),
+        ENEMY_COLOR: (255, 255, 255),
+        PLAYER_COLOR: (0, 220, 255),
+        BOSS_COLOR: (255, 0, 255),
+    },
+}
+
+# Accessibility presets: a palette, a HUD size and a game speed
+ACCESSIBILITY_PRESETS = {
+    "standard": {},
+    "colorblind": {"palette": "colorblind"},
+    "high_contrast": {"palette": "high_contrast"},
+    "large_hud": {"hud_scale": 1.5},
+    "slow": {"game_speed": 0.7},
+    "kids": {"palette": "colorblind", "hud_scale": 1.5, "game_speed": 0.7},
+}
+
+# Game settings
+FPS = 60
+PLAYER_MAX_HEALTH = 100
+ENEMY_HEALTH = 2
+BOSS_HEALTH = 5
+BOSS_LASER_DAMAGE = 5
+PLAYER_SPEED = 5
+ENEMY_SPEED = 2
+BOSS_SPEED = 1.5
+LASER_SPEED = 8
+ENEMY_LASER_SPEED = 10
+BOSS_LASER_SPEED = 12
+
+# Spawning
+ENEMY_SPAWN_INTERVAL = 1000  # milliseconds
+ENEMY_SHOOT_CHANCE = 0.015  # probability per frame
+
+# Burst mode settings for enemy planes
+ENEMY_BURST_CHANCE = 0.002  # probability per frame to activate burst mode (0.2%)
+ENEMY_BURST_SHOTS = 3  # number of shots in burst sequence
+
+# Plane dimensions
+PLANE_WIDTH = 60
+PLANE_HEIGHT = 40
+BOSS_WIDTH = 100
+BOSS_HEIGHT = 60
+SPRITE_PADDING = 6  # room around cached plane sprites for boss wing tips
+LASER_WIDTH = 4
+LASER_HEIGHT = 10
+
+# Projectile behaviors
+LASER_STRAIGHT = "straight"  # flies along its initial velocity
+LASER_AIMED = "aimed"  # straight, but launched towards a target
+LASER_HOMING = "homing"  # steers towards the player for a limited time
+LASER_SINE = "sine"  # weaves left and right as it flies
+HOMING_MAX_STEER = 0.35  # max velocity change per frame (pixels/frame)
+HOMING_DURATION = 90  # frames a homing laser keeps steering
+SINE_AMPLITUDE = 40  # pixels of sideways weave
+SINE_PERIOD = 60  # frames per full weave
+SPREAD_SHOTS = 5  # lasers in a spread volley
+SPREAD_ARC = 60  # degrees covered by a spread volley
+AIM_MAX_ANGLE = 45  # degrees from straight down that an aimed enemy shot may lean
+
+# Boss fights (see BossPlane)
+BOSS_ENTERING = "entering"  # flying down to its station
+BOSS_FIGHTING = "fighting"
+BOSS_REGROUPING = "regrouping"  # holding fire after entering a new phase
+BOSS_PHASES = (
+    # (health fraction that starts the phase, attack patterns,
+    #  volley gap in shoot cooldowns, speed factor)
+    (1.0, (LASER_AIMED, LASER_STRAIGHT), 1.75, 1.0),
+    (0.6, (LASER_AIMED, LASER_HOMING, LASER_STRAIGHT), 1.4, 1.25),
+    (0.3, (LASER_AIMED, LASER_SINE, LASER_HOMING, LASER_STRAIGHT), 1.0, 1.5),
+)
+BOSS_STATION_Y = 100  # height bosses fight at
+BOSS_ENTRY_SPEED = 2  # pixels per frame while flying in
+BOSS_REGROUP_TIME = 1000  # milliseconds without firing between phases
+BOSS_MOVE_INTERVAL = (500, 1500)  # milliseconds between direction changes
+BOSS_MAX_CONCURRENT = 3  # most bosses in one wave
+BOSS_WAVE_GROWTH = 2  # boss waves before each wave gets another boss
+BOSS_ESCORT_SPAWN_FACTOR = 3  # regular enemies spawn this much slower during boss waves
+
+# Power-ups dropped by destroyed planes (see src/powerups.py). Timed ones
+# stack: each pickup adds its modifiers for `duration` milliseconds
+POWERUPS = {
+    "spread": {"color": (255, 140, 0), "weight": 3, "duration": 8000, "modifiers": {"extra_shots": 2}},
+    "rapid": {"color": (255, 230, 0), "weight": 3, "duration": 6000, "modifiers": {"cooldown_factor": 0.5}},
+    "shield": {"color": (0, 200, 255), "weight": 2, "duration": 5000, "modifiers": {"shield": 1}},
+    "repair": {"color": GREEN, "weight": 2, "heal": 25},  # instant
+}
+POWERUP_MODIFIERS = {  # name -> (value with no power-ups, how pickups combine)
+    "extra_shots": (0, "add"),
+    "cooldown_factor": (1.0, "multiply"),
+    "shield": (0, "add"),
+}
+POWERUP_DROP_CHANCE = 0.2  # per regular enemy shot down; bosses always drop one
+POWERUP_POOL_SIZE = 16  # pickups that can be falling at once
+POWERUP_FALL_SPEED = 2  # pixels per frame
+POWERUP_SIZE = 24
+PLAYER_MAX_SHOTS = 5  # lasers per shot with stacked spread power-ups
+PLAYER_MIN_COOLDOWN_FACTOR = 0.25  # fastest stacked rapid fire
+PLAYER_SPREAD_ARC = 30  # degrees covered by a spread shot
+
+# Hit feedback (see src/effects.py)
+HIT_FLASH_FRAMES = 6  # frames a hit plane is drawn brightened
+HIT_FLASH_TINT = (180, 180, 180)  # added to a hit plane's colors
+DAMAGE_NUMBER_FRAMES = 40  # frames a damage number floats before it is gone
+DAMAGE_NUMBER_RISE = 1  # pixels per frame
+DAMAGE_NUMBER_STAGES = 4  # fade steps, each a cached sprite
+DAMAGE_NUMBER_SIZE = 28
+SHAKE_PER_DAMAGE = 0.5  # shake in pixels per point of damage to the player
+SHAKE_BOSS_DEFEATED = 12
+SHAKE_MAX = 16  # pixels
+SHAKE_DECAY = 0.85  # shake left after each frame
+
+# Window scaling
+VIEWPORT_SMOOTH = True  # smoothscale for fractional window scales (scale is faster)
+FIXED_POINT_ONE = 256  # deterministic mode keeps positions on a 1/256 pixel grid
+THREADED_RENDER = False  # draw frame N on a render thread while frame N+1 is simulated
+
+# Draw order for the render queue, lowest first (particles and UI follow)
+LAYER_CLOUDS = 0
+LAYER_PICKUPS = 1
+LAYER_PLANES = 2
+LAYER_HEALTH_BARS = 3  # and the player's shield
+LAYER_LASERS = 4
+LAYER_EFFECTS = 5  # floating damage numbers
+LASER_SPRITE_ANGLES = 72  # pre-rotated sprites for angled lasers (every 5 degrees)
+LASER_TRAIL_ALPHA = 200  # opacity where a boss laser's trail meets the laser
+
+# UI settings
+FONT_SIZE = 24
+BUTTON_WIDTH = 80
+BUTTON_HEIGHT = 40
+
+# Particle effects
+PARTICLE_CAPACITY = 1024  # hard cap on live particles
+PARTICLE_FRAME_BUDGET_MS = 2.0  # drawing time before particles are thinned out
+PARTICLE_MIN_DRAW = 64  # never thin out below this many particles
+PARTICLE_DRAG = 0.94  # velocity kept per frame
+PARTICLE_STAGES = 8  # pre-rendered fade steps per color
+PARTICLE_SIZE = 12  # sprite size in pixels
+EXPLOSION_PARTICLES = 40  # particles in a regular enemy explosion
+BOSS_EXPLOSION_SIZE = 8  # boss explosions are this many times bigger
+CONTRAIL_INTERVAL = 3  # frames between contrail puffs
+PARTICLE_FIRE = 0  # rows in PARTICLE_COLORS
+PARTICLE_SMOKE = 1
+PARTICLE_SPARK = 2
+PARTICLE_CONTRAIL = 3
+PARTICLE_COLORS = [(255, 160, 40), (110, 110, 110), (255, 255, 150), (255, 255, 255)]
+
+# Telemetry
+TELEMETRY_ENABLED = False  # write gameplay events to TELEMETRY_DIR
+TELEMETRY_DIR = "telemetry"
+TELEMETRY_MAX_QUEUE = 10000  # events waiting to be written before dropping
+TELEMETRY_FLUSH_INTERVAL = 1.0  # seconds between background writes
+TELEMETRY_MAX_FILE_BYTES = 5 * 1024 * 1024  # rotate files at this size
+TELEMETRY_MAX_FILES = 20  # oldest files are deleted beyond this count
+TELEMETRY_FRAME_SAMPLE_INTERVAL = 60  # frames between frame-time samples
+
+# High scores
+SCORES_DB_PATH = "~/.tejasthrust/scores.db"
+LEADERBOARD_SIZE = 5  # entries shown on the game over screen
+PLAYER_NAME = "Pilot"  # profile used for recorded sessions
+
+# Reinforcement-learning environment
+OBS_MAX_ENEMIES = 8  # nearest enemies included in vector observations
+OBS_MAX_BOSSES = BOSS_MAX_CONCURRENT
+OBS_MAX_ENEMY_LASERS = 16
+OBS_MAX_PLAYER_LASERS = 8
+OBS_FRAME_SIZE = (84, 84)  # downsampled frame observations (width, height)
+ENV_MAX_STEPS = 10000  # episode length before truncation
+ENV_DAMAGE_PENALTY = 0.1  # reward lost per point of health lost
+WORLDS_BENCHMARK_SECONDS = 10  # default length of a --worlds throughput run
+
+# Autopilot and soak testing
+AUTOPILOT_LOOKAHEAD = 24  # frames of enemy laser travel projected ahead
+AUTOPILOT_CELL = 16  # danger map cell size in pixels
+AUTOPILOT_MARGIN = 8  # extra room kept around the player's rect
+AUTOPILOT_HOME_Y = SCREEN_HEIGHT - 120  # height the autopilot likes to fly at
+SOAK_SAMPLE_INTERVAL = 60  # seconds between soak report samples
+
+# Memory watchdog
+WATCHDOG_INTERVAL = 120  # seconds between samples
+WATCHDOG_WINDOW = 10  # samples that must all grow before warning
+WATCHDOG_COUNT_GROWTH = 50  # objects gained over the window that count as growth
+WATCHDOG_RSS_GROWTH_MB = 20  # memory gained over the window that counts as growth
+WATCHDOG_TRACE_FRAMES = 1  # stack depth recorded by tracemalloc
+WATCHDOG_TOP_SITES = 10  # allocation sites logged or dumped
+WATCHDOG_DUMP_TYPES = 40  # object types listed in a heap summary
+WATCHDOG_DUMP_DIR = "heap_dumps"
+WATCHDOG_SCAN_CHUNK = 2000  # objects scanned between GIL hand-backs
+
+# Frame capture and video export
+CAPTURE_BUFFERS = 8  # preallocated frames waiting for the encoder thread
+EXPORT_SECONDS = 30  # length of autopilot clips when no replay is given
+
+# Adaptive difficulty (see src/director.py)
+DIRECTOR_ENABLED = True
+DIRECTOR_INTERVAL = 1000  # milliseconds of game time between adjustments
+DIRECTOR_WINDOW = 20000  # milliseconds of play used to judge the player
+DIRECTOR_START_INTENSITY = 1.0  # 1.0 plays exactly as the settings say
+DIRECTOR_MIN_INTENSITY = 0.5  # spawn half as often and fire half as much
+DIRECTOR_MAX_INTENSITY = 1.6
+DIRECTOR_STEP = 0.05  # intensity change per adjustment
+DIRECTOR_DAMAGE_PER_MIN = 40  # health lost per minute that counts as struggling
+DIRECTOR_LOW_HEALTH = 0.3  # fraction of max health that counts as struggling
+DIRECTOR_KILLS_PER_MIN = 15  # kills per minute that count as cruising
+DIRECTOR_MAX_ENEMIES = 8  # enemies on screen at once at intensity 1.0
+DIRECTOR_MAX_ENTITIES = 120  # enemies plus enemy lasers on a fast machine
+DIRECTOR_MIN_ENTITIES = 16  # the entity budget never drops below this
+DIRECTOR_FRAME_BUDGET = 0.8  # share of a frame the game may use before the budget shrinks
+DIRECTOR_FRAME_SMOOTHING = 0.1  # weight of the newest frame time in the average
+
+# Start-up (see src/startup.py)
+STARTUP_IMPORT_BUDGET_MS = 1000  # longest acceptable time to import main.py
+
+# Assets (see src/assets.py)
+ASSET_DIR = "assets"
+ASSET_BUNDLE_PATH = "assets.bundle"  # built by main.py --build-assets, used when present
+ATLAS_MAX_SIZE = 2048  # texture atlas width and height in pixels
+ATLAS_PADDING = 1  # empty pixels between packed sprites
+MUSIC_ASSET = "sounds/TT.wav"
+
+# Browser build (see src/web.py)
+WEB_FPS = 30  # frame rate cap in the browser
+WEB_PARTICLE_CAPACITY = 256  # smaller particle buffer than PARTICLE_CAPACITY
+WEB_STREAM_DELAY_FRAMES = 1  # frames shown before music and fonts start loading
+
+# Runtime settings (see src/settings.py)
+SETTINGS_PATH = "settings.json"  # profiles that override the values above
+SETTINGS_POLL_INTERVAL = 1.0  # seconds between checks for settings file changes
+
+# Game progression
+BOSS_SPAWN_COUNT = 50  # Enemy kills before boss appears
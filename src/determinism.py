@@ -0,0 +1,100 @@
+"""
+Deterministic simulation for TejasThrust game
+
+A seeded game normally repeats itself on the same machine, but not
+necessarily on another one: the random module's helpers (randint, choice,
+uniform) have changed between Python versions, trigonometry comes from the
+platform's maths library, and every subsystem shares the one global random
+sequence, so a change in how often one of them rolls shifts all the others.
+
+In deterministic mode the game instead:
+
+* gives each subsystem (spawning, clouds, enemies, bosses, particles) its
+  own stream derived from the game seed. `StableRandom` builds its helpers
+  on `random()` alone, whose output for an integer seed Python guarantees
+  not to change;
+* puts every position and laser velocity back on a grid of
+  1/FIXED_POINT_ONE pixel after each update. Values stay floats, so all
+  code reading `x` and `y` works unchanged, but each one is an integer
+  number of grid steps and exactly representable. Rounding errors cannot
+  build up, and platform differences in the last bit of a sine or square
+  root are rounded away.
+
+Particles use a NumPy generator seeded from their stream. They only affect
+what is drawn, never the game state.
+"""
+
+import random
+import zlib
+from src.config import *
+
+
+class StableRandom(random.Random):
+    """random.Random whose helpers give the same numbers on every Python version"""
+
+    def randint(self, a, b):
+        return a + int(self.random() * (b - a + 1))
+
+    def choice(self, seq):
+        return seq[int(self.random() * len(seq))]
+
+    def uniform(self, a, b):
+        return a + (b - a) * self.random()
+
+
+class RandomStreams:
+    """One StableRandom per subsystem, all derived from one game seed"""
+
+    def __init__(self, seed):
+        self.seed = seed
+        self._streams = {}
+
+    def __getitem__(self, name):
+        stream = self._streams.get(name)
+        if stream is None:
+            stream = self._streams[name] = StableRandom(self.derive(name))
+        return stream
+
+    def derive(self, name):
+        """A 32-bit seed for a subsystem, the same on every machine"""
+        return zlib.crc32(f"{self.seed}:{name}".encode("utf-8"))
+
+
+def to_fixed(value):
+    """A coordinate as a whole number of 1/FIXED_POINT_ONE pixel steps"""
+    return round(value * FIXED_POINT_ONE)
+
+
+def snap(value):
+    """Round a coordinate to the fixed-point grid"""
+    return round(value * FIXED_POINT_ONE) / FIXED_POINT_ONE
+
+
+def snap_world(game):
+    """Put every plane, laser, cloud and pickup back on the fixed-point grid"""
+    for thing in [game.player, *game.enemies, *game.bosses, *game.clouds, *game.pickups]:
+        thing.x = snap(thing.x)
+        thing.y = snap(thing.y)
+    for laser in game.player_lasers + game.enemy_lasers:
+        laser.x = snap(laser.x)
+        laser.y = snap(laser.y)
+        laser.vx = snap(laser.vx)
+        laser.vy = snap(laser.vy)
+
+
+def state_checksum(game):
+    """CRC-32 of the game state on the fixed-point grid
+
+    Two runs (or two lock-step peers) that agree on every frame's checksum
+    have played the same game.
+    """
+    values = [game.frame_count, game.score, game.player_health, game.enemies_killed]
+    for thing in [game.player, *game.enemies, *game.bosses, *game.player_lasers, *game.enemy_lasers]:
+        values += (to_fixed(thing.x), to_fixed(thing.y))
+    for plane in game.enemies + game.bosses:
+        values.append(plane.health)
+    for pickup in game.pickups:
+        values += (pickup.kind, to_fixed(pickup.x), to_fixed(pickup.y))
+    for expires, kind in game.player.modifiers.active:  # what shot_count and shielded follow
+        values += (kind, expires)
+    return zlib.crc32(",".join(map(str, values)).encode("ascii"))
@@ -0,0 +1,103 @@
+"""
+Adaptive difficulty for TejasThrust game
+
+The director watches how the player is doing (damage taken and enemies
+killed over the last few seconds) and how long frames take, and adjusts the
+game within fixed bounds:
+
+* an intensity between DIRECTOR_MIN_INTENSITY and DIRECTOR_MAX_INTENSITY
+  scales the enemy spawn interval, the number of enemies allowed at once,
+  how often enemies fire and how quickly bosses follow up their volleys;
+* an entity budget caps enemies plus enemy lasers, shrinking quickly when
+  frames run over DIRECTOR_FRAME_BUDGET and growing back slowly.
+
+It only re-evaluates every DIRECTOR_INTERVAL milliseconds of game time and
+writes its results into the game's plain attributes, so the frame loop reads
+them at no extra cost. Headless games never report frame times, so their
+difficulty depends only on play.
+"""
+
+import collections
+from src.config import *
+from src.settings import DEFAULT_SETTINGS
+
+
+class Director:
+    """Adjusts spawn rate, enemy cap and fire rate to the player and the machine"""
+
+    def __init__(self, settings=DEFAULT_SETTINGS, enabled=DIRECTOR_ENABLED):
+        self.enabled = enabled
+        self.apply_settings(settings)
+        self.reset()
+
+    def apply_settings(self, settings):
+        """Take new base values from settings"""
+        self.base_spawn_interval = settings.enemy_spawn_interval
+        self.base_enemy_shoot_chance = settings.enemy_shoot_chance
+        self.frame_budget_ms = 1000 / settings.fps * DIRECTOR_FRAME_BUDGET
+
+    def reset(self):
+        """Start a new game at the starting intensity"""
+        self.intensity = DIRECTOR_START_INTENSITY if self.enabled else 1.0
+        self.entity_budget = DIRECTOR_MAX_ENTITIES
+        self.frame_ms = 0.0  # smoothed frame time, 0 until frames are reported
+        self.history = collections.deque()  # (time, health, kills), oldest first
+        self.next_update = 0
+
+    def frame(self, frame_ms):
+        """Report how long the last frame took to simulate and draw"""
+        if self.frame_ms == 0:
+            self.frame_ms = frame_ms
+        else:
+            self.frame_ms += (frame_ms - self.frame_ms) * DIRECTOR_FRAME_SMOOTHING
+
+    def update(self, game):
+        """Re-evaluate once per DIRECTOR_INTERVAL and apply the result to the game"""
+        now = game.ticks()
+        if now < self.next_update:
+            return
+        self.next_update = now + DIRECTOR_INTERVAL
+        before = (self.intensity, self.entity_budget)
+        if self.enabled:
+            self._adjust_intensity(now, game.player_health, game.enemies_killed)
+            self._adjust_entity_budget()
+        if (self.intensity, self.entity_budget) != before:
+            game.telemetry.emit("difficulty", intensity=round(self.intensity, 2),
+                                entity_budget=self.entity_budget)
+        self.apply(game)
+
+    def _adjust_intensity(self, now, health, kills):
+        history = self.history
+        history.append((now, health, kills))
+        while now - history[0][0] > DIRECTOR_WINDOW:
+            history.popleft()
+        then, old_health, old_kills = history[0]
+        minutes = (now - then) / 60000
+        if minutes < DIRECTOR_WINDOW / 120000:
+            return  # not enough history yet
+        damage_per_min = (old_health - health) / minutes
+        kills_per_min = (kills - old_kills) / minutes
+
+        if damage_per_min > DIRECTOR_DAMAGE_PER_MIN or health < PLAYER_MAX_HEALTH * DIRECTOR_LOW_HEALTH:
+            self.intensity -= DIRECTOR_STEP  # struggling: ease off
+        elif damage_per_min < DIRECTOR_DAMAGE_PER_MIN / 3 and kills_per_min >= DIRECTOR_KILLS_PER_MIN:
+            self.intensity += DIRECTOR_STEP  # cruising: push a little harder
+        self.intensity = min(max(self.intensity, DIRECTOR_MIN_INTENSITY), DIRECTOR_MAX_INTENSITY)
+
+    def _adjust_entity_budget(self):
+        if self.frame_ms > self.frame_budget_ms:
+            self.entity_budget = max(DIRECTOR_MIN_ENTITIES, int(self.entity_budget * 0.75))
+        elif self.entity_budget < DIRECTOR_MAX_ENTITIES:
+            self.entity_budget = min(DIRECTOR_MAX_ENTITIES, self.entity_budget + 4)
+
+    def apply(self, game):
+        """Write the current spawn interval, caps and fire chances into the game"""
+        intensity = self.intensity
+        game.spawn_interval = self.base_spawn_interval / intensity
+        game.enemy_shoot_chance = self.base_enemy_shoot_chance * intensity
+        game.boss_fire_rate = intensity
+        if self.enabled:
+            game.max_enemies = min(max(1, round(DIRECTOR_MAX_ENEMIES * intensity)), self.entity_budget // 2)
+            game.max_enemy_lasers = self.entity_budget - game.max_enemies
+        else:
+            game.max_enemies = game.max_enemy_lasers = float("inf")
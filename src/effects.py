@@ -0,0 +1,119 @@
+"""
+Hit feedback for TejasThrust game
+
+Three effects show that a hit landed:
+
+* hit flash: a damaged plane is drawn with a brightened copy of its sprite
+  for a few frames. The tinted copy is made once per plane sprite and cached;
+* damage numbers: "-1", "-5" float up from the hit and fade out. Digit glyphs
+  are rendered once, and each number's fade steps are composed once and
+  cached;
+* screen shake: player hits and boss kills shake the view. The shake is one
+  offset applied where the finished frame is copied to the window (see
+  Viewport.present); nothing is drawn differently.
+
+Updating is a few arithmetic operations per active effect, and nothing at
+all when no effects are running.
+"""
+
+import random
+import pygame
+from src.config import *
+from src.accessibility import PALETTE
+
+
+class Effects:
+    """Hit flashes, floating damage numbers and screen shake"""
+
+    def __init__(self):
+        self.rng = random.Random()
+        self.flashes = {}  # plane -> frames left
+        self.numbers = []  # [x, y, text, color, frame]
+        self.shake_strength = 0.0
+        self.shake_offset = (0, 0)
+        self._font = None
+        self._glyphs = {}  # (character, color) -> rendered glyph
+        self._number_sprites = {}  # (text, color, stage) -> faded number sprite
+
+    def seed(self, seed):
+        """Make the shake repeatable"""
+        self.rng.seed(seed)
+
+    def clear(self):
+        """End every effect"""
+        for plane in self.flashes:
+            plane.flashing = False
+        self.flashes.clear()
+        self.numbers.clear()
+        self.shake_strength = 0.0
+        self.shake_offset = (0, 0)
+
+    def clear_sprites(self):
+        """Forget rendered numbers, so they are rendered again in the current palette"""
+        self._glyphs.clear()
+        self._number_sprites.clear()
+
+    def hit(self, plane, damage, color=WHITE):
+        """Flash a plane and float its damage up from it"""
+        plane.flashing = True
+        self.flashes[plane] = HIT_FLASH_FRAMES
+        self.numbers.append([plane.x, plane.y - plane.height // 2, f"-{damage}", color, 0])
+
+    def shake(self, strength):
+        """Shake the view, adding to any shake still going"""
+        self.shake_strength = min(SHAKE_MAX, self.shake_strength + strength)
+
+    def update(self):
+        """Advance every effect by one frame"""
+        if self.flashes:
+            for plane, frames in list(self.flashes.items()):
+                if frames <= 1:
+                    plane.flashing = False
+                    del self.flashes[plane]
+                else:
+                    self.flashes[plane] = frames - 1
+
+        if self.numbers:
+            for number in self.numbers:
+                number[1] -= DAMAGE_NUMBER_RISE
+                number[4] += 1
+            self.numbers = [number for number in self.numbers if number[4] < DAMAGE_NUMBER_FRAMES]
+
+        if self.shake_strength >= 0.5:
+            strength = self.shake_strength
+            self.shake_offset = (round(self.rng.uniform(-strength, strength)),
+                                 round(self.rng.uniform(-strength, strength)))
+            self.shake_strength *= SHAKE_DECAY
+        else:
+            self.shake_strength = 0.0
+            self.shake_offset = (0, 0)
+
+    def sprites(self):
+        """(sprite, top-left) of every floating damage number"""
+        result = []
+        for x, y, text, color, frame in self.numbers:
+            sprite = self._number_sprite(text, color, frame * DAMAGE_NUMBER_STAGES // DAMAGE_NUMBER_FRAMES)
+            result.append((sprite, (int(x) - sprite.get_width() // 2, int(y) - sprite.get_height())))
+        return result
+
+    def _glyph(self, character, color):
+        glyph = self._glyphs.get((character, color))
+        if glyph is None:
+            if self._font is None:
+                self._font = pygame.font.Font(None, DAMAGE_NUMBER_SIZE)
+            glyph = self._glyphs[(character, color)] = self._font.render(character, True, PALETTE[color])
+        return glyph
+
+    def _number_sprite(self, text, color, stage):
+        sprite = self._number_sprites.get((text, color, stage))
+        if sprite is None:
+            glyphs = [self._glyph(character, color) for character in text]
+            sprite = pygame.Surface((sum(glyph.get_width() for glyph in glyphs),
+                                     max(glyph.get_height() for glyph in glyphs)), pygame.SRCALPHA)
+            x = 0
+            for glyph in glyphs:
+                sprite.blit(glyph, (x, 0))
+                x += glyph.get_width()
+            sprite.set_alpha(255 * (DAMAGE_NUMBER_STAGES - stage) // DAMAGE_NUMBER_STAGES)
+            self._number_sprites[(text, color, stage)] = sprite
+        return sprite
@@ -0,0 +1,248 @@
+"""
+Reinforcement-learning environments for TejasThrust game
+
+`TejasThrustEnv` wraps a headless game in the familiar Gym-style
+reset()/step(action) interface. Vector environments step many games at
+once, either in this process (`SyncVectorEnv`) or one game per worker
+process (`SubprocVectorEnv`).
+"""
+
+import multiprocessing
+import numpy as np
+import pygame
+from src.config import *
+
+# Discrete actions: every combination of 8-way movement (or none) and shooting
+MOVES = [(0, 0), (-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (1, -1), (-1, 1), (1, 1)]
+ACTIONS = [(dx, dy, shoot) for shoot in (False, True) for dx, dy in MOVES]
+
+OBS_PLAYER = 3  # x, y, health
+OBS_HOSTILE = 4  # present, x, y, health
+OBS_LASER = 5  # present, x, y, vx, vy
+OBSERVATION_SIZE = (OBS_PLAYER + (OBS_MAX_ENEMIES + OBS_MAX_BOSSES) * OBS_HOSTILE
+                    + OBS_MAX_ENEMY_LASERS * OBS_LASER + OBS_MAX_PLAYER_LASERS * OBS_LASER)
+
+
+def action_keys(action):
+    """Turn a discrete action into a key state usable by PlayerPlane.update"""
+    dx, dy, shoot = ACTIONS[action]
+    return {pygame.K_LEFT: dx < 0, pygame.K_RIGHT: dx > 0,
+            pygame.K_UP: dy < 0, pygame.K_DOWN: dy > 0}, shoot
+
+
+def key_action(keys, shoot):
+    """Turn a key state and shoot flag back into a discrete action"""
+    dx = (1 if keys[pygame.K_RIGHT] else 0) - (1 if keys[pygame.K_LEFT] else 0)
+    dy = (1 if keys[pygame.K_DOWN] else 0) - (1 if keys[pygame.K_UP] else 0)
+    return ACTIONS.index((dx, dy, bool(shoot)))
+
+
+class TejasThrustEnv:
+    """Gym-style environment around a headless TejasThrust game
+
+    Observations are either a flat float32 vector of positions (the default)
+    or a downsampled RGB frame when `observation` is "frame".
+    """
+
+    def __init__(self, observation="vector", frame_size=OBS_FRAME_SIZE, frame_skip=1,
+                 max_steps=ENV_MAX_STEPS, seed=None, mode="headless", deterministic=False):
+        from main import TejasThrust  # main imports pygame display code; load it lazily
+
+        self.observation = observation
+        self.frame_size = frame_size
+        self.frame_skip = frame_skip
+        self.max_steps = max_steps
+        self.action_count = len(ACTIONS)
+        self.observation_size = OBSERVATION_SIZE
+        # Deterministic worlds replay identically on every machine (src/determinism.py)
+        self.game = TejasThrust(mode=mode, deterministic=deterministic)
+        self.steps = 0
+        self._seed = seed
+        self._obs = np.zeros(OBSERVATION_SIZE, np.float32)
+
+    def reset(self, seed=None):
+        """Start a new episode and return (observation, info)"""
+        seed = self._seed if seed is None else seed
+        self.game.reset(seed)
+        self.steps = 0
+        return self._observe(), self._info()
+
+    def step(self, action):
+        """Apply an action and return (observation, reward, terminated, truncated, info)"""
+        game = self.game
+        keys, shoot = action_keys(action)
+        score = game.score
+        health = game.player_health
+
+        for _ in range(self.frame_skip):
+            if shoot:
+                game.player_shoot()
+            game.update(keys)
+            if game.game_over:
+                break
+        self.steps += 1
+
+        reward = (game.score - score) - ENV_DAMAGE_PENALTY * (health - game.player_health)
+        terminated = game.game_over
+        truncated = not terminated and self.steps >= self.max_steps
+        return self._observe(), float(reward), terminated, truncated, self._info()
+
+    def render(self):
+        """Render the current game and return it as an RGB array (height, width, 3)"""
+        self.game.render()
+        return pygame.surfarray.array3d(self.game.screen).swapaxes(0, 1)
+
+    def close(self):
+        """Release the game's resources"""
+        self.game.telemetry.close()
+
+    def _info(self):
+        game = self.game
+        return {"score": game.score, "health": game.player_health,
+                "kills": game.enemies_killed, "steps": self.steps}
+
+    def _observe(self):
+        if self.observation == "frame":
+            self.game.render()
+            small = pygame.transform.smoothscale(self.game.screen, self.frame_size)
+            return pygame.surfarray.array3d(small).swapaxes(0, 1)
+        return self._observe_vector()
+
+    def _observe_vector(self):
+        """Fill the observation vector: nearest objects first, zeros for empty slots"""
+        game = self.game
+        player = game.player
+        obs = self._obs
+        obs[:] = 0
+        obs[0:3] = (player.x / SCREEN_WIDTH, player.y / SCREEN_HEIGHT,
+                    game.player_health / PLAYER_MAX_HEALTH)
+        i = OBS_PLAYER
+
+        def nearest(items, count):
+            return sorted(items, key=lambda o: (o.x - player.x) ** 2 + (o.y - player.y) ** 2)[:count]
+
+        for enemy in nearest(game.enemies, OBS_MAX_ENEMIES):
+            obs[i:i + 4] = (1, enemy.x / SCREEN_WIDTH, enemy.y / SCREEN_HEIGHT,
+                            enemy.health / enemy.max_health)
+            i += OBS_HOSTILE
+        i = OBS_PLAYER + OBS_MAX_ENEMIES * OBS_HOSTILE
+
+        for boss in nearest(game.bosses, OBS_MAX_BOSSES):
+            obs[i:i + 4] = (1, boss.x / SCREEN_WIDTH, boss.y / SCREEN_HEIGHT,
+                            boss.health / boss.max_health)
+            i += OBS_HOSTILE
+        i = OBS_PLAYER + (OBS_MAX_ENEMIES + OBS_MAX_BOSSES) * OBS_HOSTILE
+
+        for lasers, count in ((game.enemy_lasers, OBS_MAX_ENEMY_LASERS),
+                              (game.player_lasers, OBS_MAX_PLAYER_LASERS)):
+            end = i + count * OBS_LASER
+            for laser in nearest(lasers, count):
+                obs[i:i + 5] = (1, laser.x / SCREEN_WIDTH, laser.y / SCREEN_HEIGHT,
+                                laser.vx / ENEMY_LASER_SPEED, laser.vy / ENEMY_LASER_SPEED)
+                i += OBS_LASER
+            i = end
+        return obs.copy()
+
+
+class SyncVectorEnv:
+    """Step several environments one after another in this process
+
+    Finished environments are reset automatically; the observation returned
+    for them is the first one of the new episode.
+    """
+
+    def __init__(self, env_fns):
+        self.envs = [fn() for fn in env_fns]
+        self.num_envs = len(self.envs)
+
+    def reset(self, seed=None):
+        """Reset every environment; seeds are `seed + index` when given"""
+        results = [env.reset(None if seed is None else seed + i) for i, env in enumerate(self.envs)]
+        return np.stack([obs for obs, _ in results]), [info for _, info in results]
+
+    def step(self, actions):
+        """Step every environment with its action"""
+        results = [_step_autoreset(env, action) for env, action in zip(self.envs, actions)]
+        return _stack_results(results)
+
+    def close(self):
+        """Close every environment"""
+        for env in self.envs:
+            env.close()
+
+
+class SubprocVectorEnv:
+    """Step environments in parallel, one worker process per environment
+
+    `env_fns` must be picklable (for example functools.partial objects) when
+    the "spawn" start method is used.
+    """
+
+    def __init__(self, env_fns, context=None):
+        ctx = multiprocessing.get_context(context)
+        self.num_envs = len(env_fns)
+        self.remotes = []
+        self.processes = []
+        for env_fn in env_fns:
+            remote, worker_remote = ctx.Pipe()
+            process = ctx.Process(target=_worker, args=(worker_remote, env_fn), daemon=True)
+            process.start()
+            worker_remote.close()
+            self.remotes.append(remote)
+            self.processes.append(process)
+
+    def reset(self, seed=None):
+        """Reset every environment; seeds are `seed + index` when given"""
+        for i, remote in enumerate(self.remotes):
+            remote.send(("reset", None if seed is None else seed + i))
+        results = [remote.recv() for remote in self.remotes]
+        return np.stack([obs for obs, _ in results]), [info for _, info in results]
+
+    def step(self, actions):
+        """Step every environment with its action, all workers at once"""
+        for remote, action in zip(self.remotes, actions):
+            remote.send(("step", int(action)))
+        return _stack_results([remote.recv() for remote in self.remotes])
+
+    def close(self):
+        """Stop the worker processes"""
+        for remote in self.remotes:
+            try:
+                remote.send(("close", None))
+            except (BrokenPipeError, EOFError):
+                pass
+        for process in self.processes:
+            process.join(timeout=5)
+
+
+def _step_autoreset(env, action):
+    obs, reward, terminated, truncated, info = env.step(action)
+    if terminated or truncated:
+        info = dict(info, final_observation=obs)
+        obs, _ = env.reset()
+    return obs, reward, terminated, truncated, info
+
+
+def _stack_results(results):
+    obs, rewards, terminated, truncated, infos = zip(*results)
+    return (np.stack(obs), np.array(rewards, np.float32), np.array(terminated),
+            np.array(truncated), list(infos))
+
+
+def _worker(remote, env_fn):
+    """Worker process loop for SubprocVectorEnv"""
+    env = env_fn()
+    try:
+        while True:
+            command, data = remote.recv()
+            if command == "step":
+                remote.send(_step_autoreset(env, data))
+            elif command == "reset":
+                remote.send(env.reset(data))
+            elif command == "close":
+                break
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        env.close()
+        remote.close()
@@ -1,48 +1,165 @@
-"""
-Laser projectile class for TejasThrust game
-"""
-
-import pygame
-from src.config import *
-
-class Laser:
-    """Laser projectile class"""
-    
-    def __init__(self, x, y, speed, color, damage=1):
-        self.x = x
-        self.y = y
-        self.speed = speed
-        self.color = color
-        self.width = LASER_WIDTH
-        self.height = LASER_HEIGHT
-        self.damage = damage  # Amount of damage this laser does
-    
-    def update(self):
-        """Update laser position"""
-        self.y += self.speed
-    
-    def get_rect(self):
-        """Get collision rectangle"""
-        return pygame.Rect(self.x - self.width // 2, self.y - self.height // 2,
-                          self.width, self.height)
-    
-    def draw(self, screen):
-        """Draw the laser"""
-        # Draw laser as a bright rectangle
-        rect = self.get_rect()
-        pygame.draw.rect(screen, self.color, rect)
-        
-        # Add glow effect for player lasers
-        if self.color == LASER_COLOR:
-            glow_rect = pygame.Rect(rect.x - 1, rect.y - 1, rect.width + 2, rect.height + 2)
-            pygame.draw.rect(screen, (255, 255, 150), glow_rect, 1)
-        
-        # Add special effect for boss lasers
-        elif self.damage > 1:
-            # Make boss lasers thicker and with a trail
-            trail_rect = pygame.Rect(rect.x - 1, rect.y - self.speed * 2, 
-                                    rect.width + 2, rect.height + self.speed * 2)
-            pygame.draw.rect(screen, (255, 100, 100, 128), trail_rect)
-            # Add warning outline
-            glow_rect = pygame.Rect(rect.x - 2, rect.y - 2, rect.width + 4, rect.height + 4)
-            pygame.draw.rect(screen, (255, 200, 200), glow_rect, 1)
+"""
+Laser projectile class for TejasThrust game
+"""
+
+import math
+import pygame
+from src.config import *
+from src.accessibility import PALETTE
+from src.collision import capsule_hits_rect
+
+class Laser:
+    """Laser projectile class"""
+    
+    _sprite_cache = {}  # (color, width, height, boss, trail, direction) -> (sprite, center)
+    
+    def __init__(self, x, y, speed, color, damage=1, vx=0.0, behavior=LASER_STRAIGHT):
+        self.x = x
+        self.y = y
+        self.prev_x = x  # position before the last update, for swept collisions
+        self.prev_y = y
+        self.vx = vx  # Sideways velocity, zero for straight vertical shots
+        self.vy = speed
+        self.color = color
+        self.width = LASER_WIDTH
+        self.height = LASER_HEIGHT
+        self.damage = damage  # Amount of damage this laser does
+        self.behavior = behavior
+        self.age = 0  # Frames since the laser was fired
+    
+    @property
+    def speed(self):
+        """Vertical speed (kept for code written before angled lasers)"""
+        return self.vy
+    
+    @speed.setter
+    def speed(self, value):
+        self.vy = value
+    
+    def update(self):
+        """Update laser position"""
+        self.prev_x = self.x
+        self.prev_y = self.y
+        self.x += self.vx
+        self.y += self.vy
+        self.age += 1
+    
+    def is_off_screen(self):
+        """Check if the laser has left the screen in any direction"""
+        return (self.y < -10 or self.y > SCREEN_HEIGHT + 10
+                or self.x < -10 or self.x > SCREEN_WIDTH + 10)
+    
+    def _half_body(self):
+        """Half the laser body as a vector along its direction of travel"""
+        speed = (self.vx * self.vx + self.vy * self.vy) ** 0.5 or 1
+        return self.vx / speed * self.height / 2, self.vy / speed * self.height / 2
+    
+    def get_segment(self):
+        """Get the laser body as a segment along its direction of travel"""
+        half_x, half_y = self._half_body()
+        return (self.x - half_x, self.y - half_y), (self.x + half_x, self.y + half_y)
+    
+    def get_sweep(self):
+        """Segment covered by the body since the last update: tail then, head now
+        
+        Fast lasers move further than their own length each frame; testing
+        the whole sweep means they can't jump over a thin target.
+        """
+        half_x, half_y = self._half_body()
+        return (self.prev_x - half_x, self.prev_y - half_y), (self.x + half_x, self.y + half_y)
+    
+    def get_rect(self):
+        """Get collision rectangle"""
+        return self._rect_at(self.x, self.y)
+    
+    def _rect_at(self, x, y):
+        if self.vx == 0:
+            return pygame.Rect(x - self.width // 2, y - self.height // 2,
+                              self.width, self.height)
+        # Angled lasers: bounding box of the rotated body
+        half_x, half_y = self._half_body()
+        radius = self.width // 2
+        return pygame.Rect(x - abs(half_x) - radius, y - abs(half_y) - radius,
+                          abs(half_x) * 2 + self.width, abs(half_y) * 2 + self.width)
+    
+    def sweep_rects(self):
+        """Rectangles covering the laser body along its path since the last update"""
+        if self.vx == 0 and self.x == self.prev_x:
+            # Straight down or up: one rectangle covers the whole sweep
+            return [self.get_rect().union(self._rect_at(self.prev_x, self.prev_y))]
+        # Angled: the bounding box of a slanted body covers empty space beside
+        # it, so the capsule is covered with body-wide squares instead, at
+        # most half a body width apart
+        (x0, y0), (x1, y1) = self.get_sweep()
+        steps = max(1, math.ceil(math.hypot(x1 - x0, y1 - y0) / (self.width / 2)))
+        half = self.width // 2
+        return [pygame.Rect(round(x0 + (x1 - x0) * i / steps) - half,
+                            round(y0 + (y1 - y0) * i / steps) - half, self.width, self.width)
+                for i in range(steps + 1)]
+    
+    def collides(self, rect):
+        """Check if the laser hit a rectangle anywhere along its last move"""
+        # Tested as a capsule, since the bounding box of an angled or fast
+        # laser is much larger than the laser itself
+        (x0, y0), (x1, y1) = self.get_sweep()
+        return capsule_hits_rect(x0, y0, x1, y1, self.width // 2, rect)
+    
+    @staticmethod
+    def clear_sprites():
+        """Forget every cached sprite, so they are baked again in the current palette"""
+        Laser._sprite_cache.clear()
+    
+    def get_sprite(self):
+        """Get the pre-rendered sprite (glow and trail included) and its center
+        
+        Sprites are shared by every laser that looks the same; angled lasers
+        use the nearest of LASER_SPRITE_ANGLES pre-rotated copies.
+        """
+        if self.vx == 0:
+            direction = 0 if self.vy <= 0 else LASER_SPRITE_ANGLES // 2
+        else:
+            angle = math.degrees(math.atan2(self.vx, -self.vy))  # clockwise from straight up
+            direction = round(angle * LASER_SPRITE_ANGLES / 360) % LASER_SPRITE_ANGLES
+        # Boss lasers leave a trail as long as two frames of travel
+        trail = int(math.hypot(self.vx, self.vy) * 2) if self.damage > 1 else 0
+        key = (self.color, self.width, self.height, self.damage > 1, trail, direction)
+        entry = Laser._sprite_cache.get(key)
+        if entry is None:
+            entry = self._render_sprite(trail, direction)
+            Laser._sprite_cache[key] = entry
+        return entry
+    
+    def _render_sprite(self, trail, direction):
+        """Render the laser flying straight up, then rotate it to its direction"""
+        padding = 2  # room for the glow
+        # The sprite is symmetric around the laser's center, so rotating it
+        # keeps the center in the middle
+        surface = pygame.Surface((self.width + 2 * padding, self.height + 2 * (padding + trail)),
+                                 pygame.SRCALPHA)
+        body = pygame.Rect(padding, padding + trail, self.width, self.height)
+        
+        # Trail fading out behind the laser
+        for row in range(trail):
+            alpha = LASER_TRAIL_ALPHA * (trail - row) // trail
+            pygame.draw.line(surface, (*PALETTE[BOSS_TRAIL_COLOR], alpha), (body.x - 1, body.bottom + row),
+                             (body.right, body.bottom + row))
+        
+        # Draw laser as a bright rectangle
+        surface.fill(PALETTE[self.color], body)
+        
+        # Add glow effect for player lasers
+        if self.color == LASER_COLOR:
+            pygame.draw.rect(surface, (255, 255, 150), body.inflate(2, 2), 1)
+        
+        # Add warning outline for boss lasers
+        elif self.damage > 1:
+            pygame.draw.rect(surface, (255, 200, 200), body.inflate(4, 4), 1)
+        
+        if direction:
+            surface = pygame.transform.rotate(surface, -direction * 360 / LASER_SPRITE_ANGLES)
+        return surface, (surface.get_width() // 2, surface.get_height() // 2)
+    
+    def enqueue(self, render_queue):
+        """Add the laser to a render queue"""
+        sprite, (offset_x, offset_y) = self.get_sprite()
+        render_queue.add(sprite, (int(self.x) - offset_x, int(self.y) - offset_y), LAYER_LASERS)
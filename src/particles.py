@@ -0,0 +1,139 @@
+"""
+Particle effects (explosions, smoke and contrails) for TejasThrust game
+
+Particles live in fixed-size NumPy ring buffers, so emitting never
+allocates and updating is a handful of vectorized operations no matter how
+many particles are alive. When the buffer is full the oldest particles are
+overwritten.
+"""
+
+import copy
+import time
+import numpy as np
+import pygame
+from src.config import *
+from src.accessibility import PALETTE
+
+
+class ParticleAtlas:
+    """Pre-rendered particle sprites, one row per color and one column per age"""
+
+    def __init__(self, colors=PARTICLE_COLORS, stages=PARTICLE_STAGES, size=PARTICLE_SIZE):
+        self.stages = stages
+        self.surface = pygame.Surface((size * stages, size * len(colors)), pygame.SRCALPHA)
+        self.sprites = []  # sprites[color][stage], stage 0 is the youngest
+        for row, color in enumerate(colors):
+            row_sprites = []
+            for stage in range(stages):
+                fade = 1 - stage / stages
+                radius = max(1, int(size / 2 * (0.4 + 0.6 * fade)))
+                cell = pygame.Rect(stage * size, row * size, size, size)
+                pygame.draw.circle(self.surface, (*PALETTE[color], int(255 * fade)), cell.center, radius)
+                row_sprites.append(self.surface.subsurface(cell))
+            self.sprites.append(row_sprites)
+        self.half_size = size // 2
+
+
+class ParticleSystem:
+    """Fixed-capacity particle buffer updated and culled with NumPy"""
+
+    def __init__(self, capacity=PARTICLE_CAPACITY):
+        self.capacity = capacity
+        self.pos = np.zeros((capacity, 2), np.float32)
+        self.vel = np.zeros((capacity, 2), np.float32)
+        self.life = np.zeros(capacity, np.float32)  # frames left, <= 0 is dead
+        self.max_life = np.ones(capacity, np.float32)
+        self.color = np.zeros(capacity, np.int8)  # row in the atlas
+        self.next_slot = 0  # ring buffer write position
+        self.rng = np.random.default_rng()
+        self.atlas = ParticleAtlas()
+        self.draw_limit = capacity  # lowered when drawing runs over budget
+        self.adaptive = True  # False draws every particle, e.g. for video export
+
+    def seed(self, seed):
+        """Make particle effects repeatable"""
+        self.rng = np.random.default_rng(seed)
+
+    def emit(self, x, y, count, speed, color, life, spread=2 * np.pi, heading=0.0):
+        """Emit particles from a point, overwriting the oldest when full"""
+        count = min(count, self.capacity)
+        if count <= 0:
+            return
+        slots = (self.next_slot + np.arange(count)) % self.capacity
+        self.next_slot = (self.next_slot + count) % self.capacity
+
+        angles = heading + self.rng.uniform(-spread / 2, spread / 2, count)
+        speeds = self.rng.uniform(0.2, 1.0, count) * speed
+        lives = self.rng.uniform(0.6, 1.0, count) * life
+        self.pos[slots] = (x, y)
+        self.vel[slots, 0] = np.cos(angles) * speeds
+        self.vel[slots, 1] = np.sin(angles) * speeds
+        self.life[slots] = lives
+        self.max_life[slots] = lives
+        self.color[slots] = color
+
+    def explode(self, x, y, size=1):
+        """Emit a fiery explosion with smoke; size scales the particle count"""
+        self.emit(x, y, int(EXPLOSION_PARTICLES * size), 4 + size, PARTICLE_FIRE, 30 + 10 * size)
+        self.emit(x, y, int(EXPLOSION_PARTICLES * size) // 2, 1.5 + size / 2, PARTICLE_SMOKE, 50 + 10 * size)
+
+    def sparks(self, x, y):
+        """Emit a small burst of sparks for a laser hit"""
+        self.emit(x, y, 6, 3, PARTICLE_SPARK, 12)
+
+    def contrail(self, x, y):
+        """Emit a puff of contrail behind a plane"""
+        self.emit(x, y, 1, 0.5, PARTICLE_CONTRAIL, 25, spread=0.6, heading=np.pi / 2)
+
+    def alive_count(self):
+        """Number of particles still alive"""
+        return int(np.count_nonzero(self.life > 0))
+
+    def snapshot(self):
+        """Copy of the live particles that can be drawn on another thread"""
+        view = copy.copy(self)
+        alive = self.life > 0
+        view.pos = self.pos[alive]
+        view.life = self.life[alive]
+        view.max_life = self.max_life[alive]
+        view.color = self.color[alive]
+        return view
+
+    def clear(self):
+        """Kill every particle"""
+        self.life[:] = 0
+
+    def update(self):
+        """Move, slow down and age all particles in one vectorized step"""
+        self.pos += self.vel
+        self.vel *= PARTICLE_DRAG
+        self.life -= 1
+
+    def draw(self, screen):
+        """Draw live particles, thinning them out if drawing runs over budget"""
+        alive = np.flatnonzero(self.life > 0)
+        if len(alive) == 0:
+            return
+
+        start = time.perf_counter()
+        if len(alive) > self.draw_limit:
+            # Draw an even sample so the whole effect stays visible
+            step = -(-len(alive) // self.draw_limit)
+            alive = alive[::step]
+
+        stages = ((1 - self.life[alive] / self.max_life[alive]) * self.atlas.stages).astype(np.int32)
+        np.clip(stages, 0, self.atlas.stages - 1, out=stages)
+        positions = (self.pos[alive] - self.atlas.half_size).astype(np.int32).tolist()
+        sprites = self.atlas.sprites
+        screen.blits([(sprites[color][stage], position) for color, stage, position
+                      in zip(self.color[alive].tolist(), stages.tolist(), positions)],
+                     doreturn=False)
+
+        # Adjust how many particles may be drawn next frame
+        if not self.adaptive:
+            return
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if elapsed_ms > PARTICLE_FRAME_BUDGET_MS:
+            self.draw_limit = max(PARTICLE_MIN_DRAW, int(self.draw_limit * 0.75))
+        elif self.draw_limit < self.capacity:
+            self.draw_limit = min(self.capacity, self.draw_limit + 16)
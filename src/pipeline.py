@@ -0,0 +1,113 @@
+"""
+Threaded rendering for TejasThrust game
+
+Normally the game loop updates and then draws on one thread, so a slow frame
+to draw holds up the simulation. With the render pipeline the main thread
+simulates frame N+1 while a render thread draws frame N:
+
+* after each update the game takes a `Snapshot`, a copy of everything
+  `render()` reads (planes, lasers, clouds, live particles and the values
+  the UI shows) that the simulation never touches again;
+* the render thread draws the snapshot into one of two canvases and scales
+  it for the window, while the main thread presents the other, finished
+  canvas. Canvases alternate, so the frame being shown or captured is never
+  the one being drawn.
+
+pygame releases the GIL inside blits and scaling, so on a multi-core machine
+most drawing overlaps with game logic. Frames reach the screen one frame
+later than with serial drawing. Window events, presenting and flipping stay
+on the main thread, which is where SDL expects them.
+"""
+
+import copy
+import queue
+import threading
+import pygame
+from src.config import *
+
+
+class Snapshot:
+    """Copy of one frame's drawable state, with the names render() reads"""
+
+    def __init__(self, game):
+        self.clouds = [copy.copy(cloud) for cloud in game.clouds]
+        self.pickups = [copy.copy(pickup) for pickup in game.pickups]
+        self.player = copy.copy(game.player)
+        self.hostiles = [copy.copy(hostile) for hostile in game.hostiles]
+        self.player_lasers = [copy.copy(laser) for laser in game.player_lasers]
+        self.enemy_lasers = [copy.copy(laser) for laser in game.enemy_lasers]
+        self.particles = game.particles.snapshot()
+        self.effect_sprites = game.effect_sprites
+        self.score = game.score
+        self.player_health = game.player_health
+        self.paused = game.paused
+        self.game_over = game.game_over
+        self.leaderboard = list(game.leaderboard)
+
+
+class RenderPipeline:
+    """Draws snapshots on a render thread into two alternating canvases"""
+
+    def __init__(self, game):
+        self.game = game
+        self._canvases = [pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert() for _ in range(2)]
+        self._scaled = [None, None]  # window-sized copies of each canvas when scaling
+        self._next = 0  # canvas the next snapshot is drawn into
+        self._pending = queue.Queue(maxsize=1)
+        self._done = queue.Queue(maxsize=1)
+        self.busy = False  # a frame is being drawn
+        self._thread = threading.Thread(target=self._run, name="render", daemon=True)
+        self._thread.start()
+
+    def submit(self, snapshot):
+        """Start drawing a frame; any frame still being drawn is waited for first"""
+        self.wait()
+        self._pending.put((snapshot, self._next, self.game.viewport.rect.size))
+        self._next = 1 - self._next
+        self.busy = True
+
+    def wait(self):
+        """Wait for the frame being drawn and return (canvas, window-sized frame)
+
+        Returns None when no frame is being drawn. The window-sized frame is
+        the canvas itself when no scaling is needed.
+        """
+        if not self.busy:
+            return None
+        result = self._done.get()
+        self.busy = False
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    def _run(self):
+        """Render thread: draw each snapshot until told to stop"""
+        while True:
+            job = self._pending.get()
+            if job is None:
+                return
+            try:
+                self._done.put(self._draw(*job))
+            except BaseException as error:  # raised again on the main thread
+                self._done.put(error)
+
+    def _draw(self, snapshot, index, size):
+        canvas = self._canvases[index]
+        self.game.render(snapshot, canvas)
+        # Keep the game's adaptive particle limit in step with this frame's drawing
+        self.game.particles.draw_limit = snapshot.particles.draw_limit
+        if size == canvas.get_size():
+            return canvas, canvas
+        scaled = self._scaled[index]
+        if scaled is None or scaled.get_size() != size:
+            scaled = self._scaled[index] = pygame.Surface(size, 0, canvas)
+        self.game.viewport.scale_into(canvas, scaled)
+        return canvas, scaled
+
+    def close(self):
+        """Finish the frame in flight and stop the render thread"""
+        try:
+            self.wait()
+        finally:
+            self._pending.put(None)
+            self._thread.join()
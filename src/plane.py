@@ -1,285 +1,509 @@
-"""
-Plane classes for TejasThrust game
-"""
-
-import pygame
-import math
-import random
-from src.config import *
-from src.laser import Laser
-
-class Plane:
-    """Base plane class"""
-    
-    def __init__(self, x, y, color, health=1):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.health = health
-        self.max_health = health
-        self.width = PLANE_WIDTH
-        self.height = PLANE_HEIGHT
-        self.last_shot = 0
-        self.shoot_cooldown = 500  # milliseconds
-    
-    def get_rect(self):
-        """Get collision rectangle"""
-        return pygame.Rect(self.x - self.width // 2, self.y - self.height // 2, 
-                          self.width, self.height)
-    
-    def take_damage(self):
-        """Take damage"""
-        self.health -= 1
-    
-    def draw(self, screen):
-        """Draw the plane with a simple, kid-friendly design"""
-        # Draw main fuselage (rectangle body)
-        fuselage_width = self.width // 3
-        fuselage_height = self.height // 1.5
-        fuselage_rect = pygame.Rect(
-            self.x - fuselage_width // 2,
-            self.y - fuselage_height // 2,
-            fuselage_width,
-            fuselage_height
-            )
-        pygame.draw.rect(screen, self.color, fuselage_rect)
-
-        # Draw left wing (triangle)
-        left_wing_points = [
-        (self.x - fuselage_width // 2, self.y - fuselage_height // 4), # wing root
-        (self.x - self.width // 2, self.y), # wing tip
-        (self.x - fuselage_width // 2, self.y + fuselage_height // 4) # wing back
-        ]
-        pygame.draw.polygon(screen, self.color, left_wing_points)
-        # Draw right wing (triangle)
-        right_wing_points = [
-        (self.x + fuselage_width // 2, self.y - fuselage_height // 4), # wing root
-        (self.x + self.width // 2, self.y), # wing tip
-        (self.x + fuselage_width // 2, self.y + fuselage_height // 4) # wing back
-        ]
-        pygame.draw.polygon(screen, self.color, right_wing_points)
-        # Draw nose (triangle)
-        nose_points = [
-            (self.x - fuselage_width // 2, self.y - fuselage_height // 2), # left corner
-            (self.x, self.y - fuselage_height), # tip
-            (self.x + fuselage_width // 2, self.y - fuselage_height // 2) # right corner
-            ]
-        pygame.draw.polygon(screen, self.color, nose_points)
-
-        # Draw tail (triangle)
-        tail_points = [
-            (self.x - fuselage_width // 2, self.y + fuselage_height // 2), # left corner
-            (self.x, self.y + fuselage_height), # tip
-            (self.x + fuselage_width // 2, self.y + fuselage_height // 2) # right corner
-        ]
-        pygame.draw.polygon(screen, self.color, tail_points)
-
-        # Draw cockpit (small darker circle on top)
-        cockpit_color = tuple(max(0, c - 50) for c in self.color) # Darker shade
-        cockpit_pos = (self.x, self.y - fuselage_height // 4)
-        cockpit_radius = fuselage_width // 3
-        pygame.draw.circle(screen, cockpit_color, cockpit_pos, cockpit_radius)
-
-        # Draw health bar for enemies
-        if hasattr(self, 'show_health') and self.show_health and self.health < self.max_health:
-            self._draw_health_bar(screen)
-    
-    def _draw_health_bar(self, screen):
-        """Draw health bar above plane"""
-        bar_width = 40
-        bar_height = 6
-        bar_x = self.x - bar_width // 2
-        bar_y = self.y - self.height // 2 - 15
-        
-        # Background
-        pygame.draw.rect(screen, RED, (bar_x, bar_y, bar_width, bar_height))
-        
-        # Health
-        health_width = int((self.health / self.max_health) * bar_width)
-        if health_width > 0:
-            pygame.draw.rect(screen, GREEN, (bar_x, bar_y, health_width, bar_height))
-
-class PlayerPlane(Plane):
-    """Player controlled plane"""
-    
-    def __init__(self, x, y):
-        super().__init__(x, y, PLAYER_COLOR, PLAYER_MAX_HEALTH)
-        self.speed = PLAYER_SPEED
-        self.shoot_cooldown = 200  # Faster shooting for player
-    
-    def update(self, keys):
-        """Update player plane based on key input"""
-        # Movement with arrow keys
-        dx = 0
-        dy = 0
-        
-        if keys[pygame.K_LEFT]:
-            dx -= self.speed
-        if keys[pygame.K_RIGHT]:
-            dx += self.speed
-        if keys[pygame.K_UP]:
-            dy -= self.speed
-        if keys[pygame.K_DOWN]:
-            dy += self.speed
-        
-        # Normalize diagonal movement
-        if dx != 0 and dy != 0:
-            dx *= 0.707  # 1/sqrt(2)
-            dy *= 0.707
-        
-        # Update position with screen boundaries
-        self.x = max(self.width // 2, min(SCREEN_WIDTH - self.width // 2, self.x + dx))
-        self.y = max(self.height // 2, min(SCREEN_HEIGHT - self.height // 2, self.y + dy))
-    
-    def shoot(self):
-        """Shoot a laser"""
-        current_time = pygame.time.get_ticks()
-        if current_time - self.last_shot > self.shoot_cooldown:
-            self.last_shot = current_time
-            return Laser(self.x, self.y - self.height // 2, -LASER_SPEED, LASER_COLOR)
-        return None
-
-class EnemyPlane(Plane):
-    """Computer controlled enemy plane"""
-    
-    def __init__(self, x, y):
-        super().__init__(x, y, ENEMY_COLOR, ENEMY_HEALTH)
-        self.speed = ENEMY_SPEED
-        self.show_health = True
-        self.direction_x = random.choice([-1, 1])
-        self.direction_y = 1
-        self.change_direction_timer = 0
-        self.shoot_cooldown = 1000  # Slower shooting for enemies
-    
-    def update(self):
-        """Update enemy plane AI movement"""
-        # Change direction occasionally for evasive maneuvers
-        self.change_direction_timer += 1
-        if self.change_direction_timer > random.randint(60, 120):  # 1-2 seconds at 60 FPS
-            self.direction_x = random.choice([-1, 0, 1])
-            self.change_direction_timer = 0
-        
-        # Move down and sideways
-        self.x += self.direction_x * self.speed * 0.5
-        self.y += self.direction_y * self.speed
-        
-        # Keep within screen bounds (horizontally)
-        if self.x <= self.width // 2:
-            self.direction_x = 1
-        elif self.x >= SCREEN_WIDTH - self.width // 2:
-            self.direction_x = -1
-    
-    def shoot(self):
-        """Shoot a laser towards player general area"""
-        current_time = pygame.time.get_ticks()
-        if current_time - self.last_shot > self.shoot_cooldown:
-            self.last_shot = current_time
-            return Laser(self.x, self.y + self.height // 2, ENEMY_LASER_SPEED, RED)
-        return None
-
-class BossPlane(Plane):
-    """Powerful boss plane that appears after killing multiple enemies"""
-    
-    def __init__(self, x, y):
-        super().__init__(x, y, BOSS_COLOR, BOSS_HEALTH)
-        self.width = BOSS_WIDTH
-        self.height = BOSS_HEIGHT
-        self.speed = BOSS_SPEED
-        self.show_health = True
-        self.direction_x = random.choice([-1, 1])
-        self.direction_y = 0  # Boss stays at relatively same height
-        self.change_direction_timer = 0
-        self.shoot_cooldown = 800  # Faster shooting than regular enemies
-    
-    def update(self):
-        """Update boss plane AI movement - more sophisticated than regular enemies"""
-        # Change direction occasionally for evasive maneuvers
-        self.change_direction_timer += 1
-        if self.change_direction_timer > random.randint(30, 90):  # More frequent direction changes
-            self.direction_x = random.choice([-1, 0, 1])
-            # Occasionally move slightly up or down
-            self.direction_y = random.choice([-0.5, 0, 0.5])
-            self.change_direction_timer = 0
-        
-        # Move sideways and occasionally up/down
-        self.x += self.direction_x * self.speed
-        self.y += self.direction_y * self.speed
-        
-        # Keep within screen bounds (horizontally)
-        if self.x <= self.width // 2:
-            self.direction_x = 1
-        elif self.x >= SCREEN_WIDTH - self.width // 2:
-            self.direction_x = -1
-            
-        # Keep within the top portion of the screen (vertically)
-        if self.y <= self.height:
-            self.direction_y = 0.5
-        elif self.y >= SCREEN_HEIGHT // 3:
-            self.direction_y = -0.5
-    
-    def shoot(self):
-        """Shoot a more powerful laser towards player"""
-        current_time = pygame.time.get_ticks()
-        if current_time - self.last_shot > self.shoot_cooldown:
-            self.last_shot = current_time
-            return Laser(self.x, self.y + self.height // 2, BOSS_LASER_SPEED, RED, damage=BOSS_LASER_DAMAGE)
-        return None
-    
-    def draw(self, screen):
-        """Draw the boss plane with a more imposing, kid-friendly design"""
-        # Draw main fuselage (rectangle body) - larger than regular planes
-        fuselage_width = self.width // 3
-        fuselage_height = self.height // 1.5
-        fuselage_rect = pygame.Rect(
-            self.x - fuselage_width // 2,
-            self.y - fuselage_height // 2,
-            fuselage_width,
-            fuselage_height
-            )
-        pygame.draw.rect(screen, self.color, fuselage_rect)
-
-        # Draw left wing (triangle) - larger
-        left_wing_points = [
-        (self.x - fuselage_width // 2, self.y - fuselage_height // 4), # wing root
-        (self.x - self.width // 2, self.y), # wing tip
-        (self.x - fuselage_width // 2, self.y + fuselage_height // 4) # wing back
-        ]
-        pygame.draw.polygon(screen, self.color, left_wing_points)
-        
-        # Draw right wing (triangle) - larger
-        right_wing_points = [
-        (self.x + fuselage_width // 2, self.y - fuselage_height // 4), # wing root
-        (self.x + self.width // 2, self.y), # wing tip
-        (self.x + fuselage_width // 2, self.y + fuselage_height // 4) # wing back
-        ]
-        pygame.draw.polygon(screen, self.color, right_wing_points)
-        
-        # Draw nose (triangle) - more aggressive angle
-        nose_points = [
-            (self.x - fuselage_width // 2, self.y - fuselage_height // 2), # left corner
-            (self.x, self.y - fuselage_height), # tip
-            (self.x + fuselage_width // 2, self.y - fuselage_height // 2) # right corner
-            ]
-        pygame.draw.polygon(screen, self.color, nose_points)
-
-        # Draw tail (triangle) - larger
-        tail_points = [
-            (self.x - fuselage_width // 2, self.y + fuselage_height // 2), # left corner
-            (self.x, self.y + fuselage_height), # tip
-            (self.x + fuselage_width // 2, self.y + fuselage_height // 2) # right corner
-        ]
-        pygame.draw.polygon(screen, self.color, tail_points)
-
-        # Draw cockpit (small darker circle on top)
-        cockpit_color = tuple(max(0, c - 50) for c in self.color) # Darker shade
-        cockpit_pos = (self.x, self.y - fuselage_height // 4)
-        cockpit_radius = fuselage_width // 3
-        pygame.draw.circle(screen, cockpit_color, cockpit_pos, cockpit_radius)
-        
-        # Add extra details for boss plane
-        # Wing tips
-        pygame.draw.circle(screen, BLACK, (int(self.x - self.width // 2), int(self.y)), 5)
-        pygame.draw.circle(screen, BLACK, (int(self.x + self.width // 2), int(self.y)), 5)
-        
-        # Draw health bar for boss
-        self._draw_health_bar(screen)
+"""
+Plane classes for TejasThrust game
+"""
+
+import pygame
+import math
+import random
+from src.config import *
+from src.accessibility import PALETTE
+from src.laser import Laser
+from src.collision import rect_hits_mask
+from src.settings import DEFAULT_SETTINGS
+from src.projectile import aim_down_velocity, spread_velocities
+from src.powerups import ModifierStack
+
+class Plane:
+    """Base plane class"""
+    
+    _sprite_cache = {}  # (class, color, width, height) -> (sprite, mask, center)
+    _health_bar_cache = {}  # filled width -> health bar sprite
+    _flash_cache = {}  # plane sprite -> brightened copy shown after a hit
+    
+    # Hostile planes: what the game needs to know to handle any of them alike
+    kind = "plane"  # telemetry and bookkeeping name
+    score_value = 1  # points for shooting it down
+    explosion_size = 1
+    flashing = False  # set by the game's Effects for a few frames after a hit
+    
+    def __init__(self, x, y, color, health=1):
+        self.x = x
+        self.y = y
+        self.color = color
+        self.health = health
+        self.max_health = health
+        self.width = PLANE_WIDTH
+        self.height = PLANE_HEIGHT
+        self.last_shot = 0
+        self.shoot_cooldown = 500  # milliseconds
+    
+    def get_rect(self):
+        """Get collision rectangle"""
+        return pygame.Rect(self.x - self.width // 2, self.y - self.height // 2, 
+                          self.width, self.height)
+    
+    def is_hit_by(self, laser):
+        """Check if a laser hit the plane itself, not just its bounding box,
+        anywhere along the laser's last move"""
+        # Cheap rectangle test first; most lasers miss here
+        if not laser.collides(self.get_rect()):
+            return False
+        return self.mask_hit(laser)
+    
+    def mask_hit(self, laser):
+        """Pixel-perfect test of a laser's sweep against the cached sprite mask"""
+        _, mask, (offset_x, offset_y) = self.get_sprite()
+        topleft = (int(self.x) - offset_x, int(self.y) - offset_y)
+        return any(rect_hits_mask(rect, mask, topleft) for rect in laser.sweep_rects())
+    
+    def take_damage(self):
+        """Take damage"""
+        self.health -= 1
+    
+    def shoot(self, target=None, now=None):
+        """Shoot a laser, or return None while on cooldown"""
+        return None
+    
+    def fire(self, target=None, now=None):
+        """Shoot and return the list of lasers fired (may be empty)"""
+        laser = self.shoot(target, now)
+        return [laser] if laser else []
+    
+    def think(self, game, now):
+        """Move for one frame and return any lasers fired at the player"""
+        self.update()
+        return []
+    
+    def is_gone(self):
+        """True once the plane has left the screen for good"""
+        return self.y > SCREEN_HEIGHT + 50
+    
+    def get_sprite(self):
+        """Get the cached sprite, its collision mask and its center offset
+        
+        Sprites are rendered once per plane type, color and size and shared
+        by every plane that looks the same.
+        """
+        key = (type(self), self.color, self.width, self.height)
+        entry = Plane._sprite_cache.get(key)
+        if entry is None:
+            entry = self._render_sprite()
+            Plane._sprite_cache[key] = entry
+        return entry
+    
+    def _render_sprite(self):
+        """Render the plane onto its own transparent surface"""
+        fuselage_height = self.height // 1.5
+        # Nose and tail stick out of the collision rect, boss wing tips too
+        center = (self.width // 2 + SPRITE_PADDING, int(fuselage_height) + SPRITE_PADDING)
+        size = (center[0] * 2 + 1, center[1] * 2 + 1)
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        self._draw_shape(surface, *center)
+        return surface, pygame.mask.from_surface(surface), center
+    
+    def _draw_shape(self, surface, x, y):
+        """Draw the plane with a simple, kid-friendly design"""
+        color = PALETTE[self.color]
+        # Draw main fuselage (rectangle body)
+        fuselage_width = self.width // 3
+        fuselage_height = self.height // 1.5
+        fuselage_rect = pygame.Rect(
+            x - fuselage_width // 2,
+            y - fuselage_height // 2,
+            fuselage_width,
+            fuselage_height
+            )
+        pygame.draw.rect(surface, color, fuselage_rect)
+
+        # Draw left wing (triangle)
+        left_wing_points = [
+        (x - fuselage_width // 2, y - fuselage_height // 4), # wing root
+        (x - self.width // 2, y), # wing tip
+        (x - fuselage_width // 2, y + fuselage_height // 4) # wing back
+        ]
+        pygame.draw.polygon(surface, color, left_wing_points)
+        # Draw right wing (triangle)
+        right_wing_points = [
+        (x + fuselage_width // 2, y - fuselage_height // 4), # wing root
+        (x + self.width // 2, y), # wing tip
+        (x + fuselage_width // 2, y + fuselage_height // 4) # wing back
+        ]
+        pygame.draw.polygon(surface, color, right_wing_points)
+        # Draw nose (triangle)
+        nose_points = [
+            (x - fuselage_width // 2, y - fuselage_height // 2), # left corner
+            (x, y - fuselage_height), # tip
+            (x + fuselage_width // 2, y - fuselage_height // 2) # right corner
+            ]
+        pygame.draw.polygon(surface, color, nose_points)
+
+        # Draw tail (triangle)
+        tail_points = [
+            (x - fuselage_width // 2, y + fuselage_height // 2), # left corner
+            (x, y + fuselage_height), # tip
+            (x + fuselage_width // 2, y + fuselage_height // 2) # right corner
+        ]
+        pygame.draw.polygon(surface, color, tail_points)
+
+        # Draw cockpit (small darker circle on top)
+        cockpit_color = tuple(max(0, c - 50) for c in color) # Darker shade
+        cockpit_pos = (x, y - fuselage_height // 4)
+        cockpit_radius = fuselage_width // 3
+        pygame.draw.circle(surface, cockpit_color, cockpit_pos, cockpit_radius)
+
+    def enqueue(self, render_queue):
+        """Add the plane, and its health bar when shown, to a render queue"""
+        sprite, _, (offset_x, offset_y) = self.get_sprite()
+        if self.flashing:
+            sprite = self._flash_sprite(sprite)
+        render_queue.add(sprite, (int(self.x) - offset_x, int(self.y) - offset_y), LAYER_PLANES)
+
+        if self.shows_health_bar():
+            self._enqueue_health_bar(render_queue)
+    
+    @staticmethod
+    def clear_sprites():
+        """Forget every cached sprite, so they are baked again in the current palette"""
+        Plane._sprite_cache.clear()
+        Plane._health_bar_cache.clear()
+        Plane._flash_cache.clear()
+        PlayerPlane._shield_sprite = None
+    
+    @staticmethod
+    def _flash_sprite(sprite):
+        """The cached brightened copy of a sprite"""
+        flash = Plane._flash_cache.get(sprite)
+        if flash is None:
+            flash = sprite.copy()
+            flash.fill(HIT_FLASH_TINT, special_flags=pygame.BLEND_RGB_ADD)
+            Plane._flash_cache[sprite] = flash
+        return flash
+    
+    def shows_health_bar(self):
+        """Enemies show a health bar once they have been hit"""
+        return getattr(self, 'show_health', False) and self.health < self.max_health
+    
+    def _enqueue_health_bar(self, render_queue):
+        """Add the health bar above the plane to a render queue"""
+        bar_width = 40
+        bar_height = 6
+        health_width = max(0, int((self.health / self.max_health) * bar_width))
+        sprite = Plane._health_bar_cache.get(health_width)
+        if sprite is None:
+            sprite = pygame.Surface((bar_width, bar_height))
+            sprite.fill(PALETTE[RED])
+            sprite.fill(PALETTE[GREEN], (0, 0, health_width, bar_height))
+            Plane._health_bar_cache[health_width] = sprite
+        render_queue.add(sprite, (int(self.x - bar_width // 2), int(self.y - self.height // 2 - 15)),
+                         LAYER_HEALTH_BARS)
+
+class PlayerPlane(Plane):
+    """Player controlled plane"""
+    
+    _shield_sprite = None
+    
+    def __init__(self, x, y, settings=DEFAULT_SETTINGS):
+        super().__init__(x, y, PLAYER_COLOR, PLAYER_MAX_HEALTH)
+        self.modifiers = ModifierStack()  # active timed power-ups
+        self.apply_settings(settings)
+    
+    def apply_settings(self, settings):
+        """Copy this plane's tunable values from the settings"""
+        self.speed = settings.player_speed
+        self.base_shoot_cooldown = settings.player_shoot_cooldown  # Faster shooting for player
+        self.laser_speed = settings.laser_speed
+        self._resolve_modifiers()
+    
+    def power_up(self, kind, now):
+        """Start a timed power-up"""
+        self.modifiers.add(kind, now)
+        self._resolve_modifiers()
+    
+    def update_power_ups(self, now):
+        """End power-ups that have run out"""
+        if self.modifiers.expire(now):
+            self._resolve_modifiers()
+    
+    def _resolve_modifiers(self):
+        """Turn the active power-ups into the plain values shooting and damage read"""
+        values = self.modifiers.resolve()
+        factor = max(PLAYER_MIN_COOLDOWN_FACTOR, values["cooldown_factor"])
+        self.shoot_cooldown = self.base_shoot_cooldown * factor
+        self.shot_count = min(PLAYER_MAX_SHOTS, 1 + values["extra_shots"])
+        self.shielded = values["shield"] > 0
+    
+    def update(self, keys):
+        """Update player plane based on key input"""
+        # Movement with arrow keys
+        dx = 0
+        dy = 0
+        
+        if keys[pygame.K_LEFT]:
+            dx -= self.speed
+        if keys[pygame.K_RIGHT]:
+            dx += self.speed
+        if keys[pygame.K_UP]:
+            dy -= self.speed
+        if keys[pygame.K_DOWN]:
+            dy += self.speed
+        
+        # Normalize diagonal movement
+        if dx != 0 and dy != 0:
+            dx *= 0.707  # 1/sqrt(2)
+            dy *= 0.707
+        
+        # Update position with screen boundaries
+        self.x = max(self.width // 2, min(SCREEN_WIDTH - self.width // 2, self.x + dx))
+        self.y = max(self.height // 2, min(SCREEN_HEIGHT - self.height // 2, self.y + dy))
+    
+    def shoot(self, target=None, now=None):
+        """Shoot a laser"""
+        current_time = pygame.time.get_ticks() if now is None else now
+        if current_time - self.last_shot > self.shoot_cooldown:
+            self.last_shot = current_time
+            return Laser(self.x, self.y - self.height // 2, -self.laser_speed, LASER_COLOR)
+        return None
+    
+    def fire(self, target=None, now=None):
+        """Shoot, fanning the shot out while a spread power-up is active"""
+        laser = self.shoot(target, now)
+        if laser is None:
+            return []
+        if self.shot_count == 1:
+            return [laser]
+        return [Laser(laser.x, laser.y, vy, LASER_COLOR, vx=vx, behavior=LASER_AIMED)
+                for vx, vy in spread_velocities(0, -self.laser_speed, self.shot_count, PLAYER_SPREAD_ARC)]
+    
+    def enqueue(self, render_queue):
+        """Add the plane, and its shield when active, to a render queue"""
+        super().enqueue(render_queue)
+        if self.shielded:
+            sprite = PlayerPlane._shield_sprite
+            if sprite is None:
+                radius = max(self.width, self.height) // 2 + 8
+                sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+                pygame.draw.circle(sprite, (*PALETTE[POWERUPS["shield"]["color"]], 160), (radius, radius), radius, 3)
+                PlayerPlane._shield_sprite = sprite
+            render_queue.add(sprite, (int(self.x) - sprite.get_width() // 2,
+                                      int(self.y) - sprite.get_height() // 2), LAYER_HEALTH_BARS)
+
+class EnemyPlane(Plane):
+    """Computer controlled enemy plane"""
+    
+    kind = "enemy"
+    
+    def __init__(self, x, y, settings=DEFAULT_SETTINGS, rng=random):
+        super().__init__(x, y, ENEMY_COLOR, settings.enemy_health)
+        self.rng = rng  # the game's enemy stream in deterministic mode
+        self.show_health = True
+        self.direction_x = rng.choice([-1, 1])
+        self.direction_y = 1
+        self.change_direction_timer = 0
+        self.apply_settings(settings)
+    
+    def apply_settings(self, settings):
+        """Copy this plane's tunable values from the settings"""
+        self.speed = settings.enemy_speed
+        self.shoot_cooldown = settings.enemy_shoot_cooldown  # Slower shooting for enemies
+        self.laser_speed = settings.enemy_laser_speed
+    
+    def update(self):
+        """Update enemy plane AI movement"""
+        # Change direction occasionally for evasive maneuvers
+        self.change_direction_timer += 1
+        if self.change_direction_timer > self.rng.randint(60, 120):  # 1-2 seconds at 60 FPS
+            self.direction_x = self.rng.choice([-1, 0, 1])
+            self.change_direction_timer = 0
+        
+        # Move down and sideways
+        self.x += self.direction_x * self.speed * 0.5
+        self.y += self.direction_y * self.speed
+        
+        # Keep within screen bounds (horizontally)
+        if self.x <= self.width // 2:
+            self.direction_x = 1
+        elif self.x >= SCREEN_WIDTH - self.width // 2:
+            self.direction_x = -1
+    
+    def think(self, game, now):
+        """Move, then fire at random moments while the laser budget allows"""
+        self.update()
+        if self.rng.random() < game.enemy_shoot_chance and len(game.enemy_lasers) < game.max_enemy_lasers:
+            return self.fire(game.player, now=now)
+        return []
+    
+    def shoot(self, target=None, now=None):
+        """Shoot a laser towards player general area"""
+        current_time = pygame.time.get_ticks() if now is None else now
+        if current_time - self.last_shot > self.shoot_cooldown:
+            self.last_shot = current_time
+            muzzle_y = self.y + self.height // 2
+            if target is None:
+                return Laser(self.x, muzzle_y, self.laser_speed, RED)
+            # Aim at the target, but always down the screen
+            vx, vy = aim_down_velocity(self.x, muzzle_y, target.x, target.y, self.laser_speed)
+            return Laser(self.x, muzzle_y, vy, RED, vx=vx, behavior=LASER_AIMED)
+        return None
+
+class BossPlane(Plane):
+    """Powerful boss plane that appears after killing multiple enemies
+    
+    The boss is a small state machine driven by timed events rather than
+    per-frame dice rolls. It flies in from the top (entering), then fights:
+    direction changes and volleys happen at scheduled times. Each time its
+    health drops past a BOSS_PHASES threshold it regroups for a moment and
+    comes back faster, with new attack patterns and shorter volley gaps.
+    """
+    
+    kind = "boss"
+    score_value = 5  # Bonus points for defeating boss
+    explosion_size = BOSS_EXPLOSION_SIZE
+    
+    def __init__(self, x, y, settings=DEFAULT_SETTINGS, station_y=None, rng=random):
+        super().__init__(x, y, BOSS_COLOR, settings.boss_health)
+        self.width = BOSS_WIDTH
+        self.height = BOSS_HEIGHT
+        self.rng = rng  # the game's boss stream in deterministic mode
+        self.show_health = True
+        self.direction_x = rng.choice([-1, 1])
+        self.direction_y = 0  # Boss stays at relatively same height
+        # Bosses given a station fly down to it before fighting
+        self.station_y = y if station_y is None else station_y
+        self.state = BOSS_ENTERING if self.y < self.station_y else BOSS_FIGHTING
+        self.phase_index = 0
+        self.attack_patterns = list(BOSS_PHASES[0][1])
+        self.pattern_index = 0
+        self.next_move = None  # scheduled event times, set on the first think
+        self.next_volley = None
+        self.regroup_until = 0
+        self.apply_settings(settings)
+    
+    @property
+    def phase(self):
+        """(health fraction, attack patterns, volley gap factor, speed factor)"""
+        return BOSS_PHASES[self.phase_index]
+    
+    def take_damage(self):
+        """Take damage, moving to the next phase when health crosses its threshold"""
+        super().take_damage()
+        phase_index = self.phase_index
+        while (phase_index + 1 < len(BOSS_PHASES)
+               and self.health <= self.max_health * BOSS_PHASES[phase_index + 1][0]):
+            phase_index += 1
+        if phase_index != self.phase_index and self.health > 0:
+            self.phase_index = phase_index
+            self.attack_patterns = list(self.phase[1])
+            self.pattern_index = 0
+            self.state = BOSS_REGROUPING
+            self.regroup_until = None  # starts at the next think
+    
+    def volley_interval(self, fire_rate=1.0):
+        """Milliseconds between volleys in the current phase"""
+        return self.shoot_cooldown * self.phase[2] / fire_rate
+    
+    def think(self, game, now):
+        """Advance the state machine by one frame and return any volley fired"""
+        if self.next_move is None:
+            self.next_move = now
+            self.next_volley = now + self.volley_interval(game.boss_fire_rate)
+        
+        if self.state == BOSS_ENTERING:
+            self.y += BOSS_ENTRY_SPEED
+            if self.y >= self.station_y:
+                self.y = self.station_y
+                self.state = BOSS_FIGHTING
+                self.next_volley = now + self.volley_interval(game.boss_fire_rate)
+            return []
+        
+        if self.state == BOSS_REGROUPING:
+            if self.regroup_until is None:
+                self.regroup_until = now + BOSS_REGROUP_TIME
+            if now < self.regroup_until:
+                # Hold fire and drift back up to the station
+                self.direction_y = -0.5 if self.y > self.station_y else 0
+                self.update()
+                return []
+            self.state = BOSS_FIGHTING
+            self.next_volley = now
+        
+        if now >= self.next_move:
+            self.direction_x = self.rng.choice([-1, 0, 1])
+            # Occasionally move slightly up or down
+            self.direction_y = self.rng.choice([-0.5, 0, 0.5])
+            self.next_move = now + self.rng.randint(*BOSS_MOVE_INTERVAL)
+        self.update()
+        
+        if now >= self.next_volley and len(game.enemy_lasers) < game.max_enemy_lasers:
+            lasers = self.fire(game.player, now=now)
+            if lasers:  # else still on cooldown: try again next frame
+                self.next_volley = now + self.volley_interval(game.boss_fire_rate)
+            return lasers
+        return []
+    
+    def apply_settings(self, settings):
+        """Copy this plane's tunable values from the settings"""
+        self.speed = settings.boss_speed
+        self.shoot_cooldown = settings.boss_shoot_cooldown  # Faster shooting than regular enemies
+        self.laser_speed = settings.boss_laser_speed
+        self.laser_damage = settings.boss_laser_damage
+    
+    def update(self):
+        """Move one frame in the current direction, faster in later phases"""
+        # Move sideways and occasionally up/down
+        speed = self.speed * self.phase[3]
+        self.x += self.direction_x * speed
+        self.y += self.direction_y * speed
+        
+        # Keep within screen bounds (horizontally)
+        if self.x <= self.width // 2:
+            self.direction_x = 1
+        elif self.x >= SCREEN_WIDTH - self.width // 2:
+            self.direction_x = -1
+            
+        # Keep within the top portion of the screen (vertically)
+        if self.y <= self.height:
+            self.direction_y = 0.5
+        elif self.y >= SCREEN_HEIGHT // 3:
+            self.direction_y = -0.5
+    
+    def shoot(self, target=None, now=None):
+        """Shoot a more powerful laser towards player"""
+        current_time = pygame.time.get_ticks() if now is None else now
+        if current_time - self.last_shot > self.shoot_cooldown:
+            self.last_shot = current_time
+            return Laser(self.x, self.y + self.height // 2, self.laser_speed, RED, damage=self.laser_damage)
+        return None
+    
+    def fire(self, target=None, now=None):
+        """Fire the next attack pattern in the rotation"""
+        laser = self.shoot(target, now)
+        if laser is None or target is None:
+            return [laser] if laser else []
+        
+        pattern = self.attack_patterns[self.pattern_index]
+        self.pattern_index = (self.pattern_index + 1) % len(self.attack_patterns)
+        
+        if pattern == LASER_AIMED:
+            # Spread volley fanned around the player's position
+            vx, vy = aim_down_velocity(laser.x, laser.y, target.x, target.y, self.laser_speed)
+            return [Laser(laser.x, laser.y, svy, RED, damage=self.laser_damage,
+                          vx=svx, behavior=LASER_AIMED)
+                    for svx, svy in spread_velocities(vx, vy)]
+        if pattern in (LASER_HOMING, LASER_SINE):
+            # Slower than a straight shot so there is time to dodge
+            laser.vy = self.laser_speed * 0.5
+            laser.behavior = pattern
+        return [laser]
+    
+    def _draw_shape(self, surface, x, y):
+        """Draw the boss plane with a more imposing, kid-friendly design"""
+        super()._draw_shape(surface, x, y)
+        
+        # Add extra details for boss plane
+        # Wing tips
+        pygame.draw.circle(surface, BLACK, (int(x - self.width // 2), int(y)), 5)
+        pygame.draw.circle(surface, BLACK, (int(x + self.width // 2), int(y)), 5)
+    
+    def shows_health_bar(self):
+        """The boss always shows its health bar"""
+        return True
@@ -0,0 +1,150 @@
+"""
+Power-ups for TejasThrust game
+
+Destroyed planes sometimes drop a pickup: spread shot, rapid fire, shield
+or repair (see POWERUPS in src/config.py). Pickups live in a `PickupPool`
+of preallocated objects that are reused instead of created and thrown away.
+
+Timed power-ups go on the player's `ModifierStack`. Several can be active at
+once and they stack by the rule in POWERUP_MODIFIERS (spread shots add up,
+rapid fire multiplies). The stack is only resolved into flat values when a
+power-up is added or runs out. Every other frame costs one comparison.
+"""
+
+import math
+import pygame
+from src.config import *
+from src.accessibility import PALETTE
+
+
+def choose_powerup(rng):
+    """Pick a power-up kind by its drop weight"""
+    roll = rng.random() * sum(powerup["weight"] for powerup in POWERUPS.values())
+    for kind, powerup in POWERUPS.items():
+        roll -= powerup["weight"]
+        if roll < 0:
+            return kind
+    return kind
+
+
+class ModifierStack:
+    """Timed power-up modifiers, resolved into flat values when they change"""
+
+    def __init__(self):
+        self.active = []  # (expires at, kind)
+        self.next_expiry = math.inf
+
+    def add(self, kind, now):
+        """Start a timed power-up"""
+        expires = now + POWERUPS[kind]["duration"]
+        self.active.append((expires, kind))
+        self.next_expiry = min(self.next_expiry, expires)
+
+    def expire(self, now):
+        """Drop power-ups that have run out; True if any did"""
+        if now < self.next_expiry:
+            return False
+        self.active = [(expires, kind) for expires, kind in self.active if expires > now]
+        self.next_expiry = min((expires for expires, _ in self.active), default=math.inf)
+        return True
+
+    def clear(self):
+        """End every power-up"""
+        self.active.clear()
+        self.next_expiry = math.inf
+
+    def resolve(self):
+        """Combine the active modifiers into one value per modifier name"""
+        values = {name: neutral for name, (neutral, _) in POWERUP_MODIFIERS.items()}
+        for _, kind in self.active:
+            for name, value in POWERUPS[kind]["modifiers"].items():
+                if POWERUP_MODIFIERS[name][1] == "multiply":
+                    values[name] *= value
+                else:
+                    values[name] += value
+        return values
+
+
+class Pickup:
+    """A power-up falling towards the bottom of the screen"""
+
+    _sprite_cache = {}  # kind -> sprite
+
+    def __init__(self):
+        self.active = False
+        self.kind = None
+        self.x = 0.0
+        self.y = 0.0
+
+    def update(self):
+        """Fall, and go back to the pool once off screen"""
+        self.y += POWERUP_FALL_SPEED
+        if self.y > SCREEN_HEIGHT + POWERUP_SIZE:
+            self.active = False
+
+    def get_rect(self):
+        """Get collision rectangle"""
+        return pygame.Rect(self.x - POWERUP_SIZE // 2, self.y - POWERUP_SIZE // 2,
+                           POWERUP_SIZE, POWERUP_SIZE)
+
+    @staticmethod
+    def clear_sprites():
+        """Forget every cached sprite, so they are baked again in the current palette"""
+        Pickup._sprite_cache.clear()
+
+    def get_sprite(self):
+        """Get the cached sprite for this kind of power-up"""
+        sprite = Pickup._sprite_cache.get(self.kind)
+        if sprite is None:
+            sprite = pygame.Surface((POWERUP_SIZE, POWERUP_SIZE), pygame.SRCALPHA)
+            center = (POWERUP_SIZE // 2, POWERUP_SIZE // 2)
+            pygame.draw.circle(sprite, PALETTE[POWERUPS[self.kind]["color"]], center, POWERUP_SIZE // 2)
+            pygame.draw.circle(sprite, WHITE, center, POWERUP_SIZE // 2, 2)
+            pygame.draw.circle(sprite, WHITE, center, POWERUP_SIZE // 6)
+            Pickup._sprite_cache[self.kind] = sprite
+        return sprite
+
+    def enqueue(self, render_queue):
+        """Add the pickup to a render queue"""
+        render_queue.add(self.get_sprite(), (int(self.x) - POWERUP_SIZE // 2,
+                                             int(self.y) - POWERUP_SIZE // 2), LAYER_PICKUPS)
+
+
+class PickupPool:
+    """A fixed set of reusable pickups; iterating gives the active ones"""
+
+    def __init__(self, capacity=POWERUP_POOL_SIZE):
+        self.pickups = [Pickup() for _ in range(capacity)]
+
+    def __iter__(self):
+        return (pickup for pickup in self.pickups if pickup.active)
+
+    def spawn(self, x, y, kind):
+        """Drop a pickup; returns it, or None when every pickup is in use"""
+        for pickup in self.pickups:
+            if not pickup.active:
+                pickup.active = True
+                pickup.kind = kind
+                pickup.x = x
+                pickup.y = y
+                return pickup
+        return None
+
+    def update(self):
+        """Move every active pickup"""
+        for pickup in self:
+            pickup.update()
+
+    def collect(self, rect):
+        """Return the kinds of the pickups touching a rectangle, freeing them"""
+        collected = []
+        for pickup in self:
+            if pickup.get_rect().colliderect(rect):
+                pickup.active = False
+                collected.append(pickup.kind)
+        return collected
+
+    def clear(self):
+        """Free every pickup"""
+        for pickup in self.pickups:
+            pickup.active = False
@@ -0,0 +1,91 @@
+"""
+Projectile behaviors for TejasThrust game
+
+Aimed and spread shots only need their launch velocity, so they are set up
+once when fired. Homing and sinusoidal lasers change velocity every frame;
+their steering is computed for all live lasers in one NumPy pass.
+"""
+
+import math
+import numpy as np
+from src.config import *
+
+# Sideways velocity for each frame of a weave. Using the change in offset
+# between frames (instead of a cosine) keeps the laser exactly on its wave.
+_SINE_PHASES = np.arange(SINE_PERIOD + 1) * (2 * math.pi / SINE_PERIOD)
+SINE_VX = np.diff(SINE_AMPLITUDE * np.sin(_SINE_PHASES))
+
+
+def aim_velocity(x, y, target_x, target_y, speed):
+    """Get the velocity that sends a projectile from (x, y) to the target"""
+    dx = target_x - x
+    dy = target_y - y
+    distance = math.hypot(dx, dy)
+    if distance == 0:
+        return 0.0, float(speed)
+    return dx / distance * speed, dy / distance * speed
+
+
+def aim_down_velocity(x, y, target_x, target_y, speed, max_angle=AIM_MAX_ANGLE):
+    """Aim at the target, leaning at most `max_angle` degrees from straight down
+
+    A target level with or above the shooter gets the steepest allowed
+    shot towards its side instead of one flying across the screen.
+    """
+    angle = math.atan2(target_x - x, max(target_y - y, 0))  # 0 is straight down
+    limit = math.radians(max_angle)
+    angle = max(-limit, min(limit, angle))
+    return math.sin(angle) * speed, math.cos(angle) * speed
+
+
+def spread_velocities(vx, vy, count=SPREAD_SHOTS, arc=SPREAD_ARC):
+    """Fan a velocity out into `count` velocities covering `arc` degrees"""
+    if count <= 1:
+        return [(vx, vy)]
+    heading = math.atan2(vy, vx)
+    speed = math.hypot(vx, vy)
+    step = math.radians(arc) / (count - 1)
+    start = heading - math.radians(arc) / 2
+    return [(math.cos(start + i * step) * speed, math.sin(start + i * step) * speed)
+            for i in range(count)]
+
+
+def steer_lasers(lasers, target_x, target_y):
+    """Update the velocity of every homing and sine laser in one batch"""
+    steered = [laser for laser in lasers
+               if laser.behavior == LASER_SINE
+               or (laser.behavior == LASER_HOMING and laser.age < HOMING_DURATION)]
+    if not steered:
+        return
+
+    count = len(steered)
+    x = np.fromiter((laser.x for laser in steered), float, count)
+    y = np.fromiter((laser.y for laser in steered), float, count)
+    vx = np.fromiter((laser.vx for laser in steered), float, count)
+    vy = np.fromiter((laser.vy for laser in steered), float, count)
+    age = np.fromiter((laser.age for laser in steered), int, count)
+    homing = np.fromiter((laser.behavior == LASER_HOMING for laser in steered), bool, count)
+
+    # Homing: steer towards the target, limited per frame, keeping speed
+    speed = np.hypot(vx, vy)
+    dx = target_x - x
+    dy = target_y - y
+    distance = np.maximum(np.hypot(dx, dy), 1e-6)
+    steer_x = dx / distance * speed - vx
+    steer_y = dy / distance * speed - vy
+    steer = np.maximum(np.hypot(steer_x, steer_y), 1e-6)
+    scale = np.minimum(1.0, HOMING_MAX_STEER / steer)
+    new_vx = vx + steer_x * scale
+    new_vy = vy + steer_y * scale
+    renorm = speed / np.maximum(np.hypot(new_vx, new_vy), 1e-6)
+    homing_vx = new_vx * renorm
+    homing_vy = new_vy * renorm
+
+    # Sine: sideways weave around the launch heading
+    sine_vx = SINE_VX[age % SINE_PERIOD]
+
+    out_vx = np.where(homing, homing_vx, sine_vx).tolist()
+    out_vy = np.where(homing, homing_vy, vy).tolist()
+    for laser, new_x, new_y in zip(steered, out_vx, out_vy):
+        laser.vx = new_x
+        laser.vy = new_y
@@ -0,0 +1,39 @@
+"""
+Batched drawing for TejasThrust game
+
+Instead of drawing themselves, clouds, planes, health bars and lasers add
+(sprite, position, layer) entries to a `RenderQueue`. `flush` sorts the
+entries by layer and then by sprite, so copies of the same texture are
+drawn one after another (sprites are ordered by when they were first
+queued, so a frame always draws the same way), and hands the whole frame to
+SDL in a single `Surface.blits` call rather than one call per object.
+"""
+
+from operator import itemgetter
+from src.config import *
+
+_DRAW_ORDER = itemgetter(0, 1)  # layer, then sprite
+
+
+class RenderQueue:
+    """Collects sprites for one frame and blits them in bulk"""
+
+    def __init__(self):
+        self.entries = []  # (layer, sprite order, sprite, position)
+        self._sprite_order = {}  # id(sprite) -> when it was first queued this frame
+
+    def __len__(self):
+        return len(self.entries)
+
+    def add(self, sprite, position, layer):
+        """Queue a sprite at a top-left position on a layer (lower layers first)"""
+        order = self._sprite_order.setdefault(id(sprite), len(self._sprite_order))
+        self.entries.append((layer, order, sprite, position))
+
+    def flush(self, screen):
+        """Draw everything queued, lowest layer first, and empty the queue"""
+        entries = self.entries
+        entries.sort(key=_DRAW_ORDER)  # stable: same sprite keeps queue order
+        screen.blits([(sprite, position) for _, _, sprite, position in entries], doreturn=False)
+        entries.clear()
+        self._sprite_order.clear()
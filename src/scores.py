@@ -0,0 +1,101 @@
+"""
+Persistent high scores, session stats and player profiles for TejasThrust game
+
+Everything is stored in a local SQLite database in WAL mode. Sessions are
+written in a single transaction when a game ends, and the leaderboard query
+is served straight from an index on score, so it stays instant even with
+hundreds of thousands of recorded sessions.
+"""
+
+import os
+import sqlite3
+import time
+from src.config import *
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    created_at REAL NOT NULL,
+    games_played INTEGER NOT NULL DEFAULT 0,
+    best_score INTEGER NOT NULL DEFAULT 0,
+    total_kills INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    player_id INTEGER NOT NULL REFERENCES players(id),
+    score INTEGER NOT NULL,
+    kills INTEGER NOT NULL,
+    bosses INTEGER NOT NULL,
+    shots INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    ended_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_by_score ON sessions (score DESC, ended_at);
+CREATE INDEX IF NOT EXISTS sessions_by_player ON sessions (player_id, score DESC);
+"""
+
+
+class ScoreStore:
+    """SQLite-backed store for high scores, sessions and player profiles"""
+
+    def __init__(self, path=SCORES_DB_PATH):
+        path = os.path.expanduser(path)
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+
+    def record_session(self, player, score, kills=0, bosses=0, shots=0, duration=0.0):
+        """Record one finished game"""
+        self.record_sessions([(player, score, kills, bosses, shots, duration, time.time())])
+
+    def record_sessions(self, sessions):
+        """Record many finished games in one transaction
+
+        Each session is a (player, score, kills, bosses, shots, duration,
+        ended_at) tuple.
+        """
+        with self.conn:
+            now = time.time()
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO players (name, created_at) VALUES (?, ?)",
+                {(session[0], now) for session in sessions})
+            self.conn.executemany(
+                "INSERT INTO sessions (player_id, score, kills, bosses, shots, duration, ended_at) "
+                "SELECT id, ?, ?, ?, ?, ?, ? FROM players WHERE name = ?",
+                [(*session[1:], session[0]) for session in sessions])
+            self.conn.executemany(
+                "UPDATE players SET games_played = games_played + 1, "
+                "best_score = MAX(best_score, ?), total_kills = total_kills + ? WHERE name = ?",
+                [(session[1], session[2], session[0]) for session in sessions])
+
+    def top_scores(self, limit=LEADERBOARD_SIZE, player=None):
+        """Get the best (name, score, ended_at) entries, best first"""
+        if player is None:
+            rows = self.conn.execute(
+                "SELECT players.name, sessions.score, sessions.ended_at FROM sessions "
+                "JOIN players ON players.id = sessions.player_id "
+                "ORDER BY sessions.score DESC, sessions.ended_at LIMIT ?", (limit,))
+        else:
+            rows = self.conn.execute(
+                "SELECT players.name, sessions.score, sessions.ended_at FROM sessions "
+                "JOIN players ON players.id = sessions.player_id "
+                "WHERE players.name = ? ORDER BY sessions.score DESC LIMIT ?", (player, limit))
+        return rows.fetchall()
+
+    def profile(self, player):
+        """Get a player's profile as a dict, or None for unknown players"""
+        row = self.conn.execute(
+            "SELECT name, created_at, games_played, best_score, total_kills "
+            "FROM players WHERE name = ?", (player,)).fetchone()
+        if row is None:
+            return None
+        keys = ("name", "created_at", "games_played", "best_score", "total_kills")
+        return dict(zip(keys, row))
+
+    def close(self):
+        """Close the database"""
+        self.conn.close()
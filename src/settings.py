@@ -0,0 +1,155 @@
+"""
+Runtime settings for TejasThrust game
+
+`Settings` holds the gameplay values that can be tuned without a restart.
+Its defaults come from src/config.py, and a JSON settings file can override
+them per profile (kiosk, dev, stress, ...). Game objects copy the values
+they need into plain attributes when they are created or when settings are
+applied, so the per-frame code reads the same attributes as before and a
+live reload costs nothing between changes.
+"""
+
+import dataclasses
+import json
+import logging
+import math
+import os
+import time
+from dataclasses import dataclass
+from src.config import *
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Tunable gameplay values"""
+
+    fps: int = FPS
+    player_speed: float = PLAYER_SPEED
+    player_shoot_cooldown: int = 200  # milliseconds
+    laser_speed: float = LASER_SPEED
+    enemy_speed: float = ENEMY_SPEED
+    enemy_health: int = ENEMY_HEALTH
+    enemy_shoot_cooldown: int = 1000
+    enemy_laser_speed: float = ENEMY_LASER_SPEED
+    enemy_spawn_interval: int = ENEMY_SPAWN_INTERVAL
+    enemy_shoot_chance: float = ENEMY_SHOOT_CHANCE
+    boss_speed: float = BOSS_SPEED
+    boss_health: int = BOSS_HEALTH
+    boss_shoot_cooldown: int = 800
+    boss_laser_speed: float = BOSS_LASER_SPEED
+    boss_laser_damage: int = BOSS_LASER_DAMAGE
+    boss_spawn_count: int = BOSS_SPAWN_COUNT
+
+    def replace(self, **changes):
+        """Copy with some values changed, checking names and types"""
+        return dataclasses.replace(self, **_coerce(changes))
+
+
+DEFAULT_SETTINGS = Settings()
+
+_FIELD_TYPES = {field.name: field.type for field in dataclasses.fields(Settings)}
+
+
+# Every other setting is divided by, or must move or hurt, so must be above 0
+_CHANCES = {"enemy_shoot_chance"}  # probabilities, 0 to 1
+_COOLDOWNS = {"player_shoot_cooldown", "enemy_shoot_cooldown", "boss_shoot_cooldown"}  # 0 or more
+
+
+def _coerce(values):
+    """Check setting names and ranges and convert values to the field types"""
+    result = {}
+    for name, value in values.items():
+        if name not in _FIELD_TYPES:
+            raise ValueError(f"unknown setting '{name}'")
+        number = isinstance(value, (int, float)) and not isinstance(value, bool)
+        if not number or not math.isfinite(value):
+            raise ValueError(f"setting '{name}' must be a number, got {value!r}")
+        if _FIELD_TYPES[name] is int and value != int(value):
+            raise ValueError(f"setting '{name}' must be a whole number, got {value!r}")
+        if name in _CHANCES:
+            valid = 0 <= value <= 1
+        elif name in _COOLDOWNS:
+            valid = value >= 0
+        else:
+            valid = value > 0
+        if not valid:
+            raise ValueError(f"setting '{name}' is out of range: {value!r}")
+        result[name] = _FIELD_TYPES[name](value)
+    return result
+
+
+def load_settings(path=SETTINGS_PATH, profile=None):
+    """Load settings for a profile from a JSON settings file
+
+    The file looks like {"default_profile": "kiosk", "profiles": {"kiosk":
+    {...}, "stress": {"extends": "dev", ...}}}. A missing file or no profile
+    gives the defaults; an unknown profile or bad value raises ValueError.
+    """
+    if not os.path.exists(path):
+        if profile:
+            raise ValueError(f"settings file '{path}' not found for profile '{profile}'")
+        return DEFAULT_SETTINGS
+    with open(path, encoding="utf-8") as file:
+        data = json.load(file)
+    profiles = data.get("profiles", {})
+    profile = profile or data.get("default_profile")
+    if not profile:
+        return DEFAULT_SETTINGS
+    return DEFAULT_SETTINGS.replace(**_resolve_profile(profiles, profile))
+
+
+def _resolve_profile(profiles, name, seen=()):
+    """Merge a profile with the profiles it extends"""
+    if name not in profiles:
+        raise ValueError(f"unknown settings profile '{name}'")
+    if name in seen:
+        raise ValueError(f"settings profile '{name}' extends itself")
+    values = dict(profiles[name])
+    parent = values.pop("extends", None)
+    if parent is None:
+        return values
+    merged = _resolve_profile(profiles, parent, seen + (name,))
+    merged.update(values)
+    return merged
+
+
+class SettingsWatcher:
+    """Reloads a settings file when it changes on disk
+
+    `poll()` is cheap enough to call every frame: it only looks at the file
+    once per SETTINGS_POLL_INTERVAL.
+    """
+
+    def __init__(self, path=SETTINGS_PATH, profile=None, interval=SETTINGS_POLL_INTERVAL):
+        self.path = path
+        self.profile = profile
+        self.interval = interval
+        self._mtime = self._file_mtime()
+        self._next_check = time.monotonic() + interval
+
+    def _file_mtime(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def poll(self):
+        """Return new settings if the file changed and is valid, else None"""
+        now = time.monotonic()
+        if now < self._next_check:
+            return None
+        self._next_check = now + self.interval
+        mtime = self._file_mtime()
+        if mtime == self._mtime:
+            return None
+        self._mtime = mtime
+        try:
+            settings = load_settings(self.path, self.profile)
+        except (OSError, ValueError) as error:
+            # Keep playing with the old settings until the file is fixed
+            logger.warning("ignoring settings change in %s: %s", self.path, error)
+            return None
+        logger.info("reloaded settings from %s", self.path)
+        return settings
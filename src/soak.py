@@ -0,0 +1,88 @@
+"""
+Soak-test monitoring for TejasThrust game
+
+Collects frame times, entity counts and memory use during long runs and
+reports how they drifted, so leaks such as lasers that are never culled show
+up as steadily growing numbers.
+"""
+
+import os
+import sys
+import time
+from src.config import *
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def current_rss_mb():
+    """Resident memory of this process in megabytes"""
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        # Not Linux: fall back to the peak, which still shows growth
+        if resource is None:
+            return 0.0
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class SoakMonitor:
+    """Samples frame time, entity counts and memory at a fixed interval"""
+
+    def __init__(self, interval=SOAK_SAMPLE_INTERVAL, output=None):
+        self.interval = interval
+        self.output = output or sys.stdout
+        self.samples = []
+        self.games = 1
+        self._start = time.perf_counter()
+        self._next_sample = self._start + interval
+        self._frame_ms = []
+
+    def frame(self, game, frame_ms):
+        """Record one frame; takes a sample when the interval has passed"""
+        self._frame_ms.append(frame_ms)
+        now = time.perf_counter()
+        if now >= self._next_sample:
+            self._next_sample = now + self.interval
+            self.sample(game, now)
+
+    def sample(self, game, now=None):
+        """Take a sample of the current game and print it"""
+        now = time.perf_counter() if now is None else now
+        frames = self._frame_ms or [0]
+        sample = {
+            "elapsed": now - self._start,
+            "frame_ms": sum(frames) / len(frames),
+            "frame_ms_max": max(frames),
+            "enemies": len(game.enemies),
+            "player_lasers": len(game.player_lasers),
+            "enemy_lasers": len(game.enemy_lasers),
+            "particles": game.particles.alive_count(),
+            "rss_mb": current_rss_mb(),
+        }
+        self._frame_ms = []
+        self.samples.append(sample)
+        print("[soak] {elapsed:8.0f}s frame {frame_ms:5.2f}ms (max {frame_ms_max:5.1f}) "
+              "enemies {enemies:3d} lasers {player_lasers:3d}/{enemy_lasers:3d} "
+              "particles {particles:4d} rss {rss_mb:7.1f}MB".format(**sample), file=self.output)
+
+    def report(self):
+        """Summarize drift between the first and last samples"""
+        if len(self.samples) < 2:
+            return "[soak] not enough samples for a report"
+        first, last = self.samples[0], self.samples[-1]
+        peak = {key: max(sample[key] for sample in self.samples)
+                for key in ("enemies", "player_lasers", "enemy_lasers", "particles", "rss_mb")}
+        return (f"[soak] {last['elapsed']:.0f}s, {self.games} game(s), {len(self.samples)} samples\n"
+                f"[soak] frame time {first['frame_ms']:.2f}ms -> {last['frame_ms']:.2f}ms "
+                f"(drift {last['frame_ms'] - first['frame_ms']:+.2f}ms)\n"
+                f"[soak] memory {first['rss_mb']:.1f}MB -> {last['rss_mb']:.1f}MB "
+                f"(drift {last['rss_mb'] - first['rss_mb']:+.1f}MB)\n"
+                f"[soak] peak entities: enemies {peak['enemies']}, "
+                f"player lasers {peak['player_lasers']}, enemy lasers {peak['enemy_lasers']}, "
+                f"particles {peak['particles']}")
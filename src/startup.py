@@ -0,0 +1,107 @@
+"""
+On-demand pygame initialization for TejasThrust game
+
+`pygame.init()` starts every pygame module, including audio and joysticks,
+even when a run needs none of them. Each run mode names the subsystems it
+uses and `init_pygame` starts only those, timing each one:
+
+* play: window, clock, fonts and audio
+* test: window, clock and fonts (no audio device needed)
+* headless: fonts only, for simulation, training and video export
+* benchmark: fonts only, for throughput runs
+* web: like play, for the browser build (see src/web.py)
+
+`measure_cold_start` times a mode from a fresh interpreter: importing the
+game and then constructing it.
+"""
+
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+import pygame
+from src.config import *
+
+MODES = {
+    "play": ("timer", "display", "font", "mixer"),
+    "test": ("timer", "display", "font"),
+    "headless": ("font",),
+    "benchmark": ("font",),
+    "web": ("timer", "display", "font", "mixer"),
+}
+HEADLESS_MODES = ("headless", "benchmark")
+OPTIONAL_SUBSYSTEMS = ("mixer",)  # the game plays silently without an audio device
+
+logger = logging.getLogger(__name__)
+
+
+def _init_timer():
+    """Start only SDL's timer, which the real-time clock needs"""
+    try:
+        from pygame._sdl2 import sdl2
+    except ImportError:  # pygame without SDL2 helpers: start everything
+        pygame.init()
+        return
+    sdl2.init_subsystem(sdl2.INIT_TIMER)
+
+
+# name -> (is it running, start it); SDL counts timer starts, so it is
+# simply started again rather than tracked across pygame.quit()
+_SUBSYSTEMS = {
+    "timer": (lambda: False, _init_timer),
+    "display": (pygame.display.get_init, pygame.display.init),
+    "font": (pygame.font.get_init, pygame.font.init),
+    "mixer": (pygame.mixer.get_init, pygame.mixer.init),
+}
+
+init_times = {}  # subsystem -> milliseconds its first init took
+
+
+def init_pygame(mode):
+    """Start the pygame subsystems a mode needs; returns them
+
+    Subsystems already running are left alone, so calling this again, or
+    for a second game in the same process, costs nothing.
+    """
+    if mode not in MODES:
+        raise ValueError(f"unknown mode '{mode}', expected one of {', '.join(MODES)}")
+    for name in MODES[mode]:
+        running, start_subsystem = _SUBSYSTEMS[name]
+        if not running():
+            start = time.perf_counter()
+            try:
+                start_subsystem()
+            except pygame.error as error:
+                if name not in OPTIONAL_SUBSYSTEMS:
+                    raise
+                logger.warning("%s unavailable: %s", name, error)
+                continue
+            init_times.setdefault(name, (time.perf_counter() - start) * 1000)
+    return MODES[mode]
+
+
+_COLD_START_SCRIPT = """
+import json, time
+start = time.perf_counter()
+import main
+imported = time.perf_counter()
+main.TejasThrust(mode={mode!r})
+ready = time.perf_counter()
+print(json.dumps({{"import_ms": (imported - start) * 1000, "init_ms": (ready - imported) * 1000}}))
+"""
+
+
+def measure_cold_start(mode, cwd=None):
+    """Time importing and constructing the game for a mode in a new interpreter
+
+    Returns {"import_ms", "init_ms", "total_ms"}.
+    """
+    cwd = cwd or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    result = subprocess.run([sys.executable, "-c", _COLD_START_SCRIPT.format(mode=mode)],
+                            cwd=cwd, env=env, capture_output=True, text=True, check=True)
+    times = json.loads(result.stdout.strip().splitlines()[-1])
+    times["total_ms"] = times["import_ms"] + times["init_ms"]
+    return times
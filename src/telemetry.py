@@ -0,0 +1,119 @@
+"""
+Gameplay telemetry for TejasThrust game
+
+Events are appended to a bounded deque from the game loop (a single
+append, no locks or I/O) and written in batches to rotating JSONL files by
+a background thread. When the queue is full new events are dropped and
+counted instead of stalling the frame.
+"""
+
+import collections
+import glob
+import json
+import os
+import threading
+import time
+import uuid
+from src.config import *
+
+
+class Telemetry:
+    """Structured gameplay event stream with a background writer thread"""
+
+    def __init__(self, directory=TELEMETRY_DIR, max_queue=TELEMETRY_MAX_QUEUE,
+                 flush_interval=TELEMETRY_FLUSH_INTERVAL, max_file_bytes=TELEMETRY_MAX_FILE_BYTES,
+                 max_files=TELEMETRY_MAX_FILES):
+        self.directory = directory
+        self.max_queue = max_queue
+        self.flush_interval = flush_interval
+        self.max_file_bytes = max_file_bytes
+        self.max_files = max_files
+        self.session_id = uuid.uuid4().hex[:12]
+        self.dropped = 0  # events lost because the queue was full
+        self.written = 0
+
+        self._queue = collections.deque()
+        self._file = None
+        self._file_index = 0
+        self._stop = threading.Event()
+        os.makedirs(directory, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name="telemetry-writer", daemon=True)
+        self._thread.start()
+
+    def emit(self, event, **fields):
+        """Queue an event; never blocks, drops the event if the queue is full"""
+        if len(self._queue) >= self.max_queue:
+            self.dropped += 1
+            return
+        fields["event"] = event
+        fields["t"] = time.time()
+        self._queue.append(fields)
+
+    def close(self):
+        """Stop the writer thread and flush everything still queued"""
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        self._thread.join()
+        self._queue.append({"event": "telemetry_stats", "t": time.time(),
+                            "written": self.written, "dropped": self.dropped})
+        self._flush()
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def _run(self):
+        """Writer thread: flush a batch every interval until stopped"""
+        while not self._stop.wait(self.flush_interval):
+            self._flush()
+
+    def _flush(self):
+        """Write every queued event to the current file"""
+        if not self._queue:
+            return
+        lines = []
+        session = self.session_id
+        while self._queue:
+            event = self._queue.popleft()
+            event["session"] = session
+            lines.append(json.dumps(event, separators=(",", ":")))
+        self.written += len(lines)
+
+        file = self._current_file()
+        file.write("\n".join(lines) + "\n")
+        file.flush()
+
+    def _current_file(self):
+        """Get the file to write to, rotating it when it grows too big"""
+        if self._file and self._file.tell() >= self.max_file_bytes:
+            self._file.close()
+            self._file = None
+            self._file_index += 1
+        if self._file is None:
+            name = f"telemetry-{self.session_id}-{self._file_index:04d}.jsonl"
+            self._file = open(os.path.join(self.directory, name), "a", encoding="utf-8")
+            self._remove_old_files()
+        return self._file
+
+    def _remove_old_files(self):
+        """Keep only the newest `max_files` telemetry files"""
+        files = sorted(glob.glob(os.path.join(self.directory, "telemetry-*.jsonl")),
+                       key=lambda path: (os.path.getmtime(path), path))
+        for path in files[:-self.max_files]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+class NullTelemetry:
+    """Telemetry stand-in used when telemetry is disabled"""
+
+    dropped = 0
+    written = 0
+
+    def emit(self, event, **fields):
+        """Discard the event"""
+
+    def close(self):
+        """Nothing to close"""
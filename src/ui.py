@@ -1,144 +1,202 @@
-"""
-User Interface class for TejasThrust game
-"""
-
-import pygame
-from src.config import *
-
-class UI:
-    """User interface manager"""
-    
-    def __init__(self, screen):
-        self.screen = screen
-        self.font_large = pygame.font.Font(None, 48)
-        self.font_medium = pygame.font.Font(None, 32)
-        self.font_small = pygame.font.Font(None, 24)
-        self.font_button = pygame.font.Font(None, 18)
-        
-        # Try to load Comic Sans font
-        try:
-            self.font_large = pygame.font.SysFont('comicsansms', 48)
-            self.font_medium = pygame.font.SysFont('comicsansms', 32)
-            self.font_small = pygame.font.SysFont('comicsansms', 24)
-            self.font_button = pygame.font.SysFont('comicsansms', 18)
-        except:
-            # Fallback to default font
-            pass
-    
-    def draw(self, score, health, paused, game_over):
-        """Draw all UI elements"""
-        self._draw_score(score)
-        self._draw_health(health)
-        self._draw_buttons(paused)
-        
-        if paused:
-            self._draw_pause_overlay()
-        
-        if game_over:
-            self._draw_game_over(score)
-    
-    def _draw_score(self, score):
-        """Draw score in top right"""
-        score_text = self.font_small.render(f"Score: {score}", True, WHITE)
-        score_rect = score_text.get_rect()
-        score_rect.topright = (SCREEN_WIDTH - 20, 20)
-        
-        # Background for better readability
-        bg_rect = score_rect.inflate(20, 10)
-        pygame.draw.rect(self.screen, (0, 0, 0, 128), bg_rect)
-        
-        self.screen.blit(score_text, score_rect)
-    
-    def _draw_health(self, health):
-        """Draw health bar in top right"""
-        health_text = self.font_small.render(f"Health: {health}", True, WHITE)
-        health_rect = health_text.get_rect()
-        health_rect.topright = (SCREEN_WIDTH - 20, 60)
-        
-        # Background
-        bg_rect = health_rect.inflate(20, 10)
-        pygame.draw.rect(self.screen, (0, 0, 0, 128), bg_rect)
-        
-        self.screen.blit(health_text, health_rect)
-        
-        # Health bar
-        bar_width = 200
-        bar_height = 20
-        bar_x = SCREEN_WIDTH - 210
-        bar_y = 100
-        
-        # Background bar
-        pygame.draw.rect(self.screen, RED, (bar_x, bar_y, bar_width, bar_height))
-        
-        # Health bar
-        health_percentage = max(0, health / PLAYER_MAX_HEALTH)
-        health_width = int(bar_width * health_percentage)
-        if health_width > 0:
-            color = GREEN if health_percentage > 0.3 else (255, 165, 0) if health_percentage > 0.1 else RED
-            pygame.draw.rect(self.screen, color, (bar_x, bar_y, health_width, bar_height))
-        
-        # Border
-        pygame.draw.rect(self.screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
-    
-    def _draw_buttons(self, paused):
-        """Draw control buttons"""
-        # Exit button (bottom left)
-        exit_rect = pygame.Rect(20, SCREEN_HEIGHT - 60, BUTTON_WIDTH, BUTTON_HEIGHT)
-        pygame.draw.rect(self.screen, RED, exit_rect)
-        pygame.draw.rect(self.screen, WHITE, exit_rect, 2)
-        
-        exit_text = self.font_button.render("EXIT", True, WHITE)
-        exit_text_rect = exit_text.get_rect(center=exit_rect.center)
-        self.screen.blit(exit_text, exit_text_rect)
-        
-        # Pause/Resume button (bottom right)
-        pause_rect = pygame.Rect(SCREEN_WIDTH - 100, SCREEN_HEIGHT - 60, BUTTON_WIDTH, BUTTON_HEIGHT)
-        button_color = GREEN if paused else (255, 165, 0)  # Orange for pause, green for resume
-        pygame.draw.rect(self.screen, button_color, pause_rect)
-        pygame.draw.rect(self.screen, WHITE, pause_rect, 2)
-        
-        pause_text = "RESUME" if paused else "PAUSE"
-        pause_surface = self.font_button.render(pause_text, True, WHITE)
-        pause_text_rect = pause_surface.get_rect(center=pause_rect.center)
-        self.screen.blit(pause_surface, pause_text_rect)
-    
-    def _draw_pause_overlay(self):
-        """Draw pause overlay"""
-        # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
-        
-        # Pause text
-        pause_text = self.font_large.render("GAME PAUSED", True, WHITE)
-        pause_rect = pause_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        self.screen.blit(pause_text, pause_rect)
-        
-        # Instructions
-        instruction_text = self.font_medium.render("Click RESUME to continue", True, WHITE)
-        instruction_rect = instruction_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 60))
-        self.screen.blit(instruction_text, instruction_rect)
-    
-    def _draw_game_over(self, score):
-        """Draw game over screen"""
-        # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(180)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
-        
-        # Game over text
-        game_over_text = self.font_large.render("GAME OVER", True, RED)
-        game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 60))
-        self.screen.blit(game_over_text, game_over_rect)
-        
-        # Final score
-        score_text = self.font_medium.render(f"Final Score: {score}", True, WHITE)
-        score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        self.screen.blit(score_text, score_rect)
-        
-        # Instructions
-        instruction_text = self.font_medium.render("Click EXIT to quit", True, WHITE)
-        instruction_rect = instruction_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 60))
-        self.screen.blit(instruction_text, instruction_rect)
+"""
+User Interface class for TejasThrust game
+
+Colors come from the palette and sizes from the HUD scale when the UI is
+created; the game makes a new UI when either changes.
+"""
+
+import pygame
+from src.config import *
+from src.accessibility import PALETTE
+
+class UI:
+    """User interface manager"""
+    
+    def __init__(self, screen, hud_scale=1.0, system_fonts=True):
+        self.screen = screen
+        self.hud_scale = hud_scale
+        self.font_large = pygame.font.Font(None, self._px(48))
+        self.font_medium = pygame.font.Font(None, self._px(32))
+        self.font_small = pygame.font.Font(None, self._px(24))
+        self.font_button = pygame.font.Font(None, self._px(18))
+        
+        # The browser build starts with the default font and loads the
+        # system fonts after the first frame (see src/web.py)
+        if system_fonts:
+            self.load_system_fonts()
+        
+        # Colors in the current palette
+        self.text_color = PALETTE[WHITE]
+        self.alert_color = PALETTE[RED]
+        self.health_colors = (PALETTE[GREEN], PALETTE[ORANGE], PALETTE[RED])  # good, low, critical
+        self.title_color = PALETTE[LASER_COLOR]
+        
+        # Button hit areas, shared with the game's click handling
+        button_width, button_height = self._px(BUTTON_WIDTH), self._px(BUTTON_HEIGHT)
+        self.exit_rect = pygame.Rect(20, SCREEN_HEIGHT - 20 - button_height, button_width, button_height)
+        self.pause_rect = pygame.Rect(SCREEN_WIDTH - 20 - button_width, SCREEN_HEIGHT - 20 - button_height,
+                                      button_width, button_height)
+        
+        # Full-screen overlays are built once instead of every frame
+        self._pause_overlay = self._make_overlay(128)
+        self._game_over_overlay = self._make_overlay(180)
+        
+        # Rendered leaderboard lines, only re-rendered when the scores change
+        self._leaderboard_key = None
+        self._leaderboard_lines = []
+    
+    def load_system_fonts(self):
+        """Switch to Comic Sans where the system has it"""
+        try:
+            self.font_large = pygame.font.SysFont('comicsansms', self._px(48))
+            self.font_medium = pygame.font.SysFont('comicsansms', self._px(32))
+            self.font_small = pygame.font.SysFont('comicsansms', self._px(24))
+            self.font_button = pygame.font.SysFont('comicsansms', self._px(18))
+        except:
+            # Fallback to default font
+            pass
+        self._leaderboard_key = None  # render the leaderboard again in the new font
+    
+    def _px(self, size):
+        """A HUD size in pixels at the HUD scale"""
+        return int(size * self.hud_scale)
+    
+    def _make_overlay(self, alpha):
+        """Create a semi-transparent black overlay covering the screen"""
+        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        overlay.set_alpha(alpha)
+        overlay.fill(BLACK)
+        return overlay
+    
+    def draw(self, score, health, paused, game_over, leaderboard=None):
+        """Draw all UI elements"""
+        self._draw_score(score)
+        self._draw_health(health)
+        self._draw_buttons(paused)
+        
+        if paused:
+            self._draw_pause_overlay()
+        
+        if game_over:
+            self._draw_game_over(score, leaderboard)
+    
+    def _draw_score(self, score):
+        """Draw score in top right"""
+        score_text = self.font_small.render(f"Score: {score}", True, self.text_color)
+        score_rect = score_text.get_rect()
+        score_rect.topright = (SCREEN_WIDTH - 20, 20)
+        
+        # Background for better readability
+        bg_rect = score_rect.inflate(20, 10)
+        pygame.draw.rect(self.screen, (0, 0, 0, 128), bg_rect)
+        
+        self.screen.blit(score_text, score_rect)
+    
+    def _draw_health(self, health):
+        """Draw health bar in top right"""
+        health_text = self.font_small.render(f"Health: {health}", True, self.text_color)
+        health_rect = health_text.get_rect()
+        health_rect.topright = (SCREEN_WIDTH - 20, self._px(60))
+        
+        # Background
+        bg_rect = health_rect.inflate(20, 10)
+        pygame.draw.rect(self.screen, (0, 0, 0, 128), bg_rect)
+        
+        self.screen.blit(health_text, health_rect)
+        
+        # Health bar
+        bar_width = self._px(200)
+        bar_height = self._px(20)
+        bar_x = SCREEN_WIDTH - 10 - bar_width
+        bar_y = self._px(100)
+        good, low, critical = self.health_colors
+        
+        # Background bar
+        pygame.draw.rect(self.screen, critical, (bar_x, bar_y, bar_width, bar_height))
+        
+        # Health bar
+        health_percentage = max(0, health / PLAYER_MAX_HEALTH)
+        health_width = int(bar_width * health_percentage)
+        if health_width > 0:
+            color = good if health_percentage > 0.3 else low if health_percentage > 0.1 else critical
+            pygame.draw.rect(self.screen, color, (bar_x, bar_y, health_width, bar_height))
+        
+        # Border
+        pygame.draw.rect(self.screen, self.text_color, (bar_x, bar_y, bar_width, bar_height), 2)
+    
+    def _draw_buttons(self, paused):
+        """Draw control buttons"""
+        # Exit button (bottom left)
+        exit_rect = self.exit_rect
+        pygame.draw.rect(self.screen, self.alert_color, exit_rect)
+        pygame.draw.rect(self.screen, self.text_color, exit_rect, 2)
+        
+        exit_text = self.font_button.render("EXIT", True, self.text_color)
+        exit_text_rect = exit_text.get_rect(center=exit_rect.center)
+        self.screen.blit(exit_text, exit_text_rect)
+        
+        # Pause/Resume button (bottom right)
+        pause_rect = self.pause_rect
+        good, low, _ = self.health_colors
+        button_color = good if paused else low  # Orange for pause, green for resume
+        pygame.draw.rect(self.screen, button_color, pause_rect)
+        pygame.draw.rect(self.screen, self.text_color, pause_rect, 2)
+        
+        pause_text = "RESUME" if paused else "PAUSE"
+        pause_surface = self.font_button.render(pause_text, True, self.text_color)
+        pause_text_rect = pause_surface.get_rect(center=pause_rect.center)
+        self.screen.blit(pause_surface, pause_text_rect)
+    
+    def _draw_pause_overlay(self):
+        """Draw pause overlay"""
+        # Semi-transparent overlay
+        self.screen.blit(self._pause_overlay, (0, 0))
+        
+        # Pause text
+        pause_text = self.font_large.render("GAME PAUSED", True, self.text_color)
+        pause_rect = pause_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        self.screen.blit(pause_text, pause_rect)
+        
+        # Instructions
+        instruction_text = self.font_medium.render("Click RESUME to continue", True, self.text_color)
+        instruction_rect = instruction_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + self._px(60)))
+        self.screen.blit(instruction_text, instruction_rect)
+    
+    def _draw_game_over(self, score, leaderboard=None):
+        """Draw game over screen"""
+        # Semi-transparent overlay
+        self.screen.blit(self._game_over_overlay, (0, 0))
+        
+        # Game over text
+        game_over_text = self.font_large.render("GAME OVER", True, self.alert_color)
+        game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - self._px(60)))
+        self.screen.blit(game_over_text, game_over_rect)
+        
+        # Final score
+        score_text = self.font_medium.render(f"Final Score: {score}", True, self.text_color)
+        score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        self.screen.blit(score_text, score_rect)
+        
+        # Instructions
+        instruction_text = self.font_medium.render("Click EXIT to quit", True, self.text_color)
+        instruction_rect = instruction_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + self._px(60)))
+        self.screen.blit(instruction_text, instruction_rect)
+        
+        # High scores
+        if leaderboard:
+            self._draw_leaderboard(leaderboard)
+    
+    def _draw_leaderboard(self, leaderboard):
+        """Draw the top scores below the game over text"""
+        key = tuple(leaderboard)
+        if key != self._leaderboard_key:
+            self._leaderboard_key = key
+            self._leaderboard_lines = [self.font_small.render("HIGH SCORES", True, self.title_color)]
+            for rank, (name, best, _) in enumerate(leaderboard, 1):
+                line = f"{rank}. {name}  {best}"
+                self._leaderboard_lines.append(self.font_small.render(line, True, self.text_color))
+        
+        y = SCREEN_HEIGHT // 2 + self._px(110)
+        for line in self._leaderboard_lines:
+            self.screen.blit(line, line.get_rect(center=(SCREEN_WIDTH // 2, y)))
+            y += line.get_height() + 4
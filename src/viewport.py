@@ -0,0 +1,95 @@
+"""
+Resolution-independent presentation for TejasThrust game
+
+The game always runs and draws in virtual SCREEN_WIDTH x SCREEN_HEIGHT
+coordinates. The viewport scales that canvas once per frame into the window,
+keeping its aspect ratio with black bars (letterboxing), and maps mouse
+positions from the window back to virtual coordinates.
+
+Screen shake is applied here too, as one offset on the final copy into the
+window; the game draws the same frame whether or not the view is shaking.
+"""
+
+import pygame
+from src.config import *
+
+
+class Viewport:
+    """Maps the fixed-size game canvas onto a window of any size"""
+
+    def __init__(self, window_size, virtual_size=(SCREEN_WIDTH, SCREEN_HEIGHT), smooth=VIEWPORT_SMOOTH):
+        self.virtual_size = virtual_size
+        self.smooth = smooth
+        self.resize(window_size)
+
+    def resize(self, window_size):
+        """Recompute the scale and letterbox for a new window size"""
+        self.window_size = window_size
+        virtual_w, virtual_h = self.virtual_size
+        window_w, window_h = window_size
+        # A minimised window can be 0x0; keep the scale above zero so mouse
+        # mapping still divides by it
+        self.scale = max(min(window_w / virtual_w, window_h / virtual_h),
+                         1 / max(virtual_w, virtual_h))
+        width = max(1, round(virtual_w * self.scale))
+        height = max(1, round(virtual_h * self.scale))
+        self.rect = pygame.Rect((window_w - width) // 2, (window_h - height) // 2, width, height)
+        # The game can draw straight into the window when no scaling is needed
+        self.direct = tuple(window_size) == tuple(self.virtual_size)
+        # Smooth scaling looks better for fractional and downscaled sizes;
+        # whole-number upscales (e.g. 2x, 3x) are exact with the faster scale
+        whole = self.scale >= 1 and self.scale == int(self.scale)
+        self._scale_fn = pygame.transform.smoothscale if self.smooth and not whole else pygame.transform.scale
+        self._needs_clear = True
+        self._shake_buffer = None  # the scaled frame while shaking
+
+    def present(self, canvas, window, offset=(0, 0)):
+        """Copy the canvas into the window, scaled and letterboxed
+
+        `offset` shakes the view: the frame is moved by that many virtual
+        pixels and the uncovered edge is left black.
+        """
+        if offset != (0, 0):
+            self._present_shaken(canvas, window, offset)
+            return
+        if self.direct and canvas is window:
+            return
+        if 0 in window.get_size():
+            return  # minimised: nothing to show
+        if self._needs_clear:
+            # Letterbox bars only need painting after a resize
+            window.fill(BLACK)
+            self._needs_clear = False
+        target = window.subsurface(self.rect)
+        if self.rect.size == canvas.get_size():
+            target.blit(canvas, (0, 0))
+            return
+        self.scale_into(canvas, target)
+
+    def _present_shaken(self, canvas, window, offset):
+        if 0 in window.get_size():
+            return
+        window.fill(BLACK)
+        self._needs_clear = True  # the bars need repainting once the shake stops
+        rect = self.rect.move(round(offset[0] * self.scale), round(offset[1] * self.scale))
+        if self.rect.size != canvas.get_size():
+            if self._shake_buffer is None or self._shake_buffer.get_size() != self.rect.size:
+                self._shake_buffer = pygame.Surface(self.rect.size, 0, canvas)
+            self.scale_into(canvas, self._shake_buffer)
+            canvas = self._shake_buffer
+        window.blit(canvas, rect)
+
+    def scale_into(self, canvas, target):
+        """Scale the canvas to fill a target surface"""
+        try:
+            self._scale_fn(canvas, target.get_size(), target)
+        except ValueError:
+            # smoothscale needs 24 or 32 bit surfaces
+            self._scale_fn = pygame.transform.scale
+            self._scale_fn(canvas, target.get_size(), target)
+
+    def to_virtual(self, pos):
+        """Convert a window position (e.g. the mouse) to virtual game coordinates"""
+        x = (pos[0] - self.rect.x) / self.scale
+        y = (pos[1] - self.rect.y) / self.scale
+        return int(x), int(y)
@@ -0,0 +1,170 @@
+"""
+Memory and object-count watchdog for long-running TejasThrust sessions
+
+A background thread wakes up at a low rate, counts live objects of the game's
+own types (planes, lasers, clouds, pygame Surfaces) plus the game's entity
+lists and the process RSS, and warns when any of them has grown steadily
+over the last few samples. With tracemalloc enabled the warning includes the
+top allocation sites since the previous sample. Sending SIGUSR1 writes a
+heap summary to a file.
+"""
+
+import collections
+import gc
+import logging
+import os
+import signal
+import threading
+import time
+import tracemalloc
+from src.config import *
+from src.soak import current_rss_mb
+
+logger = logging.getLogger(__name__)
+
+WATCHED_TYPES = ("Surface", "Laser", "EnemyPlane", "BossPlane", "PlayerPlane", "Cloud", "Rect")
+
+
+class MemoryWatchdog:
+    """Samples object counts and RSS in the background and flags steady growth"""
+
+    def __init__(self, game=None, interval=WATCHDOG_INTERVAL, window=WATCHDOG_WINDOW,
+                 trace=False, dump_dir=WATCHDOG_DUMP_DIR):
+        self.game = game
+        self.interval = interval
+        self.window = window
+        self.trace = trace
+        self.dump_dir = dump_dir
+        self.samples = collections.deque(maxlen=window)
+        self.growing = []  # metrics that grew over the whole window at the last check
+        self._snapshot = None
+        self._stopping = False
+        self._dump_requested = False
+        self._wake = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start sampling in a background thread and listen for SIGUSR1"""
+        if self.trace and not tracemalloc.is_tracing():
+            tracemalloc.start(WATCHDOG_TRACE_FRAMES)
+        if hasattr(signal, "SIGUSR1") and threading.current_thread() is threading.main_thread():
+            # The handler only sets a flag; the dump happens on the watchdog thread
+            signal.signal(signal.SIGUSR1, lambda signum, frame: self.request_dump())
+        self._thread = threading.Thread(target=self._run, name="memory-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background thread"""
+        self._stopping = True
+        self._wake.set()
+        if self._thread:
+            self._thread.join()
+
+    def request_dump(self):
+        """Ask the watchdog thread to write a heap summary as soon as possible"""
+        self._dump_requested = True
+        self._wake.set()
+
+    def _run(self):
+        next_sample = time.monotonic()
+        while True:
+            self._wake.wait(max(0.0, next_sample - time.monotonic()))
+            self._wake.clear()
+            if self._stopping:
+                break
+            if self._dump_requested:
+                self._dump_requested = False
+                path = self.write_heap_summary()
+                logger.info("heap summary written to %s", path)
+            if time.monotonic() >= next_sample:
+                self.check()
+                next_sample = time.monotonic() + self.interval
+
+    def sample(self):
+        """Count watched objects, entity lists and RSS"""
+        counts = dict.fromkeys(WATCHED_TYPES, 0)
+        objects = gc.get_objects()
+        # Surfaces and Rects are not tracked by the garbage collector, so they
+        # are found through the objects that refer to them. The scan is done
+        # in small chunks so the game thread gets the GIL back in between.
+        seen = set()
+        for start in range(0, len(objects), WATCHDOG_SCAN_CHUNK):
+            chunk = objects[start:start + WATCHDOG_SCAN_CHUNK]
+            for obj in chunk:
+                name = type(obj).__name__
+                if name in counts:
+                    counts[name] += 1
+            for obj in gc.get_referents(*chunk):
+                name = type(obj).__name__
+                if name in counts and not gc.is_tracked(obj) and id(obj) not in seen:
+                    seen.add(id(obj))
+                    counts[name] += 1
+            time.sleep(0)
+        del objects
+        game = self.game
+        if game is not None:
+            counts["game.enemies"] = len(game.enemies)
+            counts["game.bosses"] = len(game.bosses)
+            counts["game.player_lasers"] = len(game.player_lasers)
+            counts["game.enemy_lasers"] = len(game.enemy_lasers)
+        counts["rss_mb"] = current_rss_mb()
+        self.samples.append(counts)
+        return counts
+
+    def check(self):
+        """Take a sample and warn about metrics that only ever grew"""
+        self.sample()
+        self.growing = self._growing_metrics()
+        if self.growing:
+            logger.warning("steady growth over %d samples: %s", len(self.samples),
+                           ", ".join(f"{name} {first} -> {last}" for name, first, last in self.growing))
+            for line in self._top_allocations():
+                logger.warning("  %s", line)
+        elif self.trace:
+            self._snapshot = tracemalloc.take_snapshot()
+        return self.growing
+
+    def _growing_metrics(self):
+        """Metrics that never decreased and grew by more than the threshold"""
+        if len(self.samples) < self.window:
+            return []
+        growing = []
+        for name in self.samples[-1]:
+            values = [sample.get(name, 0) for sample in self.samples]
+            steady = all(a <= b for a, b in zip(values, values[1:]))
+            threshold = WATCHDOG_RSS_GROWTH_MB if name == "rss_mb" else WATCHDOG_COUNT_GROWTH
+            if steady and values[-1] - values[0] > threshold:
+                growing.append((name, round(values[0], 1), round(values[-1], 1)))
+        return growing
+
+    def _top_allocations(self, limit=WATCHDOG_TOP_SITES):
+        """Allocation sites that grew the most since the last snapshot"""
+        if not tracemalloc.is_tracing():
+            return []
+        snapshot = tracemalloc.take_snapshot()
+        if self._snapshot is None:
+            stats = snapshot.statistics("lineno")
+        else:
+            stats = snapshot.compare_to(self._snapshot, "lineno")
+        self._snapshot = snapshot
+        return [str(stat) for stat in stats[:limit]]
+
+    def write_heap_summary(self, path=None):
+        """Write live object counts by type (and allocation sites when tracing)"""
+        if path is None:
+            os.makedirs(self.dump_dir, exist_ok=True)
+            path = os.path.join(self.dump_dir, time.strftime("heap-%Y%m%d-%H%M%S.txt"))
+        objects = gc.get_objects()
+        counts = collections.Counter(type(obj).__name__ for obj in objects)
+        untracked = {id(obj): obj for obj in gc.get_referents(*objects) if not gc.is_tracked(obj)}
+        counts.update(type(obj).__name__ for obj in untracked.values())
+        del objects, untracked
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(f"rss_mb {current_rss_mb():.1f}\n\n")
+            for name, count in counts.most_common(WATCHDOG_DUMP_TYPES):
+                file.write(f"{count:10d} {name}\n")
+            if tracemalloc.is_tracing():
+                file.write("\ntop allocation sites:\n")
+                for stat in tracemalloc.take_snapshot().statistics("lineno")[:WATCHDOG_TOP_SITES]:
+                    file.write(f"{stat}\n")
+        return path
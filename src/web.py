@@ -0,0 +1,65 @@
+"""
+Browser build for TejasThrust game
+
+The browser build is the same game packaged with pygbag, which runs pygame
+on WebAssembly. A browser page must never block, so the game loop runs as a
+coroutine (TejasThrust.run_async) that hands control back to the browser
+with `await asyncio.sleep(0)` after every frame.
+
+The "web" mode is set up to show its first frame quickly and to draw less:
+
+* music and the UI's system fonts are not loaded up front. An
+  `AssetStreamer` loads them one step per frame, starting after the first
+  frame has been shown;
+* the particle buffer is smaller (WEB_PARTICLE_CAPACITY), scaling is
+  plain rather than smooth, there is no render thread, and the frame rate
+  is capped at WEB_FPS.
+
+`python main.py --web` plays the web mode in a desktop window. To try the
+real browser build locally:
+
+    pip install pygbag
+    pygbag --build .
+    python -m http.server 8000 --directory build/web
+
+then open http://localhost:8000.
+"""
+
+import collections
+import logging
+import pygame
+from src.config import *
+
+logger = logging.getLogger(__name__)
+
+
+class AssetStreamer:
+    """Runs loading steps one per frame, once the first frames have been shown"""
+
+    def __init__(self, steps, delay=WEB_STREAM_DELAY_FRAMES):
+        self.steps = collections.deque(steps)
+        self.delay = delay  # frames to show before the first step
+
+    @classmethod
+    def for_game(cls, game):
+        """Stream a web game's music and fonts"""
+        return cls([game.start_music, game.load_fonts])
+
+    @property
+    def done(self):
+        """True once every step has run"""
+        return not self.steps
+
+    def frame(self):
+        """Call after each frame is shown; runs the next step when it is due"""
+        if self.delay > 0:
+            self.delay -= 1
+            return
+        if not self.steps:
+            return
+        step = self.steps.popleft()
+        try:
+            step()
+        except (pygame.error, OSError) as error:
+            # A missing asset leaves the game as it was, not stopped
+            logger.warning("could not load %s: %s", getattr(step, "__name__", step), error)
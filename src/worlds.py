@@ -0,0 +1,268 @@
+"""
+Many independent headless game worlds across CPU cores
+
+`WorldManager` hosts a number of `TejasThrustEnv` worlds, split into
+contiguous shards with one worker process per shard. Observations, actions,
+rewards and step counters live in `multiprocessing.shared_memory` blocks,
+so only short commands travel through the pipes and observations are never
+pickled.
+
+Worlds run in one of two modes:
+
+* lock-step: `step(actions)` advances every world by one step and waits for
+  all of them, like a vector environment;
+* free-running: `start()` lets every worker step its worlds as fast as it
+  can with a policy (random or the autopilot) until `stop()`.
+
+Every world is a deterministic game (src/determinism.py) with its own
+random streams, so a world plays the same from its seed whichever worlds
+share its worker. Worlds reset without a seed get a random one each.
+
+`stats()` reports the aggregate throughput in simulated game frames per
+second.
+"""
+
+import multiprocessing
+import os
+import random
+import time
+from multiprocessing import shared_memory
+import numpy as np
+from src.config import *
+from src.env import OBSERVATION_SIZE, TejasThrustEnv, _step_autoreset, key_action
+
+
+class RandomPolicy:
+    """Picks a random action every step"""
+
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+
+    def __call__(self, env):
+        return self.rng.randrange(env.action_count)
+
+
+class AutopilotPolicy:
+    """Flies with the scripted autopilot"""
+
+    def __init__(self, seed=None):
+        from src.autopilot import Autopilot
+        self.autopilot = Autopilot()
+
+    def __call__(self, env):
+        keys, shoot = self.autopilot.decide(env.game)
+        return key_action(keys, shoot)
+
+
+class _SharedArrays:
+    """NumPy arrays backed by named shared memory blocks"""
+
+    def __init__(self, specs, names=None):
+        self.blocks = {}
+        self.arrays = {}
+        for key, (shape, dtype) in specs.items():
+            size = max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+            if names is None:
+                block = shared_memory.SharedMemory(create=True, size=size)
+            else:
+                block = shared_memory.SharedMemory(name=names[key])
+            self.blocks[key] = block
+            self.arrays[key] = np.ndarray(shape, dtype, buffer=block.buf)
+        self.names = {key: block.name for key, block in self.blocks.items()}
+
+    def close(self, unlink=False):
+        self.arrays.clear()  # views must go before the memory is closed
+        for block in self.blocks.values():
+            block.close()
+            if unlink:
+                block.unlink()
+
+
+def _array_specs(num_worlds, env_kwargs):
+    if env_kwargs.get("observation") == "frame":
+        width, height = env_kwargs.get("frame_size", OBS_FRAME_SIZE)
+        obs_spec = ((num_worlds, height, width, 3), np.uint8)
+    else:
+        obs_spec = ((num_worlds, OBSERVATION_SIZE), np.float32)
+    return {
+        "obs": obs_spec,
+        "actions": ((num_worlds,), np.int32),
+        "rewards": ((num_worlds,), np.float32),
+        "terminated": ((num_worlds,), np.bool_),
+        "truncated": ((num_worlds,), np.bool_),
+        "steps": ((num_worlds,), np.int64),  # steps taken by each world so far
+        "stop": ((1,), np.bool_),  # set to end free-running mode
+    }
+
+
+class WorldManager:
+    """Runs many headless worlds in worker processes with shared buffers"""
+
+    def __init__(self, num_worlds, num_workers=None, policy=RandomPolicy, context=None, **env_kwargs):
+        self.num_worlds = num_worlds
+        self.num_workers = max(1, min(num_workers or os.cpu_count() or 1, num_worlds))
+        self.frame_skip = env_kwargs.get("frame_skip", 1)
+        self.running = False
+        # Worlds in one process would otherwise share the random module
+        env_kwargs = dict(env_kwargs, deterministic=True)
+        self._shared = _SharedArrays(_array_specs(num_worlds, env_kwargs))
+        arrays = self._shared.arrays
+        self.observations = arrays["obs"]
+        self.actions = arrays["actions"]
+        self.rewards = arrays["rewards"]
+        self.terminated = arrays["terminated"]
+        self.truncated = arrays["truncated"]
+        self.steps = arrays["steps"]
+        self._stop = arrays["stop"]
+        self.steps[:] = 0
+        self._start_time = time.perf_counter()
+        self._start_steps = 0
+
+        # Contiguous shards, as even as possible
+        bounds = np.linspace(0, num_worlds, self.num_workers + 1).astype(int)
+        self.shards = list(zip(bounds[:-1].tolist(), bounds[1:].tolist()))
+
+        ctx = multiprocessing.get_context(context)
+        self.remotes = []
+        self.processes = []
+        for shard in self.shards:
+            remote, worker_remote = ctx.Pipe()
+            process = ctx.Process(target=_worker, daemon=True,
+                                  args=(worker_remote, self._shared.names, shard, num_worlds,
+                                        env_kwargs, policy))
+            process.start()
+            worker_remote.close()
+            self.remotes.append(remote)
+            self.processes.append(process)
+
+    def _command(self, command, data=None):
+        for remote in self.remotes:
+            remote.send((command, data))
+        return [remote.recv() for remote in self.remotes]
+
+    def reset(self, seed=None):
+        """Reset every world; seeds are `seed + index` when given
+
+        Returns the shared observation array, which later calls overwrite.
+        """
+        self._command("reset", seed)
+        self.reset_stats()
+        return self.observations
+
+    def step(self, actions):
+        """Lock-step: advance every world once and wait for all of them
+
+        Returns (observations, rewards, terminated, truncated, infos). The
+        arrays are views of shared memory that the next step overwrites;
+        finished worlds are reset automatically, and their info holds the
+        last observation as "final_observation".
+        """
+        if self.running:
+            raise RuntimeError("worlds are free-running; stop() them first")
+        self.actions[:] = actions
+        infos = [info for shard_infos in self._command("step") for info in shard_infos]
+        return self.observations, self.rewards, self.terminated, self.truncated, infos
+
+    def start(self):
+        """Free-running: every worker steps its worlds with the policy until stop()"""
+        if self.running:
+            return
+        self._stop[0] = False
+        for remote in self.remotes:
+            remote.send(("run", None))
+        self.running = True
+
+    def stop(self):
+        """End free-running mode and wait for the workers"""
+        if not self.running:
+            return
+        self._stop[0] = True
+        for remote in self.remotes:
+            remote.recv()
+        self.running = False
+
+    def run_for(self, seconds):
+        """Free-run for a number of seconds and return the throughput stats"""
+        self.reset_stats()
+        self.start()
+        time.sleep(seconds)
+        self.stop()
+        return self.stats()
+
+    def reset_stats(self):
+        """Start measuring throughput from now"""
+        self._start_time = time.perf_counter()
+        self._start_steps = int(self.steps.sum())
+
+    def stats(self):
+        """Aggregate throughput since the last reset_stats()"""
+        elapsed = time.perf_counter() - self._start_time
+        steps = int(self.steps.sum()) - self._start_steps
+        frames = steps * self.frame_skip
+        return {"worlds": self.num_worlds, "workers": self.num_workers,
+                "elapsed": elapsed, "steps": steps, "frames": frames,
+                "frames_per_sec": frames / elapsed if elapsed > 0 else 0.0}
+
+    def close(self):
+        """Stop the workers and free the shared memory"""
+        self.stop()
+        for remote in self.remotes:
+            try:
+                remote.send(("close", None))
+            except (BrokenPipeError, EOFError):
+                pass
+        for process in self.processes:
+            process.join(timeout=5)
+        self.observations = self.actions = self.rewards = None
+        self.terminated = self.truncated = self.steps = self._stop = None
+        self._shared.close(unlink=True)
+
+
+def _worker(remote, names, shard, num_worlds, env_kwargs, policy_factory):
+    """Worker process loop: steps the worlds in one shard"""
+    shared = _SharedArrays(_array_specs(num_worlds, env_kwargs), names)
+    arrays = shared.arrays
+    start, end = shard
+    envs = {i: TejasThrustEnv(**env_kwargs) for i in range(start, end)}
+    policies = {}
+    seeds = random.SystemRandom()  # forked workers share the random module's state
+
+    def step(i, action):
+        obs, reward, terminated, truncated, info = _step_autoreset(envs[i], action)
+        arrays["obs"][i] = obs
+        arrays["rewards"][i] = reward
+        arrays["terminated"][i] = terminated
+        arrays["truncated"][i] = truncated
+        arrays["steps"][i] += 1
+        return info
+
+    try:
+        while True:
+            command, data = remote.recv()
+            if command == "step":
+                actions = arrays["actions"]
+                remote.send([step(i, int(actions[i])) for i in range(start, end)])
+            elif command == "reset":
+                for i, env in envs.items():
+                    seed = seeds.randrange(2 ** 32) if data is None else data + i
+                    arrays["obs"][i] = env.reset(seed)[0]
+                    policies[i] = policy_factory(seed)
+                remote.send(None)
+            elif command == "run":
+                stop = arrays["stop"]
+                for i in envs:
+                    if i not in policies:
+                        policies[i] = policy_factory(i)
+                while not stop[0]:
+                    for i, env in envs.items():
+                        step(i, policies[i](env))
+                remote.send(None)
+            elif command == "close":
+                break
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        for env in envs.values():
+            env.close()
+        shared.close()
+        remote.close()
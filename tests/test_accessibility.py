@@ -0,0 +1,127 @@
+"""
+Unit tests for palettes and accessibility presets
+"""
+
+import os
+import sys
+import pytest
+import pygame
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from main import TejasThrust, parse_args
+from src.accessibility import PALETTE, STANDARD, Palette, next_preset, preset
+from src.laser import Laser
+from src.settings import DEFAULT_SETTINGS
+from src.config import *
+
+class TestPresets:
+    """Test palettes and presets on their own"""
+
+    def test_palette_maps_base_colors(self):
+        """A palette changes the colors it lists and leaves the rest"""
+        palette = Palette("colorblind")
+        assert palette[RED] == PALETTES["colorblind"][RED]
+        assert palette[WHITE] == WHITE
+        assert Palette()[RED] == RED
+
+    def test_base_colors_distinct(self):
+        """Recoloring one base color never recolors another"""
+        base = [SKY_COLOR, PLAYER_COLOR, ENEMY_COLOR, BOSS_COLOR, LASER_COLOR, WHITE, BLACK,
+                RED, GREEN, ORANGE, CLOUD_COLOR, BOSS_TRAIL_COLOR]
+        assert len(set(base)) == len(base)
+
+    def test_unknown_names(self):
+        """Unknown palettes and presets are rejected"""
+        with pytest.raises(ValueError):
+            Palette("sepia")
+        with pytest.raises(ValueError):
+            preset("sepia")
+
+    def test_kids_preset(self):
+        """The kids preset combines a safe palette, a larger HUD and a slower game"""
+        kids = preset("kids")
+        assert kids.palette == "colorblind"
+        assert kids.hud_scale > 1
+        assert kids.game_speed < 1
+
+    def test_game_speed_adjusts_settings(self):
+        """Slower games move slower and spawn and shoot less often"""
+        settings = preset("slow").adjust(DEFAULT_SETTINGS)
+        assert settings.enemy_speed == pytest.approx(DEFAULT_SETTINGS.enemy_speed * 0.7)
+        assert settings.enemy_spawn_interval > DEFAULT_SETTINGS.enemy_spawn_interval
+        assert STANDARD.adjust(DEFAULT_SETTINGS) is DEFAULT_SETTINGS
+
+    def test_presets_cycle(self):
+        """Switching goes through every preset and back to the start"""
+        seen = [STANDARD.name]
+        accessibility = next_preset(STANDARD)
+        while accessibility.name != STANDARD.name:
+            seen.append(accessibility.name)
+            accessibility = next_preset(accessibility)
+        assert seen == list(ACCESSIBILITY_PRESETS)
+
+    def test_command_line(self):
+        """A preset can be chosen on the command line"""
+        assert parse_args(["--accessibility", "kids"]).accessibility == "kids"
+
+class TestGameAccessibility:
+    """Test switching presets in a running game"""
+
+    @pytest.fixture
+    def game(self):
+        """Create a headless game, leaving the default palette behind"""
+        game = TejasThrust(mode="headless")
+        yield game
+        game.set_accessibility(STANDARD)
+        game.telemetry.close()
+
+    def test_sprites_rebaked_on_switch(self, game):
+        """Switching palette bakes sprites again, in the new colors"""
+        laser = Laser(100, 100, 5, RED)
+        before = laser.get_sprite()[0]
+        game.set_accessibility(preset("colorblind"))
+        after = laser.get_sprite()[0]
+        assert after is not before
+        assert after.get_at(after.get_rect().center)[:3] == PALETTES["colorblind"][RED]
+        assert laser.get_sprite()[0] is after
+        assert laser.color == RED
+
+    def test_same_palette_keeps_sprites(self, game):
+        """Presets that keep the palette keep the baked sprites"""
+        sprite = game.player.get_sprite()[0]
+        game.set_accessibility(preset("large_hud"))
+        assert game.player.get_sprite()[0] is sprite
+
+    def test_sky_and_clouds(self, game):
+        """The sky and the clouds are drawn in the palette's colors"""
+        cloud = game.clouds[0]
+        game.set_accessibility(preset("high_contrast"))
+        center = (cloud.size // 2, cloud.size // 2)
+        assert cloud.cloud_surface.get_at(center)[:3] == PALETTES["high_contrast"][CLOUD_COLOR]
+        game.clouds.clear()
+        game.render()
+        sky = game.screen.get_at((SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))[:3]
+        assert sky == PALETTES["high_contrast"][SKY_COLOR]
+        assert PALETTE.name == "high_contrast"
+
+    def test_high_contrast_text_stays_light(self, game):
+        """HUD text stays light on the dark high contrast sky"""
+        game.set_accessibility(preset("high_contrast"))
+        assert game.ui.text_color == WHITE
+        assert min(game.ui.text_color) - max(game.sky_color) > 150
+
+    def test_larger_hud(self, game):
+        """The large HUD has bigger buttons for the game's click handling"""
+        small = game.ui.exit_rect
+        game.set_accessibility(preset("large_hud"))
+        assert game.ui.exit_rect.width > small.width
+        assert game.ui.exit_rect.bottom == small.bottom
+
+    def test_slow_speed_survives_reload(self, game):
+        """Reloaded settings are slowed down again"""
+        game.set_accessibility(preset("slow"))
+        game.apply_settings(DEFAULT_SETTINGS.replace(player_speed=10))
+        assert game.player.speed == pytest.approx(7)
+        assert game.base_settings.player_speed == 10
@@ -0,0 +1,116 @@
+"""
+Unit tests for texture atlases and asset bundles
+"""
+
+import os
+import sys
+import pytest
+import pygame
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.assets import AssetBundle, AssetError, build_bundle, _pack_shelves
+from src.config import *
+
+class TestAssetBundle:
+    """Test building and reading bundles"""
+
+    @pytest.fixture
+    def bundle_path(self, tmp_path):
+        """Build a bundle from two images and a data file"""
+        pygame.init()
+        source = tmp_path / "assets"
+        (source / "images").mkdir(parents=True)
+        (source / "sounds").mkdir()
+        red = pygame.Surface((20, 10), pygame.SRCALPHA)
+        red.fill(RED)
+        green = pygame.Surface((8, 30), pygame.SRCALPHA)
+        green.fill(GREEN)
+        pygame.image.save(red, str(source / "images" / "red.png"))
+        pygame.image.save(green, str(source / "images" / "green.png"))
+        (source / "sounds" / "beep.dat").write_bytes(b"not really a sound" * 10)
+        path = str(tmp_path / "assets.bundle")
+        build_bundle(str(source), path)
+        return path
+
+    def test_contents(self, bundle_path):
+        """Test that images become atlas sprites and other files are stored"""
+        bundle = AssetBundle(bundle_path)
+        assert bundle.names() == ["images/green.png", "images/red.png", "sounds/beep.dat"]
+        assert bytes(bundle.data("sounds/beep.dat")) == b"not really a sound" * 10
+        bundle.close()
+
+    def test_entry_file_reads_in_place(self, bundle_path):
+        """Test that entry files read and seek within their entry only"""
+        bundle = AssetBundle(bundle_path)
+        data = bundle.data("sounds/beep.dat")
+        file = bundle.file("sounds/beep.dat")
+        assert file.read(4) == b"not "
+        assert file.seek(0, os.SEEK_END) == len(data)
+        assert file.read() == b""
+        file.seek(-5, os.SEEK_END)
+        assert file.read() == data[-5:]
+        bundle.close()  # nothing handed out still holds the mapping
+
+    def test_images_are_decoded_lazily(self, bundle_path):
+        """Test that sprites come from one shared atlas decoded on first use"""
+        bundle = AssetBundle(bundle_path)
+        assert bundle._decoded == {}
+
+        red = bundle.image("images/red.png")
+        green = bundle.image("images/green.png")
+        assert red.get_size() == (20, 10)
+        assert red.get_at((3, 3))[:3] == RED
+        assert green.get_at((3, 3))[:3] == GREEN
+        assert red.get_parent() is green.get_parent()
+        assert bundle.image("images/red.png") is red
+        bundle.close()
+
+    def test_damaged_entry(self, bundle_path):
+        """Test that a checksum mismatch is reported"""
+        bundle = AssetBundle(bundle_path)
+        position = bundle._data_start + bundle.entries["sounds/beep.dat"]["offset"]
+        bundle.close()
+        with open(bundle_path, "r+b") as file:
+            file.seek(position)
+            file.write(b"?")
+        bundle = AssetBundle(bundle_path)
+        with pytest.raises(AssetError):
+            bundle.data("sounds/beep.dat")
+        bundle.close()
+
+    def test_not_a_bundle(self, tmp_path):
+        """Test that other files are rejected"""
+        path = tmp_path / "other.bundle"
+        path.write_bytes(b"hello world, this is not a bundle")
+        with pytest.raises(AssetError):
+            AssetBundle(str(path))
+
+    def test_missing_entry(self, bundle_path):
+        """Test that unknown names raise AssetError"""
+        bundle = AssetBundle(bundle_path)
+        with pytest.raises(AssetError):
+            bundle.image("images/blue.png")
+        bundle.close()
+
+class TestAtlasPacking:
+    """Test shelf packing"""
+
+    def test_no_overlap(self):
+        """Test that packed rectangles stay inside the atlas and don't overlap"""
+        sizes = {f"sprite{i}": (10 + i * 7 % 40, 5 + i * 13 % 30) for i in range(40)}
+        placements, atlases = _pack_shelves(sizes, max_size=128)
+        rects = {}
+        for name, (atlas, x, y) in placements.items():
+            rect = pygame.Rect(x, y, *sizes[name])
+            assert rect.right <= 128 and rect.bottom <= 128
+            for other_atlas, other in rects.values():
+                assert other_atlas != atlas or not rect.colliderect(other)
+            rects[name] = (atlas, rect)
+        assert len(atlases) > 1
+
+    def test_too_large(self):
+        """Test that an image bigger than an atlas is refused"""
+        with pytest.raises(AssetError):
+            _pack_shelves({"huge": (300, 10)}, max_size=128)
@@ -0,0 +1,59 @@
+"""
+Unit tests for the autopilot and soak monitor
+"""
+
+import io
+import pytest
+import pygame
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from main import TejasThrust
+from src.autopilot import Autopilot
+from src.soak import SoakMonitor
+from src.laser import Laser
+from src.plane import EnemyPlane
+from src.config import *
+
+class TestAutopilot:
+    """Test autopilot decisions and soak reporting"""
+
+    @pytest.fixture
+    def game(self):
+        """Create a headless game for testing"""
+        game = TejasThrust(headless=True)
+        yield game
+        pygame.quit()
+
+    def test_dodges_incoming_laser(self, game):
+        """Test that the autopilot moves out of the way of a laser"""
+        player = game.player
+        game.enemy_lasers.append(Laser(player.x, player.y - 80, ENEMY_LASER_SPEED, RED))
+        keys, _ = Autopilot().decide(game)
+        assert keys[pygame.K_LEFT] or keys[pygame.K_RIGHT]
+
+    def test_shoots_enemy_above(self, game):
+        """Test that the autopilot shoots an enemy lined up above it"""
+        game.enemies.append(EnemyPlane(game.player.x, 200))
+        _, shoot = Autopilot().decide(game)
+        assert shoot
+
+    def test_soak_report(self, game):
+        """Test that the soak monitor reports drift between samples"""
+        output = io.StringIO()
+        monitor = SoakMonitor(interval=3600, output=output)
+        autopilot = Autopilot()
+        for _ in range(2):
+            for _ in range(30):
+                keys, shoot = autopilot.decide(game)
+                if shoot:
+                    game.player_shoot()
+                game.update(keys)
+                monitor.frame(game, 16)
+            monitor.sample(game)
+        report = monitor.report()
+        assert "drift" in report
+        assert output.getvalue().count("[soak]") == 2
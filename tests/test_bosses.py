@@ -0,0 +1,153 @@
+"""
+Unit tests for boss waves, phases and the boss state machine
+"""
+
+import os
+import random
+import sys
+import pytest
+import pygame
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from main import TejasThrust
+from src.laser import Laser
+from src.plane import BossPlane, EnemyPlane
+from src.config import *
+
+class TestBossPlane:
+    """Test the boss state machine"""
+
+    @pytest.fixture
+    def game(self):
+        """Create a headless game"""
+        game = TejasThrust(headless=True)
+        yield game
+        game.telemetry.close()
+
+    def test_enters_then_fights(self, game):
+        """Test that a boss flies down to its station before attacking"""
+        boss = BossPlane(400, -BOSS_HEIGHT, station_y=BOSS_STATION_Y)
+        assert boss.state == BOSS_ENTERING
+        now = 0
+        while boss.state == BOSS_ENTERING:
+            assert boss.think(game, now) == []
+            now += 16
+        assert boss.y == BOSS_STATION_Y
+        assert boss.state == BOSS_FIGHTING
+
+    def test_phases_follow_health(self):
+        """Test that crossing a health threshold starts the next phase"""
+        boss = BossPlane(400, 100)
+        assert boss.phase_index == 0
+        while boss.health > boss.max_health * BOSS_PHASES[1][0]:
+            boss.take_damage()
+        assert boss.phase_index == 1
+        assert boss.state == BOSS_REGROUPING
+        assert boss.attack_patterns == list(BOSS_PHASES[1][1])
+        assert boss.volley_interval() < BossPlane(400, 100).volley_interval()
+
+    def test_regroup_holds_fire(self, game):
+        """Test that a boss holds fire while regrouping, then fights again"""
+        boss = BossPlane(400, 100)
+        boss.think(game, 0)
+        while boss.phase_index == 0:
+            boss.take_damage()
+        for now in range(1000, 1000 + BOSS_REGROUP_TIME, 16):
+            assert boss.think(game, now) == []
+        boss.think(game, 1000 + BOSS_REGROUP_TIME + 16)
+        assert boss.state == BOSS_FIGHTING
+
+    def test_volleys_are_scheduled(self, game):
+        """Test that volleys come at fixed times, not random frames"""
+        boss = BossPlane(400, 100)
+        volleys = []
+        for frame in range(600):
+            now = frame * 1000 // FPS
+            if boss.think(game, now):
+                volleys.append(now)
+        gaps = [b - a for a, b in zip(volleys, volleys[1:])]
+        interval = boss.volley_interval(game.boss_fire_rate)
+        assert len(volleys) > 3
+        assert all(interval <= gap < interval + 2 * 1000 / FPS for gap in gaps)
+
+    def test_no_random_rolls_between_events(self, game, monkeypatch):
+        """Test that frames without a scheduled event never touch the random generator"""
+        boss = BossPlane(400, 100)
+        boss.think(game, 0)
+        boss.next_move = boss.next_volley = 10 ** 9
+        calls = []
+        monkeypatch.setattr(random, "random", lambda: calls.append(1) or 0.5)
+        monkeypatch.setattr(random, "randint", lambda a, b: calls.append(1) or a)
+        monkeypatch.setattr(random, "choice", lambda seq: calls.append(1) or seq[0])
+        for now in range(16, 2000, 16):
+            boss.think(game, now)
+        assert calls == []
+
+class TestBossWaves:
+    """Test multiple bosses handled like any other hostile plane"""
+
+    @pytest.fixture
+    def game(self):
+        """Create a headless game"""
+        game = TejasThrust(headless=True)
+        yield game
+        game.telemetry.close()
+
+    def test_waves_grow(self, game):
+        """Test that later waves send more bosses at once, up to the limit"""
+        sizes = []
+        for _ in range(BOSS_WAVE_GROWTH * (BOSS_MAX_CONCURRENT + 1)):
+            game.bosses = []
+            game.spawn_boss_wave()
+            sizes.append(len(game.bosses))
+        assert sizes[0] == 1
+        assert max(sizes) == BOSS_MAX_CONCURRENT
+        assert sizes == sorted(sizes)
+
+    def test_wave_after_kills(self, game):
+        """Test that a wave arrives after boss_spawn_count kills, without stopping enemies"""
+        game.enemies_killed = game.boss_spawn_count
+        game.spawn_enemy()
+        assert len(game.bosses) == 1
+
+        game.last_enemy_spawn = -10 ** 6
+        game.spawn_enemy()
+        assert len(game.enemies) == 1
+
+    def test_shooting_down_bosses(self, game):
+        """Test that every boss in a wave can be hit and destroyed"""
+        game.boss_waves = BOSS_WAVE_GROWTH
+        game.spawn_boss_wave()
+        assert len(game.bosses) == 2
+        for boss in game.bosses:
+            boss.y = BOSS_STATION_Y
+        score = game.score
+
+        for boss in list(game.bosses):
+            for _ in range(boss.max_health):
+                game.player_lasers.append(Laser(boss.x, boss.y, -LASER_SPEED, LASER_COLOR))
+                game._check_collisions()
+        assert game.bosses == []
+        assert game.bosses_defeated == 2
+        assert game.score == score + 2 * BossPlane.score_value
+
+    def test_one_laser_one_hit(self, game):
+        """Test that a laser over an enemy and a boss only damages one of them"""
+        boss = BossPlane(400, 100)
+        enemy = EnemyPlane(400, 100)
+        game.bosses.append(boss)
+        game.enemies.append(enemy)
+        game.player_lasers.append(Laser(400, 100, -LASER_SPEED, LASER_COLOR))
+        game._check_collisions()
+        assert (enemy.max_health - enemy.health) + (boss.max_health - boss.health) == 1
+
+    def test_game_loop_with_bosses(self, game):
+        """Test that bosses move, fire and draw through the generic loop"""
+        game.spawn_boss_wave()
+        for _ in range(300):
+            game.update({pygame.K_LEFT: False, pygame.K_RIGHT: False,
+                         pygame.K_UP: False, pygame.K_DOWN: False})
+        game.render()
+        assert all(boss.state != BOSS_ENTERING for boss in game.bosses)
@@ -0,0 +1,120 @@
+"""
+Unit tests for frame capture, replays and video export
+"""
+
+import os
+import sys
+import pytest
+import pygame
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.capture import FrameCapture, Replay, export_replay, record_autopilot
+from src.env import ACTIONS, action_keys, key_action
+from src.settings import DEFAULT_SETTINGS
+from src.config import *
+
+SIZE = (32, 24)
+
+class TestFrameCapture:
+    """Test copying frames to the background encoder"""
+
+    def setup_method(self):
+        """Set up a small test surface"""
+        pygame.init()
+        self.surface = pygame.Surface(SIZE)
+        self.surface.fill(WHITE)
+
+    def test_y4m_output(self):
+        """A Y4M file has the header and one full frame per capture"""
+        path = os.path.join(self.tmp, "clip.y4m")
+        capture = FrameCapture(path, size=SIZE, fps=30)
+        for _ in range(3):
+            assert capture.capture(self.surface, block=True)
+        capture.close()
+
+        with open(path, "rb") as file:
+            data = file.read()
+        header = b"YUV4MPEG2 W32 H24 F30:1 Ip A1:1 C444\n"
+        assert data.startswith(header)
+        frame_bytes = len(b"FRAME\n") + SIZE[0] * SIZE[1] * 3
+        assert len(data) == len(header) + 3 * frame_bytes
+        assert data[len(header) + 6] == 235  # white is full luma
+
+    def test_png_output(self):
+        """Any other path is a folder of numbered PNG frames"""
+        path = os.path.join(self.tmp, "frames")
+        capture = FrameCapture(path, size=SIZE)
+        capture.capture(self.surface, block=True)
+        capture.capture(self.surface, block=True)
+        capture.close()
+
+        assert sorted(os.listdir(path)) == ["frame_000000.png", "frame_000001.png"]
+        image = pygame.image.load(os.path.join(path, "frame_000001.png"))
+        assert image.get_at((5, 5))[:3] == WHITE
+
+    def test_drops_when_buffers_are_busy(self):
+        """Live capture drops a frame instead of waiting for the encoder"""
+        capture = FrameCapture(os.path.join(self.tmp, "clip.y4m"), size=SIZE, buffers=1)
+        busy = capture._free.get()  # the encoder still holds the only buffer
+
+        assert not capture.capture(self.surface)
+        assert capture.dropped == 1
+
+        capture._free.put(busy)
+        assert capture.capture(self.surface)
+        capture.close()
+        assert capture.frames == 1
+
+    @pytest.fixture(autouse=True)
+    def _tmp(self, tmp_path):
+        self.tmp = str(tmp_path)
+
+class TestReplay:
+    """Test recording and rendering replays"""
+
+    def test_key_action_round_trip(self):
+        """Every action survives a trip through key state"""
+        for action in range(len(ACTIONS)):
+            keys, shoot = action_keys(action)
+            assert key_action(keys, shoot) == action
+
+    def test_save_and_load(self, tmp_path):
+        """A replay is stored as its seed and actions"""
+        path = str(tmp_path / "game.replay.json")
+        Replay(7, [0, 3, 12]).save(path)
+        replay = Replay.load(path)
+        assert replay.seed == 7
+        assert replay.actions == [0, 3, 12]
+        assert replay.settings is None
+
+    def test_settings_saved(self, tmp_path):
+        """A replay keeps the settings it was played with"""
+        path = str(tmp_path / "game.replay.json")
+        settings = DEFAULT_SETTINGS.replace(enemy_speed=7, enemy_shoot_chance=0.1)
+        Replay(7, [0], settings).save(path)
+        assert Replay.load(path).settings == settings
+
+    def test_export_is_repeatable(self, tmp_path):
+        """Rendering the same replay twice gives the same video"""
+        replay = record_autopilot(1, seed=3)
+        assert len(replay.actions) == FPS
+
+        first, second = str(tmp_path / "a.y4m"), str(tmp_path / "b.y4m")
+        assert export_replay(replay, first) == FPS
+        export_replay(replay, second)
+        with open(first, "rb") as a, open(second, "rb") as b:
+            assert a.read() == b.read()
+
+    def test_export_uses_replay_settings(self, tmp_path):
+        """A replay renders with its own settings, not the ones passed in"""
+        settings = DEFAULT_SETTINGS.replace(enemy_spawn_interval=100, enemy_speed=6)
+        replay = record_autopilot(0.5, seed=3, settings=settings)
+        assert replay.settings == settings
+
+        first, second = str(tmp_path / "a.y4m"), str(tmp_path / "b.y4m")
+        export_replay(replay, first)
+        export_replay(Replay(3, replay.actions), second, settings)
+        with open(first, "rb") as a, open(second, "rb") as b:
+            assert a.read() == b.read()
@@ -0,0 +1,91 @@
+"""
+Unit tests for the adaptive difficulty director
+"""
+
+import os
+import sys
+import pytest
+import pygame
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from main import TejasThrust
+from src.director import Director
+from src.plane import EnemyPlane
+from src.config import *
+
+class TestDirector:
+    """Test adapting difficulty to the player and the frame time"""
+
+    @pytest.fixture
+    def game(self):
+        """Create a headless game"""
+        game = TejasThrust(headless=True)
+        yield game
+        game.telemetry.close()
+
+    def play(self, game, seconds, damage_per_min=0, kills_per_min=0):
+        """Advance the director through time with a given player performance"""
+        for _ in range(seconds):
+            game.sim_time += 1000
+            game.player_health -= damage_per_min / 60
+            game.enemies_killed += kills_per_min / 60
+            game.director.update(game)
+
+    def test_starts_at_settings(self, game):
+        """Test that a new game uses the configured difficulty"""
+        assert game.director.intensity == DIRECTOR_START_INTENSITY
+        assert game.spawn_interval == pytest.approx(ENEMY_SPAWN_INTERVAL / DIRECTOR_START_INTENSITY)
+
+    def test_struggling_player_gets_an_easier_game(self, game):
+        """Test that taking heavy damage slows spawning and enemy fire"""
+        self.play(game, 30, damage_per_min=DIRECTOR_DAMAGE_PER_MIN * 2)
+        assert game.director.intensity < DIRECTOR_START_INTENSITY
+        assert game.spawn_interval > ENEMY_SPAWN_INTERVAL
+        assert game.enemy_shoot_chance < ENEMY_SHOOT_CHANCE
+
+    def test_strong_player_gets_a_harder_game(self, game):
+        """Test that killing quickly without damage raises the intensity"""
+        self.play(game, 30, kills_per_min=DIRECTOR_KILLS_PER_MIN * 2)
+        assert game.director.intensity > DIRECTOR_START_INTENSITY
+        assert game.spawn_interval < ENEMY_SPAWN_INTERVAL
+
+    def test_intensity_stays_in_bounds(self, game):
+        """Test that intensity never leaves its limits"""
+        self.play(game, 600, kills_per_min=1000)
+        assert game.director.intensity == pytest.approx(DIRECTOR_MAX_INTENSITY)
+        game.player_health = PLAYER_MAX_HEALTH * DIRECTOR_LOW_HEALTH / 2
+        self.play(game, 600)
+        assert game.director.intensity == pytest.approx(DIRECTOR_MIN_INTENSITY)
+
+    def test_slow_frames_shrink_entity_budget(self, game):
+        """Test that frames over budget cap enemies and lasers"""
+        for _ in range(30):
+            game.director.frame(1000 / FPS * 2)
+        self.play(game, 20)
+        assert game.director.entity_budget == DIRECTOR_MIN_ENTITIES
+        assert game.max_enemies + game.max_enemy_lasers <= DIRECTOR_MIN_ENTITIES
+
+        # Spawning stops at the cap
+        game.enemies = [EnemyPlane(100, 100) for _ in range(game.max_enemies)]
+        game.last_enemy_spawn = -ENEMY_SPAWN_INTERVAL * 10
+        game.spawn_enemy()
+        assert len(game.enemies) == game.max_enemies
+
+        # And recovers once frames are fast again
+        for _ in range(100):
+            game.director.frame(1)
+        self.play(game, 60)
+        assert game.director.entity_budget > DIRECTOR_MIN_ENTITIES
+
+    def test_disabled_director(self):
+        """Test that a disabled director leaves the settings alone"""
+        director = Director(enabled=False)
+        game = TejasThrust(headless=True)
+        game.director = director
+        director.apply(game)
+        self.play(game, 60, damage_per_min=1000)
+        assert game.spawn_interval == ENEMY_SPAWN_INTERVAL
+        assert game.max_enemies == float("inf")
+        game.telemetry.close()
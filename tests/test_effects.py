@@ -0,0 +1,138 @@
+"""
+Unit tests for hit flashes, damage numbers and screen shake
+"""
+
+import os
+import sys
+import pytest
+import pygame
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from main import TejasThrust
+from src.effects import Effects
+from src.laser import Laser
+from src.plane import EnemyPlane, BossPlane
+from src.viewport import Viewport
+from src.config import *
+
+class TestEffects:
+    """Test the effects on their own"""
+
+    @pytest.fixture
+    def effects(self):
+        """Create effects, with fonts for the damage numbers"""
+        pygame.init()
+        yield Effects()
+        pygame.quit()
+
+    def test_flash_wears_off(self, effects):
+        """A hit plane flashes for HIT_FLASH_FRAMES frames"""
+        plane = EnemyPlane(100, 100)
+        effects.hit(plane, 1)
+        for _ in range(HIT_FLASH_FRAMES - 1):
+            effects.update()
+            assert plane.flashing
+        effects.update()
+        assert not plane.flashing
+        assert effects.flashes == {}
+
+    def test_flash_sprite_is_cached(self):
+        """Flashing planes share one brightened copy of their sprite"""
+        first, second = EnemyPlane(100, 100), EnemyPlane(300, 100)
+        normal = first.get_sprite()[0]
+        flash = first._flash_sprite(normal)
+        assert flash is second._flash_sprite(normal)
+        assert flash is not normal
+        center = (normal.get_width() // 2, normal.get_height() // 2)
+        assert flash.get_at(center)[:3] >= normal.get_at(center)[:3]
+
+    def test_numbers_rise_and_fade(self, effects):
+        """Damage numbers float up, fade out in cached steps and are gone"""
+        effects.hit(EnemyPlane(100, 100), 5)
+        (sprite, (_, y)), = effects.sprites()
+        effects.update()
+        (_, (_, risen)), = effects.sprites()
+        assert risen == y - DAMAGE_NUMBER_RISE
+        assert effects.sprites()[0][0] is sprite
+
+        for _ in range(DAMAGE_NUMBER_FRAMES - 2):
+            effects.update()
+        assert effects.sprites()[0][0].get_alpha() < sprite.get_alpha()
+        effects.update()
+        assert effects.sprites() == []
+
+    def test_glyphs_rendered_once(self, effects):
+        """Numbers are composed from glyphs rendered once per character"""
+        for damage in (1, 11, 111):
+            effects.hit(EnemyPlane(100, 100), damage)
+        effects.sprites()
+        assert set(effects._glyphs) == {("-", WHITE), ("1", WHITE)}
+
+    def test_shake_decays(self, effects):
+        """Shake offsets stay within the strength and die away"""
+        effects.shake(SHAKE_MAX * 2)
+        assert effects.shake_strength == SHAKE_MAX
+        effects.update()
+        assert max(map(abs, effects.shake_offset)) <= SHAKE_MAX
+        for _ in range(100):
+            effects.update()
+        assert effects.shake_offset == (0, 0)
+
+    def test_shaken_present(self):
+        """The whole frame is moved by the offset, leaving black behind"""
+        viewport = Viewport((SCREEN_WIDTH * 2, SCREEN_HEIGHT * 2))
+        canvas = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        canvas.fill(SKY_COLOR)
+        window = pygame.Surface((SCREEN_WIDTH * 2, SCREEN_HEIGHT * 2))
+        viewport.present(canvas, window, (5, 0))
+        assert window.get_at((9, 0))[:3] == BLACK
+        assert window.get_at((10, 0))[:3] == SKY_COLOR
+        viewport.present(canvas, window)
+        assert window.get_at((0, 0))[:3] == SKY_COLOR
+
+class TestGameEffects:
+    """Test the effects the game starts"""
+
+    @pytest.fixture
+    def game(self):
+        """Create a headless game"""
+        game = TejasThrust(mode="headless")
+        yield game
+        game.telemetry.close()
+
+    def test_player_hit_shakes(self, game):
+        """A laser hitting the player flashes it, shows the damage and shakes"""
+        laser = Laser(game.player.x, game.player.y, ENEMY_LASER_SPEED, RED)
+        game.enemy_lasers.append(laser)
+        game._check_collisions()
+        assert game.player.flashing
+        assert game.effects.numbers[0][2:4] == [f"-{laser.damage}", RED]
+        assert game.effects.shake_strength == laser.damage * SHAKE_PER_DAMAGE
+
+    def test_boss_defeat_shakes(self, game):
+        """Shooting down a boss shakes the view"""
+        boss = BossPlane(400, 100)
+        game.bosses.append(boss)
+        game._shoot_down(boss)
+        assert game.effects.shake_strength == SHAKE_BOSS_DEFEATED
+
+    def test_numbers_drawn(self, game):
+        """Damage numbers are drawn on top of the game"""
+        game.render()
+        before = game.screen.copy()
+        game.effects.hit(game.player, 3)
+        game.render()
+        (sprite, position), = game.effect_sprites
+        area = pygame.Rect(position, sprite.get_size())
+        assert (pygame.image.tobytes(game.screen.subsurface(area), "RGB")
+                != pygame.image.tobytes(before.subsurface(area), "RGB"))
+
+    def test_reset_clears(self, game):
+        """A new game starts without effects"""
+        game.effects.hit(game.player, 3)
+        game.effects.shake(5)
+        game.reset()
+        assert not game.player.flashing
+        assert game.effects.numbers == [] and game.effects.shake_offset == (0, 0)
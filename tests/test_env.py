@@ -0,0 +1,79 @@
+"""
+Unit tests for the reinforcement-learning environment wrappers
+"""
+
+import functools
+import numpy as np
+import pytest
+import pygame
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.env import TejasThrustEnv, SyncVectorEnv, SubprocVectorEnv, ACTIONS, OBSERVATION_SIZE
+from src.config import *
+
+class TestTejasThrustEnv:
+    """Test the single-game environment"""
+
+    @pytest.fixture
+    def env(self):
+        """Create an environment for testing"""
+        env = TejasThrustEnv(seed=1)
+        yield env
+        env.close()
+
+    def test_reset_observation(self, env):
+        """Test that reset returns a fixed-size observation"""
+        obs, info = env.reset()
+        assert obs.shape == (OBSERVATION_SIZE,)
+        assert obs.dtype == np.float32
+        assert info["health"] == PLAYER_MAX_HEALTH
+
+    def test_step_runs_on_simulated_time(self, env):
+        """Test that stepping advances the game without a window or real time"""
+        env.reset()
+        for _ in range(120):
+            obs, reward, terminated, truncated, info = env.step(len(ACTIONS) - 1)
+        assert env.game.sim_time == pytest.approx(120 * 1000 / FPS)
+        assert len(env.game.enemies) > 0
+        assert env.game.shots_fired > 0
+
+    def test_seeded_reset_is_repeatable(self, env):
+        """Test that the same seed gives the same episode"""
+        def rollout():
+            env.reset(seed=7)
+            return [env.step(i % len(ACTIONS))[0] for i in range(60)]
+        assert all(np.array_equal(a, b) for a, b in zip(rollout(), rollout()))
+
+    def test_frame_observation(self):
+        """Test downsampled frame observations"""
+        env = TejasThrustEnv(observation="frame", frame_size=(64, 48))
+        obs, _ = env.reset()
+        assert obs.shape == (48, 64, 3)
+        env.close()
+
+class TestVectorEnv:
+    """Test batched environments"""
+
+    def test_sync_vector_env(self):
+        """Test stepping several environments in one process"""
+        envs = SyncVectorEnv([TejasThrustEnv] * 3)
+        obs, _ = envs.reset(seed=0)
+        assert obs.shape == (3, OBSERVATION_SIZE)
+        obs, rewards, terminated, truncated, infos = envs.step([0, 1, 2])
+        assert obs.shape == (3, OBSERVATION_SIZE)
+        assert rewards.shape == (3,)
+        envs.close()
+
+    def test_subproc_vector_env(self):
+        """Test stepping environments in worker processes"""
+        envs = SubprocVectorEnv([functools.partial(TejasThrustEnv, max_steps=5)] * 2)
+        envs.reset(seed=0)
+        for _ in range(5):
+            obs, rewards, terminated, truncated, infos = envs.step([9, 10])
+        assert obs.shape == (2, OBSERVATION_SIZE)
+        assert truncated.all()
+        envs.close()
@@ -0,0 +1,133 @@
+"""
+Property-based stress tests: Hypothesis plays headless games at full speed
+
+Each case is a seed, a set of settings and a list of (action, frames)
+segments repeated to fill up to MAX_FRAMES frames. The game is
+deterministic, so a case always plays out the same and Hypothesis can
+shrink a failure to the shortest input that still breaks an invariant.
+The failing input is saved as a replay with its settings (see
+src/capture.py), so --export-video plays the same game.
+
+A passing run takes a few seconds with the default "ci" profile. Shrinking
+a failure replays the game many times and can take minutes. Set
+HYPOTHESIS_PROFILE=fuzz for a longer hunt.
+"""
+
+import dataclasses
+import json
+import os
+import sys
+import pytest
+from hypothesis import HealthCheck, given, note, settings, strategies as st
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from main import TejasThrust
+from src.capture import Replay
+from src.env import ACTIONS, action_keys
+from src.plane import EnemyPlane, BossPlane
+from src.settings import DEFAULT_SETTINGS
+from src.config import *
+
+MAX_FRAMES = 3000
+REPLAY_PATH = "fuzz_failure.replay.json"  # the latest failing case, for --export-video --replay
+
+settings.register_profile("ci", max_examples=12, deadline=None,
+                          suppress_health_check=[HealthCheck.too_slow])
+settings.register_profile("fuzz", max_examples=500, deadline=None,
+                          suppress_health_check=[HealthCheck.too_slow])
+settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "ci"))
+
+game_settings = st.builds(
+    DEFAULT_SETTINGS.replace,
+    player_speed=st.integers(1, 20),
+    laser_speed=st.integers(1, 30),
+    enemy_speed=st.integers(1, 10),
+    enemy_health=st.integers(1, 5),
+    enemy_laser_speed=st.integers(1, 30),
+    enemy_spawn_interval=st.integers(16, 3000),
+    enemy_shoot_chance=st.integers(0, 200).map(lambda permille: permille / 1000),
+    boss_health=st.integers(1, 20),
+    boss_laser_speed=st.integers(1, 30),
+    boss_laser_damage=st.integers(1, 50),
+    boss_spawn_count=st.integers(1, 20),
+)
+segments = st.lists(st.tuples(st.integers(0, len(ACTIONS) - 1), st.integers(1, 120)),
+                    min_size=1, max_size=40)
+
+
+def expand(segments, frames):
+    """One action per frame: the segments played in turn, over and over"""
+    actions = []
+    while len(actions) < frames:
+        for action, repeat in segments:
+            actions.extend([action] * repeat)
+    return actions[:frames]
+
+
+class RecordingGame(TejasThrust):
+    """A headless game that remembers the power-ups collected each frame"""
+
+    def __init__(self, **kwargs):
+        self.collected = []
+        super().__init__(mode="headless", deterministic=True, **kwargs)
+
+    def _power_up(self, kind):
+        self.collected.append(kind)
+        super()._power_up(kind)
+
+
+def check_invariants(game, health_before):
+    """Assert what must hold after every frame"""
+    for laser in game.player_lasers + game.enemy_lasers:
+        assert not laser.is_off_screen(), f"laser left at ({laser.x}, {laser.y})"
+
+    assert game.player_health <= PLAYER_MAX_HEALTH
+    healed = sum(POWERUPS[kind].get("heal", 0) for kind in game.collected)
+    assert game.player_health <= health_before + healed, "health went up without a repair"
+
+    bosses = game.bosses_defeated
+    expected = (game.enemies_killed - bosses) * EnemyPlane.score_value + bosses * BossPlane.score_value
+    assert game.score == expected, "score doesn't match the planes shot down"
+
+    player = game.player
+    assert player.width // 2 <= player.x <= SCREEN_WIDTH - player.width // 2
+    assert player.height // 2 <= player.y <= SCREEN_HEIGHT - player.height // 2
+
+
+class TestFuzz:
+    """Play many generated games, checking invariants on every frame"""
+
+    @given(seed=st.integers(0, 2 ** 32 - 1), config=game_settings, segments=segments,
+           frames=st.integers(1, MAX_FRAMES))
+    def test_invariants(self, seed, config, segments, frames):
+        """No stray lasers, no unearned healing and a score that adds up"""
+        actions = expand(segments, frames)
+        game = RecordingGame(settings=config)
+        game.reset(seed)
+        replay = Replay(seed, settings=config)
+        try:
+            for action in actions:
+                keys, shoot = action_keys(action)
+                replay.actions.append(action)
+                health_before = game.player_health
+                game.collected.clear()
+                if shoot:
+                    game.player_shoot()
+                game.update(keys)
+                check_invariants(game, health_before)
+                if game.game_over:
+                    break
+        except AssertionError:
+            # Hypothesis runs the smallest failing case last, so that is the one kept
+            replay.save(REPLAY_PATH)
+            note(f"replay of {len(replay.actions)} frames saved to {REPLAY_PATH}")
+            note(f"settings: {json.dumps(dataclasses.asdict(config))}")
+            raise
+        finally:
+            game.telemetry.close()
+
+    def test_expand(self):
+        """Segments repeat until there are enough frames"""
+        assert expand([(1, 2), (3, 1)], 7) == [1, 1, 3, 1, 1, 3, 1]
@@ -0,0 +1,54 @@
+"""
+Unit tests for the particle system
+"""
+
+import pytest
+import pygame
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.particles import ParticleSystem
+from src.config import *
+
+class TestParticleSystem:
+    """Test particle emission, update and drawing"""
+
+    @pytest.fixture
+    def particles(self):
+        """Create a small particle system for testing"""
+        pygame.init()
+        particles = ParticleSystem(capacity=64)
+        yield particles
+        pygame.quit()
+
+    def test_emit_and_expire(self, particles):
+        """Test that particles are emitted and die when their life runs out"""
+        particles.emit(100, 100, 10, 2, PARTICLE_FIRE, 5)
+        assert particles.alive_count() == 10
+        for _ in range(5):
+            particles.update()
+        assert particles.alive_count() == 0
+
+    def test_hard_capacity(self, particles):
+        """Test that emitting more than the capacity overwrites the oldest particles"""
+        particles.emit(100, 100, 50, 2, PARTICLE_FIRE, 30)
+        particles.emit(100, 100, 50, 2, PARTICLE_SMOKE, 30)
+        assert particles.alive_count() == 64
+        assert particles.next_slot == 100 % 64
+
+    def test_particles_move(self, particles):
+        """Test that particles move away from where they were emitted"""
+        particles.emit(100, 100, 1, 5, PARTICLE_SPARK, 10)
+        particles.update()
+        assert tuple(particles.pos[0]) != (100, 100)
+
+    def test_boss_explosion_draws(self, particles):
+        """Test that a large explosion draws within the capacity"""
+        screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        particles.explode(600, 400, BOSS_EXPLOSION_SIZE)
+        particles.update()
+        particles.draw(screen)
+        assert particles.alive_count() <= particles.capacity
@@ -0,0 +1,109 @@
+"""
+Unit tests for the threaded render pipeline
+"""
+
+import os
+import sys
+import pytest
+import pygame
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from main import TejasThrust, parse_args
+from src.accessibility import STANDARD
+from src.laser import Laser
+from src.pipeline import RenderPipeline, Snapshot
+from src.config import *
+
+class RecordingCapture:
+    """Stands in for FrameCapture, keeping the surfaces it is given"""
+
+    def __init__(self):
+        self.frames = []
+
+    def capture(self, surface, block=False):
+        self.frames.append(surface)
+        return True
+
+class TestRenderPipeline:
+    """Test drawing snapshots on the render thread"""
+
+    @pytest.fixture
+    def game(self):
+        """Create a game with a few things in the air"""
+        game = TejasThrust(mode="test")
+        game.spawn_enemy()
+        game.player_lasers.append(Laser(game.player.x, game.player.y - 40, -LASER_SPEED, LASER_COLOR))
+        game.particles.explode(300, 300)
+        for _ in range(5):
+            game.update()
+        yield game
+        pygame.quit()
+
+    def test_snapshot_is_independent(self, game):
+        """Updating the game after a snapshot leaves the snapshot alone"""
+        snapshot = Snapshot(game)
+        x, laser_y = snapshot.player.x, snapshot.player_lasers[0].y
+        game.player.x += 50
+        game.update()
+        assert snapshot.player.x == x
+        assert snapshot.player_lasers[0].y == laser_y
+        assert len(snapshot.particles.life) == snapshot.particles.alive_count()
+
+    def test_threaded_frame_matches_serial(self, game):
+        """The render thread draws exactly what serial drawing would"""
+        game.render()
+        serial = pygame.image.tobytes(game.screen, "RGB")
+
+        pipeline = RenderPipeline(game)
+        pipeline.submit(Snapshot(game))
+        canvas, window_frame = pipeline.wait()
+        pipeline.close()
+        assert window_frame is canvas  # no scaling at the native window size
+        assert pygame.image.tobytes(canvas, "RGB") == serial
+
+    def test_canvases_alternate(self, game):
+        """Consecutive frames are drawn into different canvases"""
+        pipeline = RenderPipeline(game)
+        pipeline.submit(Snapshot(game))
+        first = pipeline.wait()[0]
+        pipeline.submit(Snapshot(game))
+        second = pipeline.wait()[0]
+        pipeline.close()
+        assert first is not second
+
+    def test_errors_reach_the_main_thread(self, game):
+        """A failure while drawing is raised by wait()"""
+        snapshot = Snapshot(game)
+        snapshot.player = None
+        pipeline = RenderPipeline(game)
+        pipeline.submit(snapshot)
+        with pytest.raises(AttributeError):
+            pipeline.wait()
+        pipeline.close()
+
+    def test_resize_waits_for_frame(self, game):
+        """A window resize lets the frame being drawn finish first, and still shows it"""
+        game.pipeline = RenderPipeline(game)
+        game.capture = RecordingCapture()
+        game.pipeline.submit(Snapshot(game))
+        game._resize()
+        assert not game.pipeline.busy
+        assert game.ui.screen is game.screen
+        assert len(game.capture.frames) == 1
+        game.pipeline.close()
+
+    def test_palette_switch_keeps_frame(self, game):
+        """Switching accessibility preset mid-frame records the frame in flight"""
+        game.pipeline = RenderPipeline(game)
+        game.capture = RecordingCapture()
+        game.pipeline.submit(Snapshot(game))
+        game.set_accessibility(STANDARD)
+        assert len(game.capture.frames) == 1
+        game.pipeline.close()
+
+    def test_command_line_flag(self):
+        """--threaded-render turns the pipeline on"""
+        assert parse_args(["--threaded-render"]).threaded_render
+        assert not parse_args([]).threaded_render
@@ -0,0 +1,128 @@
+"""
+Unit tests for power-ups, pickups and stacked modifiers
+"""
+
+import os
+import random
+import sys
+import pytest
+import pygame
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from main import TejasThrust
+from src.laser import Laser
+from src.plane import PlayerPlane, BossPlane
+from src.powerups import ModifierStack, PickupPool, choose_powerup
+from src.config import *
+
+class TestModifiers:
+    """Test stacking and expiring timed power-ups"""
+
+    def test_power_ups_stack(self):
+        """Spread shots add up and rapid fire multiplies"""
+        stack = ModifierStack()
+        for kind in ("spread", "spread", "rapid", "rapid"):
+            stack.add(kind, 0)
+        values = stack.resolve()
+        assert values["extra_shots"] == 2 * POWERUPS["spread"]["modifiers"]["extra_shots"]
+        assert values["cooldown_factor"] == pytest.approx(0.25)
+        assert values["shield"] == 0
+
+    def test_expiry_is_event_timed(self):
+        """Nothing is recomputed until the next power-up runs out"""
+        stack = ModifierStack()
+        stack.add("rapid", 0)
+        stack.add("shield", 2000)
+        assert not stack.expire(POWERUPS["rapid"]["duration"] - 1)
+        assert stack.expire(POWERUPS["rapid"]["duration"])
+        assert [kind for _, kind in stack.active] == ["shield"]
+        assert stack.next_expiry == 2000 + POWERUPS["shield"]["duration"]
+
+    def test_player_values_resolved_on_change(self):
+        """The player's cooldown and shot count change only with power-ups"""
+        player = PlayerPlane(400, 500)
+        base = player.shoot_cooldown
+        player.power_up("rapid", 0)
+        player.power_up("spread", 0)
+        assert player.shoot_cooldown == base * 0.5
+        assert player.shot_count == 1 + POWERUPS["spread"]["modifiers"]["extra_shots"]
+
+        player.update_power_ups(POWERUPS["spread"]["duration"])
+        assert player.shoot_cooldown == base
+        assert player.shot_count == 1
+
+    def test_stacking_is_capped(self):
+        """Stacked power-ups stop at the shot and cooldown limits"""
+        player = PlayerPlane(400, 500)
+        for _ in range(10):
+            player.power_up("spread", 0)
+            player.power_up("rapid", 0)
+        assert player.shot_count == PLAYER_MAX_SHOTS
+        assert player.shoot_cooldown == player.base_shoot_cooldown * PLAYER_MIN_COOLDOWN_FACTOR
+
+    def test_spread_shot(self):
+        """A spread power-up fans the player's shot out upwards"""
+        player = PlayerPlane(400, 500)
+        player.power_up("spread", 0)
+        lasers = player.fire(now=10000)
+        assert len(lasers) == player.shot_count
+        assert all(laser.vy < 0 for laser in lasers)
+        assert lasers[0].vx < 0 < lasers[-1].vx
+
+class TestPickups:
+    """Test the pickup pool and collecting power-ups in the game"""
+
+    @pytest.fixture
+    def game(self):
+        """Create a headless game"""
+        game = TejasThrust(mode="headless")
+        yield game
+        game.telemetry.close()
+
+    def test_pool_reuses_pickups(self):
+        """Pickups come from a fixed pool and go back to it when collected"""
+        pool = PickupPool(capacity=2)
+        first = pool.spawn(100, 100, "repair")
+        pool.spawn(300, 100, "shield")
+        assert pool.spawn(500, 100, "rapid") is None
+        assert pool.collect(pygame.Rect(95, 95, 10, 10)) == ["repair"]
+        assert pool.spawn(500, 100, "rapid") is first
+        assert len(list(pool)) == 2
+
+    def test_pickups_fall_off_screen(self):
+        """Pickups nobody collects return to the pool"""
+        pool = PickupPool()
+        pool.spawn(100, SCREEN_HEIGHT, "shield")
+        for _ in range(POWERUP_SIZE // POWERUP_FALL_SPEED + 1):
+            pool.update()
+        assert list(pool) == []
+
+    def test_choose_by_weight(self):
+        """Every kind can drop"""
+        rng = random.Random(1)
+        assert {choose_powerup(rng) for _ in range(200)} == set(POWERUPS)
+
+    def test_boss_drops_power_up(self, game):
+        """Shooting down a boss always leaves a pickup"""
+        boss = BossPlane(400, 100)
+        game.bosses.append(boss)
+        game._shoot_down(boss)
+        assert [(pickup.x, pickup.y) for pickup in game.pickups] == [(400, 100)]
+
+    def test_repair_heals(self, game):
+        """Repair restores health, up to the maximum"""
+        game.player_health = PLAYER_MAX_HEALTH - 10
+        game.pickups.spawn(game.player.x, game.player.y, "repair")
+        game._check_collisions()
+        assert game.player_health == PLAYER_MAX_HEALTH
+        assert list(game.pickups) == []
+
+    def test_shield_absorbs_lasers(self, game):
+        """Lasers hitting a shielded player do no damage"""
+        game.player.power_up("shield", game.ticks())
+        game.enemy_lasers.append(Laser(game.player.x, game.player.y, ENEMY_LASER_SPEED, RED))
+        game._check_collisions()
+        assert game.enemy_lasers == []
+        assert game.player_health == PLAYER_MAX_HEALTH
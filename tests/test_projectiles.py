@@ -0,0 +1,139 @@
+"""
+Unit tests for projectile behaviors (aimed, spread, homing and sine lasers)
+"""
+
+import math
+import pytest
+import pygame
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.laser import Laser
+from src.plane import PlayerPlane, EnemyPlane, BossPlane
+from src.projectile import aim_down_velocity, aim_velocity, spread_velocities, steer_lasers
+from src.collision import swept_candidates
+from src.config import *
+
+class TestProjectiles:
+    """Test projectile behaviors and angled collision"""
+
+    def test_aim_velocity_points_at_target(self):
+        """Test that aimed velocity points at the target with the given speed"""
+        vx, vy = aim_velocity(0, 0, 30, 40, 10)
+        assert vx == pytest.approx(6)
+        assert vy == pytest.approx(8)
+
+    def test_spread_covers_arc(self):
+        """Test that a spread volley fans out symmetrically"""
+        velocities = spread_velocities(0, 10, count=3, arc=90)
+        assert len(velocities) == 3
+        assert velocities[1][0] == pytest.approx(0)
+        assert velocities[0][0] == pytest.approx(-velocities[2][0])
+        for vx, vy in velocities:
+            assert math.hypot(vx, vy) == pytest.approx(10)
+
+    def test_enemy_aims_at_player(self):
+        """Test that enemy lasers head towards the player"""
+        enemy = EnemyPlane(100, 100)
+        player = PlayerPlane(400, 600)
+        laser = enemy.shoot(player, now=10_000)
+        assert laser.vx > 0
+        assert laser.speed > 0  # Still moving downward
+
+    def test_enemy_never_fires_sideways(self):
+        """Test that a player above the enemy gets a steep shot, not a flat one"""
+        enemy = EnemyPlane(100, 400)
+        player = PlayerPlane(900, 100)
+        laser = enemy.shoot(player, now=10_000)
+        assert laser.vx > 0
+        assert laser.vx <= laser.vy * math.tan(math.radians(AIM_MAX_ANGLE)) + 1e-9
+        assert math.hypot(laser.vx, laser.vy) == pytest.approx(enemy.laser_speed)
+
+    def test_aim_down_straight_above(self):
+        """Test that a target straight above is shot at straight down"""
+        assert aim_down_velocity(100, 100, 100, 0, 10) == (0.0, 10.0)
+
+    def test_homing_laser_turns_towards_target(self):
+        """Test that homing lasers steer towards the target and keep their speed"""
+        laser = Laser(100, 100, 6, RED, behavior=LASER_HOMING)
+        for _ in range(10):
+            steer_lasers([laser], 400, 100)
+            laser.update()
+        assert laser.vx > 0
+        assert math.hypot(laser.vx, laser.vy) == pytest.approx(6)
+
+    def test_homing_laser_stops_steering(self):
+        """Test that homing lasers fly straight after their homing time"""
+        laser = Laser(100, 100, 6, RED, behavior=LASER_HOMING)
+        laser.age = HOMING_DURATION
+        steer_lasers([laser], 400, 100)
+        assert laser.vx == 0
+
+    def test_sine_laser_returns_to_start_column(self):
+        """Test that a sine laser weaves and returns after one period"""
+        laser = Laser(100, 100, 4, RED, behavior=LASER_SINE)
+        offsets = []
+        for _ in range(SINE_PERIOD):
+            steer_lasers([laser], 0, 0)
+            laser.update()
+            offsets.append(laser.x - 100)
+        assert max(offsets) == pytest.approx(SINE_AMPLITUDE, rel=0.05)
+        assert laser.x == pytest.approx(100)
+
+    def test_angled_laser_capsule_collision(self):
+        """Test that angled lasers use their body, not their bounding box"""
+        laser = Laser(100, 100, 7, RED, vx=7)
+        box = laser.get_rect()
+        # Corner of the bounding box that the diagonal laser does not cover
+        corner = pygame.Rect(box.right - 2, box.top, 2, 2)
+        assert box.colliderect(corner)
+        assert not laser.collides(corner)
+        assert laser.collides(pygame.Rect(98, 98, 4, 4))
+
+    def test_boss_fires_spread(self):
+        """Test that the boss opens with a spread volley"""
+        boss = BossPlane(600, 100)
+        player = PlayerPlane(600, 700)
+        lasers = boss.fire(player, now=10_000)
+        assert len(lasers) == SPREAD_SHOTS
+        assert all(laser.damage == BOSS_LASER_DAMAGE for laser in lasers)
+
+class TestSweptCollision:
+    """Test that lasers are tested along their whole move, not just where they end up"""
+
+    def test_fast_laser_does_not_tunnel(self):
+        """Test that a laser faster than the plane is tall still hits it"""
+        player = PlayerPlane(600, 700)
+        laser = Laser(600, 600, 300, RED)
+        laser.update()
+        assert laser.y == 900
+        assert not player.get_rect().colliderect(laser.get_rect())
+        assert player.is_hit_by(laser)
+
+    def test_fast_laser_passing_beside_misses(self):
+        """Test that the sweep only covers the laser's own path"""
+        player = PlayerPlane(600, 700)
+        laser = Laser(600 + player.get_rect().width, 600, 300, RED)
+        laser.update()
+        assert not player.is_hit_by(laser)
+
+    def test_fast_angled_laser_does_not_tunnel(self):
+        """Test that an angled laser is swept along its diagonal"""
+        player = PlayerPlane(600, 700)
+        laser = Laser(400, 500, 0, RED, vx=400, behavior=LASER_AIMED)
+        laser.vy = 400
+        laser.update()
+        assert laser.get_sweep()[0][0] < 600 < laser.get_sweep()[1][0]
+        assert player.is_hit_by(laser)
+
+    def test_swept_candidates_batch(self):
+        """Test the batched broad phase against several planes at once"""
+        planes = [PlayerPlane(100, 300), PlayerPlane(500, 300)]
+        lasers = [Laser(100, 100, 400, RED), Laser(300, 100, 400, RED), Laser(500, 290, 0, RED)]
+        for laser in lasers:
+            laser.update()
+        candidates = swept_candidates(lasers, planes)
+        assert candidates.tolist() == [[True, False], [False, False], [False, True]]
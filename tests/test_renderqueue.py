@@ -0,0 +1,87 @@
+"""
+Unit tests for batched drawing with the render queue
+"""
+
+import os
+import sys
+import pytest
+import pygame
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.renderqueue import RenderQueue
+from src.laser import Laser
+from src.plane import EnemyPlane, BossPlane
+from src.config import *
+
+def square(color, size=10):
+    """A solid test sprite"""
+    sprite = pygame.Surface((size, size))
+    sprite.fill(color)
+    return sprite
+
+class TestRenderQueue:
+    """Test collecting sprites and drawing them in layer order"""
+
+    def test_layers_draw_in_order(self):
+        """Higher layers end up on top whatever order they were queued in"""
+        screen = pygame.Surface((20, 20))
+        queue = RenderQueue()
+        queue.add(square(RED), (0, 0), LAYER_LASERS)
+        queue.add(square(GREEN), (0, 0), LAYER_CLOUDS)
+        queue.flush(screen)
+        assert screen.get_at((5, 5))[:3] == RED
+        assert len(queue) == 0
+
+    def test_same_layer_keeps_queue_order_per_sprite(self):
+        """Copies of one sprite on a layer keep the order they were queued in"""
+        queue = RenderQueue()
+        sprite = square(RED)
+        for x in range(3):
+            queue.add(sprite, (x, 0), LAYER_PLANES)
+        assert [entry[3] for entry in sorted(queue.entries, key=lambda e: e[:2])] == [(0, 0), (1, 0), (2, 0)]
+
+    def test_different_sprites_keep_queue_order(self):
+        """Overlapping sprites on a layer draw in the order first queued, not by address"""
+        screen = pygame.Surface((20, 20))
+        for first, second in ((RED, GREEN), (GREEN, RED)):
+            queue = RenderQueue()
+            queue.add(square(first), (0, 0), LAYER_CLOUDS)
+            queue.add(square(second), (0, 0), LAYER_CLOUDS)
+            queue.flush(screen)
+            assert screen.get_at((5, 5))[:3] == second
+
+class TestEntitySprites:
+    """Test that planes and lasers queue pre-rendered sprites"""
+
+    def test_lasers_share_sprites(self):
+        """Lasers that look the same use the same cached sprite"""
+        first = Laser(100, 100, -LASER_SPEED, LASER_COLOR)
+        second = Laser(300, 200, -LASER_SPEED, LASER_COLOR)
+        assert first.get_sprite()[0] is second.get_sprite()[0]
+        assert Laser(100, 100, ENEMY_LASER_SPEED, RED).get_sprite()[0] is not first.get_sprite()[0]
+
+    def test_laser_sprite_is_centered(self):
+        """A laser is drawn around its position, straight or angled"""
+        for vx in (0, 3):
+            laser = Laser(200, 150, 6, RED, damage=BOSS_LASER_DAMAGE, vx=vx)
+            queue = RenderQueue()
+            laser.enqueue(queue)
+            _, _, sprite, (x, y) = queue.entries[0]
+            assert abs(x + sprite.get_width() / 2 - 200) <= 1
+            assert abs(y + sprite.get_height() / 2 - 150) <= 1
+
+    def test_health_bars_queued_above_planes(self):
+        """A damaged enemy and any boss queue a health bar on its own layer"""
+        enemy = EnemyPlane(100, 100)
+        queue = RenderQueue()
+        enemy.enqueue(queue)
+        assert [entry[0] for entry in queue.entries] == [LAYER_PLANES]
+
+        enemy.take_damage()
+        queue = RenderQueue()
+        enemy.enqueue(queue)
+        BossPlane(300, 100).enqueue(queue)
+        assert sorted(entry[0] for entry in queue.entries) == [LAYER_PLANES, LAYER_PLANES,
+                                                               LAYER_HEALTH_BARS, LAYER_HEALTH_BARS]
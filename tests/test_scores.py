@@ -0,0 +1,72 @@
+"""
+Unit tests for the high score and session store
+"""
+
+import pytest
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from main import TejasThrust
+from src.scores import ScoreStore
+from src.config import *
+
+class TestScoreStore:
+    """Test recording sessions, leaderboards and profiles"""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        """Create a score store in a temporary folder"""
+        store = ScoreStore(str(tmp_path / "scores.db"))
+        yield store
+        store.close()
+
+    def test_wal_mode(self, store):
+        """Test that the database uses write-ahead logging"""
+        assert store.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_top_scores_sorted(self, store):
+        """Test that the leaderboard returns the best scores first"""
+        store.record_session("Asha", 12, kills=12)
+        store.record_session("Ravi", 30, kills=25, bosses=1)
+        store.record_session("Asha", 18, kills=18)
+        top = store.top_scores(limit=2)
+        assert [(name, score) for name, score, _ in top] == [("Ravi", 30), ("Asha", 18)]
+
+    def test_batched_sessions_update_profiles(self, store):
+        """Test that batched sessions update the player profile"""
+        store.record_sessions([("Asha", 10, 10, 0, 40, 60.0, 1.0),
+                               ("Asha", 25, 20, 1, 80, 90.0, 2.0)])
+        profile = store.profile("Asha")
+        assert profile["games_played"] == 2
+        assert profile["best_score"] == 25
+        assert profile["total_kills"] == 30
+        assert store.profile("Nobody") is None
+
+    def test_leaderboard_uses_index(self, store):
+        """Test that the top-N query is served from the score index"""
+        plan = store.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT score FROM sessions ORDER BY score DESC, ended_at LIMIT 5"
+        ).fetchall()
+        assert any("sessions_by_score" in row[-1] for row in plan)
+
+class TestGameScores:
+    """Test recording finished games"""
+
+    def test_only_play_mode_records(self):
+        """Test that test and simulated games leave the high score table alone"""
+        game = TejasThrust(headless=True)
+        assert not game.record_scores
+        game.telemetry.close()
+
+    def test_game_over_records_session(self, tmp_path):
+        """Test that a finished game is saved to the store it is given"""
+        game = TejasThrust(headless=True)
+        game.record_scores = True
+        game.scores_path = str(tmp_path / "scores.db")
+        game.score = 7
+        game._record_session()
+        assert [(name, score) for name, score, _ in game.leaderboard] == [(PLAYER_NAME, 7)]
+        game.telemetry.close()
@@ -0,0 +1,111 @@
+"""
+Unit tests for runtime settings, profiles and live reload
+"""
+
+import json
+import os
+import sys
+import pytest
+import pygame
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from main import TejasThrust
+from src.settings import DEFAULT_SETTINGS, SettingsWatcher, load_settings
+from src.plane import EnemyPlane
+from src.config import *
+
+PROFILES = {
+    "default_profile": "kiosk",
+    "profiles": {
+        "kiosk": {"enemy_spawn_interval": 1500},
+        "dev": {"enemy_speed": 3},
+        "stress": {"extends": "dev", "enemy_spawn_interval": 100},
+    },
+}
+
+class TestSettings:
+    """Test loading and applying settings"""
+
+    @pytest.fixture
+    def settings_file(self, tmp_path):
+        """Write a settings file with a few profiles"""
+        path = tmp_path / "settings.json"
+        path.write_text(json.dumps(PROFILES))
+        return str(path)
+
+    def test_defaults_match_config(self):
+        """Test that default settings come from src/config.py"""
+        assert DEFAULT_SETTINGS.enemy_speed == ENEMY_SPEED
+        assert DEFAULT_SETTINGS.enemy_spawn_interval == ENEMY_SPAWN_INTERVAL
+        assert DEFAULT_SETTINGS.fps == FPS
+
+    def test_profiles_and_extends(self, settings_file):
+        """Test default profile selection and profile inheritance"""
+        assert load_settings(settings_file).enemy_spawn_interval == 1500
+        stress = load_settings(settings_file, "stress")
+        assert stress.enemy_spawn_interval == 100
+        assert stress.enemy_speed == 3.0
+
+    def test_shipped_file_keeps_defaults(self):
+        """Test that the shipped settings file only changes play when a profile is chosen"""
+        path = os.path.join(os.path.dirname(__file__), '..', SETTINGS_PATH)
+        assert load_settings(path) == DEFAULT_SETTINGS
+        assert load_settings(path, "kiosk") != DEFAULT_SETTINGS
+
+    def test_bad_values_rejected(self, settings_file):
+        """Test that unknown profiles and settings are errors"""
+        with pytest.raises(ValueError):
+            load_settings(settings_file, "missing")
+        with pytest.raises(ValueError):
+            DEFAULT_SETTINGS.replace(enemy_sped=3)
+
+    @pytest.mark.parametrize("changes", [{"fps": 0}, {"fps": 0.5}, {"enemy_spawn_interval": -100},
+                                         {"enemy_shoot_chance": 7}, {"enemy_speed": float("nan")}])
+    def test_out_of_range_rejected(self, changes):
+        """Test that values the game can't play with are errors, not truncated"""
+        with pytest.raises(ValueError):
+            DEFAULT_SETTINGS.replace(**changes)
+
+    def test_bad_reload_keeps_old_settings(self, settings_file):
+        """Test that a reload with fps 0 is ignored and the game carries on"""
+        game = TejasThrust(headless=True, settings=load_settings(settings_file, "dev"))
+        watcher = SettingsWatcher(settings_file, "dev", interval=0)
+
+        changed = dict(PROFILES)
+        changed["profiles"] = dict(PROFILES["profiles"], dev={"fps": 0})
+        with open(settings_file, "w") as file:
+            json.dump(changed, file)
+        os.utime(settings_file, ns=(0, 1))
+
+        new_settings = watcher.poll()
+        if new_settings:
+            game.apply_settings(new_settings)
+        assert new_settings is None
+        assert game.settings.fps == FPS
+        pygame.quit()
+
+    def test_per_instance_settings(self):
+        """Test that planes of the same class can be tuned individually"""
+        fast = EnemyPlane(100, 100, DEFAULT_SETTINGS.replace(enemy_speed=4))
+        normal = EnemyPlane(100, 100)
+        assert fast.speed == 4
+        assert normal.speed == ENEMY_SPEED
+
+    def test_live_reload_updates_game(self, settings_file):
+        """Test that a changed settings file is applied to a running game"""
+        game = TejasThrust(headless=True, settings=load_settings(settings_file, "dev"))
+        game.enemies.append(EnemyPlane(100, 100, game.settings))
+        watcher = SettingsWatcher(settings_file, "dev", interval=0)
+
+        changed = dict(PROFILES)
+        changed["profiles"] = dict(PROFILES["profiles"], dev={"enemy_speed": 1})
+        with open(settings_file, "w") as file:
+            json.dump(changed, file)
+        os.utime(settings_file, ns=(0, 1))
+
+        game.apply_settings(watcher.poll())
+        assert game.enemies[0].speed == 1
+        assert watcher.poll() is None  # unchanged since the last poll
+        pygame.quit()
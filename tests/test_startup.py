@@ -0,0 +1,76 @@
+"""
+Unit tests for per-mode pygame initialization and start-up time
+"""
+
+import os
+import sys
+import pytest
+import pygame
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from main import TejasThrust
+from src.startup import MODES, init_pygame, init_times, measure_cold_start
+from src.config import *
+
+class TestStartup:
+    """Test starting only the subsystems a mode needs"""
+
+    def setup_method(self):
+        """Start every test with pygame stopped"""
+        pygame.quit()
+
+    def teardown_method(self):
+        """Stop pygame again"""
+        pygame.quit()
+
+    def test_headless_starts_fonts_only(self):
+        """Test that headless mode needs no window or audio"""
+        init_pygame("headless")
+        assert pygame.font.get_init()
+        assert not pygame.display.get_init()
+        assert not pygame.mixer.get_init()
+        assert "font" in init_times
+
+    def test_test_mode_has_no_audio(self):
+        """Test that test games get a window but no audio or score recording"""
+        game = TejasThrust(mode="test")
+        assert pygame.display.get_init()
+        assert not pygame.mixer.get_init()
+        assert not game.headless
+        assert not game.record_scores
+        assert game.ticks() >= 0
+
+    def test_headless_game(self):
+        """Test that headless games run without a display"""
+        game = TejasThrust(mode="benchmark")
+        assert game.headless
+        assert not pygame.display.get_init()
+        game.update({pygame.K_LEFT: False, pygame.K_RIGHT: False, pygame.K_UP: False, pygame.K_DOWN: False})
+        assert game.sim_time > 0
+
+    def test_init_is_idempotent(self):
+        """Test that starting a mode twice is harmless"""
+        assert init_pygame("test") == MODES["test"]
+        init_pygame("test")
+        assert pygame.display.get_init()
+
+    def test_unknown_mode(self):
+        """Test that a typo in the mode is reported"""
+        with pytest.raises(ValueError):
+            init_pygame("fast")
+
+    def test_cold_start_measured(self):
+        """Test that a cold start reports its import and init times"""
+        times = measure_cold_start("headless")
+        assert times["import_ms"] > 0
+        assert times["total_ms"] >= times["init_ms"]
+
+    # Wall-clock timing depends on the machine, so the budget is only
+    # checked on request, as `python main.py --startup-report` does
+    @pytest.mark.skipif(not os.environ.get("CHECK_STARTUP_BUDGET"), reason="set CHECK_STARTUP_BUDGET=1")
+    def test_import_budget(self):
+        """Test that importing the game from cold stays within budget"""
+        times = measure_cold_start("headless")
+        assert times["import_ms"] < STARTUP_IMPORT_BUDGET_MS
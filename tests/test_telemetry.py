@@ -0,0 +1,54 @@
+"""
+Unit tests for the telemetry event stream
+"""
+
+import glob
+import json
+import pytest
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.telemetry import Telemetry
+
+class TestTelemetry:
+    """Test telemetry queuing, writing and rotation"""
+
+    def _read_events(self, directory):
+        events = []
+        for path in sorted(glob.glob(os.path.join(directory, "*.jsonl"))):
+            with open(path) as file:
+                events.extend(json.loads(line) for line in file)
+        return events
+
+    def test_events_written_on_close(self, tmp_path):
+        """Test that queued events end up in the JSONL file"""
+        telemetry = Telemetry(str(tmp_path), flush_interval=60)
+        telemetry.emit("spawn", kind="enemy", x=10, y=-50)
+        telemetry.emit("kill", kind="enemy", score=1)
+        telemetry.close()
+
+        events = self._read_events(str(tmp_path))
+        assert [event["event"] for event in events] == ["spawn", "kill", "telemetry_stats"]
+        assert events[0]["kind"] == "enemy"
+        assert events[0]["session"] == telemetry.session_id
+
+    def test_full_queue_drops_and_counts(self, tmp_path):
+        """Test that a full queue drops events instead of blocking"""
+        telemetry = Telemetry(str(tmp_path), max_queue=5, flush_interval=60)
+        for i in range(8):
+            telemetry.emit("shot", i=i)
+        assert telemetry.dropped == 3
+        telemetry.close()
+        assert self._read_events(str(tmp_path))[-1]["dropped"] == 3
+
+    def test_files_rotate(self, tmp_path):
+        """Test that files rotate at the size limit and old files are removed"""
+        telemetry = Telemetry(str(tmp_path), flush_interval=60, max_file_bytes=1, max_files=2)
+        for i in range(4):
+            telemetry.emit("frame_time", ms=16)
+            telemetry._flush()
+        telemetry.close()
+        assert len(glob.glob(os.path.join(str(tmp_path), "*.jsonl"))) == 2
@@ -0,0 +1,79 @@
+"""
+Unit tests for the letterboxed viewport
+"""
+
+import os
+import sys
+import pytest
+import pygame
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from main import parse_args
+from src.viewport import Viewport
+from src.config import *
+
+class TestViewport:
+    """Test scaling the game canvas into windows of other sizes"""
+
+    def test_native_size_is_direct(self):
+        """A window of the game's own size is drawn into directly"""
+        viewport = Viewport((SCREEN_WIDTH, SCREEN_HEIGHT))
+        assert viewport.direct
+        assert viewport.scale == 1
+        assert viewport.rect == pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+
+    def test_wide_window_is_pillarboxed(self):
+        """A window wider than the game's aspect ratio gets bars left and right"""
+        viewport = Viewport((3840, 2160))
+        assert not viewport.direct
+        assert viewport.rect.height == 2160
+        assert viewport.rect.width == round(SCREEN_WIDTH * 2160 / SCREEN_HEIGHT)
+        assert viewport.rect.centerx == 1920
+
+    def test_tall_window_is_letterboxed(self):
+        """A window taller than the game's aspect ratio gets bars above and below"""
+        viewport = Viewport((SCREEN_WIDTH, SCREEN_HEIGHT * 2))
+        assert viewport.rect.width == SCREEN_WIDTH
+        assert viewport.rect.top == SCREEN_HEIGHT // 2
+
+    def test_to_virtual_maps_mouse_positions(self):
+        """Window positions map back to game coordinates"""
+        viewport = Viewport((SCREEN_WIDTH * 2, SCREEN_HEIGHT * 2))
+        assert viewport.to_virtual((0, 0)) == (0, 0)
+        assert viewport.to_virtual((SCREEN_WIDTH, SCREEN_HEIGHT)) == (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+
+        viewport.resize((SCREEN_WIDTH * 2, SCREEN_HEIGHT))  # pillarboxed at scale 1
+        assert viewport.to_virtual((viewport.rect.x + 10, 20)) == (10, 20)
+
+    def test_minimised_window(self):
+        """A 0x0 window neither divides by zero nor fails to present"""
+        viewport = Viewport((0, 0))
+        assert viewport.scale > 0
+        viewport.to_virtual((0, 0))
+        canvas = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        viewport.present(canvas, pygame.Surface((0, 0)))
+        viewport.present(canvas, pygame.Surface((0, 0)), (3, 3))
+
+    @pytest.mark.parametrize("size", [(3840, 2160), (1366, 768), (333, 777), (SCREEN_WIDTH * 2, SCREEN_HEIGHT * 2)])
+    def test_present_fills_letterbox(self, size):
+        """The canvas lands inside the letterbox rect and the bars stay black"""
+        viewport = Viewport(size)
+        window = pygame.Surface(size)
+        window.fill(RED)
+        canvas = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        canvas.fill(WHITE)
+
+        viewport.present(canvas, window)
+
+        # smoothscale may round white down by a few levels
+        assert min(window.get_at(viewport.rect.center)[:3]) > 240
+        assert window.get_at((0, 0))[:3] != RED
+        assert window.get_at((size[0] - 1, size[1] - 1))[:3] != RED
+
+    def test_window_argument(self):
+        """--window parses WIDTHxHEIGHT"""
+        assert parse_args(["--window", "1920x1080"]).window == (1920, 1080)
+        with pytest.raises(SystemExit):
+            parse_args(["--window", "big"])
@@ -0,0 +1,42 @@
+"""
+Unit tests for the memory and object-count watchdog
+"""
+
+import pytest
+import pygame
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.watchdog import MemoryWatchdog
+from src.laser import Laser
+from src.config import *
+
+class TestMemoryWatchdog:
+    """Test sampling, growth detection and heap summaries"""
+
+    def test_counts_untracked_surfaces(self):
+        """Test that Surfaces are counted even though gc does not track them"""
+        watchdog = MemoryWatchdog()
+        before = watchdog.sample()["Surface"]
+        surfaces = [pygame.Surface((4, 4)) for _ in range(25)]
+        assert watchdog.sample()["Surface"] >= before + 25
+
+    def test_detects_steady_growth(self):
+        """Test that a list that only grows is reported"""
+        watchdog = MemoryWatchdog(window=4)
+        leaked = []
+        for _ in range(4):
+            leaked.extend(Laser(0, 0, 1, RED) for _ in range(WATCHDOG_COUNT_GROWTH))
+            watchdog.check()
+        assert "Laser" in [name for name, _, _ in watchdog.growing]
+
+    def test_heap_summary(self, tmp_path):
+        """Test writing a heap summary on demand"""
+        path = MemoryWatchdog().write_heap_summary(str(tmp_path / "heap.txt"))
+        with open(path) as file:
+            text = file.read()
+        assert text.startswith("rss_mb")
+        assert "dict" in text
@@ -0,0 +1,84 @@
+"""
+Unit tests for the browser build: web mode, streamed assets and the async loop
+"""
+
+import asyncio
+import os
+import sys
+import pytest
+import pygame
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from main import TejasThrust, parse_args
+from src.web import AssetStreamer
+from src.config import *
+
+class TestAssetStreamer:
+    """Test loading assets between frames"""
+
+    def test_one_step_per_frame_after_delay(self):
+        """Nothing loads before the first frames, then one step per frame"""
+        loaded = []
+        streamer = AssetStreamer([lambda: loaded.append("music"), lambda: loaded.append("fonts")], delay=1)
+        streamer.frame()
+        assert loaded == []
+        streamer.frame()
+        assert loaded == ["music"]
+        streamer.frame()
+        assert loaded == ["music", "fonts"]
+        assert streamer.done
+        streamer.frame()
+
+    def test_failed_step_is_skipped(self):
+        """A missing asset is logged and the game carries on"""
+        def missing():
+            raise pygame.error("file not found")
+        loaded = []
+        streamer = AssetStreamer([missing, lambda: loaded.append("fonts")], delay=0)
+        streamer.frame()
+        streamer.frame()
+        assert loaded == ["fonts"]
+
+class TestWebMode:
+    """Test the browser build's game setup and loop"""
+
+    @pytest.fixture
+    def game(self):
+        """Create a web mode game"""
+        game = TejasThrust(mode="web")
+        yield game
+        game.telemetry.close()
+
+    def test_cheaper_rendering(self, game):
+        """The web mode draws fewer particles, scales plainly and has no render thread"""
+        assert game.particles.capacity == WEB_PARTICLE_CAPACITY
+        assert not game.viewport.smooth
+        assert not TejasThrust(mode="web", threaded_render=True).threaded_render
+
+    def test_fonts_streamed(self, game):
+        """The UI starts with the default font and switches once fonts are loaded"""
+        assert not game.system_fonts
+        game.load_fonts()
+        assert game.system_fonts
+
+    def test_async_loop_yields(self, game):
+        """The loop hands control back every frame, so other tasks keep running"""
+        ticks = []
+
+        async def other_task():
+            while game.running:
+                ticks.append(game.frame_count)
+                await asyncio.sleep(0)
+
+        async def play():
+            await asyncio.gather(game.run_async(duration=0.2), other_task())
+
+        asyncio.run(play())
+        assert len(ticks) > 1
+        assert ticks[-1] > ticks[0]
+
+    def test_command_line(self):
+        """The web mode can be played in a desktop window"""
+        assert parse_args(["--web"]).web
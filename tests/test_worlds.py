@@ -0,0 +1,91 @@
+"""
+Unit tests for running many headless worlds across worker processes
+"""
+
+import numpy as np
+import pytest
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.worlds import WorldManager, AutopilotPolicy
+from src.env import ACTIONS, OBSERVATION_SIZE
+from src.config import *
+
+class TestWorldManager:
+    """Test sharding worlds over workers with shared buffers"""
+
+    @pytest.fixture
+    def worlds(self):
+        """Create four worlds on two workers"""
+        worlds = WorldManager(4, num_workers=2, max_steps=5)
+        yield worlds
+        worlds.close()
+
+    def test_shards_cover_every_world(self, worlds):
+        """Test that each world belongs to exactly one worker"""
+        assert worlds.shards == [(0, 2), (2, 4)]
+
+    def test_lock_step(self, worlds):
+        """Test that step advances every world once and fills the shared buffers"""
+        obs = worlds.reset(seed=0)
+        assert obs.shape == (4, OBSERVATION_SIZE)
+        assert np.all(obs[:, 2] == 1.0)  # full health
+
+        for _ in range(5):
+            obs, rewards, terminated, truncated, infos = worlds.step([0, 1, 2, len(ACTIONS) - 1])
+        assert list(worlds.steps) == [5, 5, 5, 5]
+        assert truncated.all()
+        assert len(infos) == 4
+        assert worlds.stats()["frames"] == 20
+
+    def test_final_observation(self, worlds):
+        """Test that a world reset on finishing reports its last observation"""
+        worlds.reset(seed=0)
+        for _ in range(5):
+            _, _, _, truncated, infos = worlds.step([0] * 4)
+        assert truncated.all()
+        for info in infos:
+            assert info["final_observation"].shape == (OBSERVATION_SIZE,)
+
+    def test_worlds_are_independent(self):
+        """Test that a world plays the same game whatever shares its worker"""
+        runs = []
+        for num_worlds in (1, 3):
+            worlds = WorldManager(num_worlds, num_workers=1)
+            worlds.reset(seed=7)
+            for step in range(300):
+                obs = worlds.step([step % len(ACTIONS)] * num_worlds)[0]
+            runs.append(obs[0].copy())
+            worlds.close()
+        assert np.array_equal(runs[0], runs[1])
+
+    def test_free_running(self, worlds):
+        """Test that free-running worlds advance on their own until stopped"""
+        worlds.reset(seed=0)
+        stats = worlds.run_for(0.5)
+        assert stats["steps"] > 0
+        assert stats["frames_per_sec"] > 0
+        assert np.all(worlds.steps > 0)
+
+        # Lock-step works again once stopped
+        steps = worlds.steps.copy()
+        worlds.step([0] * 4)
+        assert np.array_equal(worlds.steps, steps + 1)
+
+    def test_step_while_running_fails(self, worlds):
+        """Test that lock-step and free-running modes don't mix"""
+        worlds.reset()
+        worlds.start()
+        with pytest.raises(RuntimeError):
+            worlds.step([0] * 4)
+        worlds.stop()
+
+    def test_autopilot_policy(self):
+        """Test free-running worlds flown by the autopilot"""
+        worlds = WorldManager(2, num_workers=1, policy=AutopilotPolicy)
+        worlds.reset(seed=1)
+        assert worlds.run_for(0.3)["steps"] > 0
+        worlds.close()